@@ -1,6 +1,11 @@
 import os
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import UTC, datetime, timedelta
-from typing import cast
+from threading import BoundedSemaphore, Lock
+from typing import Callable, TypeVar, cast
 
 from jose import JWTError, jwt
 import bcrypt
@@ -13,19 +18,154 @@ SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7일
 
+# bcrypt는 GIL을 놓으므로 스레드 풀로 충분하다.
+# 대기 한도는 Starlette 스레드 풀(40)보다 작게 잡아 목록 API 스레드를 남겨 둔다.
+PASSWORD_HASH_WORKERS = int(
+    os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "16"))
+PASSWORD_HASH_TIMEOUT_SECONDS = float(os.getenv("PASSWORD_HASH_TIMEOUT_SECONDS", "5"))
+PASSWORD_HASH_STATS_WINDOW_SIZE = 512
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """비밀번호 검증"""
+T = TypeVar("T")
+
+
+class PasswordHasherBusy(Exception):
+    """비밀번호 해시 작업 대기열이 가득 찼거나 제한 시간 안에 끝나지 않음"""
+
+
+class PasswordHashPool:
+    """크기와 대기열 길이가 제한된 비밀번호 해시 전용 워커 풀
+
+    실행 중 + 대기 중 작업이 max_pending에 닿으면 기다리지 않고 바로 거절한다.
+    """
+
+    def __init__(self, workers: int, max_pending: int, timeout: float) -> None:
+        self.workers: int = workers
+        self.max_pending: int = max_pending
+        self.timeout: float = timeout
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock: Lock = Lock()
+        self._slots: BoundedSemaphore = BoundedSemaphore(max_pending)
+        self._stats_lock: Lock = Lock()
+        self._queue_wait_ms: deque[float] = deque(
+            maxlen=PASSWORD_HASH_STATS_WINDOW_SIZE
+        )
+        self._hash_ms: deque[float] = deque(maxlen=PASSWORD_HASH_STATS_WINDOW_SIZE)
+        self._pending: int = 0
+        self._completed_total: int = 0
+        self._rejected_total: int = 0
+        self._timeout_total: int = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hash"
+                )
+            return self._executor
+
+    def _release(self, _future: Future[T]) -> None:
+        with self._stats_lock:
+            self._pending -= 1
+        self._slots.release()
+
+    def run(self, func: Callable[..., T], *args: object) -> T:
+        if not self._slots.acquire(blocking=False):
+            with self._stats_lock:
+                self._rejected_total += 1
+            raise PasswordHasherBusy("password hash queue is full")
+        with self._stats_lock:
+            self._pending += 1
+        submitted_at = time.perf_counter()
+
+        def _task() -> T:
+            started_at = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                finished_at = time.perf_counter()
+                with self._stats_lock:
+                    self._queue_wait_ms.append((started_at - submitted_at) * 1000)
+                    self._hash_ms.append((finished_at - started_at) * 1000)
+                    self._completed_total += 1
+
+        try:
+            future = self._get_executor().submit(_task)
+        except RuntimeError as error:
+            self._release(Future())
+            raise PasswordHasherBusy("password hash pool is shut down") from error
+        # 슬롯은 작업이 실제로 끝날 때 반환한다 (시간 초과로 먼저 돌아가도 유지)
+        future.add_done_callback(self._release)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError as error:
+            with self._stats_lock:
+                self._timeout_total += 1
+            raise PasswordHasherBusy(
+                f"password hash timeout after {self.timeout:.1f}s"
+            ) from error
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, object]:
+        with self._stats_lock:
+            queue_waits = sorted(self._queue_wait_ms)
+            hash_times = sorted(self._hash_ms)
+            snapshot: dict[str, object] = {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "completed_total": self._completed_total,
+                "rejected_total": self._rejected_total,
+                "timeout_total": self._timeout_total,
+            }
+
+        def _percentile(values: list[float], ratio: float) -> float:
+            if not values:
+                return 0.0
+            index = min(round((len(values) - 1) * ratio), len(values) - 1)
+            return round(values[index], 2)
+
+        snapshot["queue_wait_ms_p50"] = _percentile(queue_waits, 0.5)
+        snapshot["queue_wait_ms_p95"] = _percentile(queue_waits, 0.95)
+        snapshot["hash_ms_p50"] = _percentile(hash_times, 0.5)
+        snapshot["hash_ms_p95"] = _percentile(hash_times, 0.95)
+        return snapshot
+
+
+password_hash_pool = PasswordHashPool(
+    workers=PASSWORD_HASH_WORKERS,
+    max_pending=PASSWORD_HASH_MAX_PENDING,
+    timeout=PASSWORD_HASH_TIMEOUT_SECONDS,
+)
+
+
+def _checkpw(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(
         plain_password.encode("utf-8"), hashed_password.encode("utf-8")
     )
 
 
-def get_password_hash(password: str) -> str:
-    """비밀번호 해시화"""
+def _hashpw(password: str) -> str:
     return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
 
 
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (해시 워커 풀에서 실행)"""
+    return password_hash_pool.run(_checkpw, plain_password, hashed_password)
+
+
+def get_password_hash(password: str) -> str:
+    """비밀번호 해시화 (해시 워커 풀에서 실행)"""
+    return password_hash_pool.run(_hashpw, password)
+
+
 def create_access_token(
     data: dict[str, object], expires_delta: timedelta | None = None
 ) -> str:
@@ -0,0 +1,191 @@
+# pyright: reportDeprecated=false
+
+import asyncio
+import json
+import random
+import uuid
+from threading import Lock
+from typing import Callable, Optional, cast
+
+from psycopg import AsyncConnection, sql
+
+CACHE_BUS_CHANNEL = "cache_invalidation"
+CACHE_BUS_RECONNECT_MAX_SECONDS = 30.0
+# NOTIFY payload 한도(8000바이트)보다 작게 - 넘으면 전체 비우기로 대신한다
+CACHE_BUS_MAX_PAYLOAD_BYTES = 7000
+
+
+class CacheInvalidationBus:
+    """LISTEN/NOTIFY로 워커 간 캐시 무효화 메시지를 주고받는 버스
+
+    메시지: {"o": 보낸 워커, "s": 워커별 순번, "k": 종류, ...대상 필드}
+    - 자기가 보낸 메시지는 이미 로컬에 반영했으므로 무시한다.
+    - 순번이 건너뛰면(놓친 메시지) 전체 비우기를 한다.
+    - LISTEN 연결이 끊겼다가 다시 붙으면 그 사이 메시지를 알 수 없으므로 전체 비우기를 한다.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        apply: Callable[[dict[str, object]], None],
+        flush_all: Callable[[], None],
+        channel: str = CACHE_BUS_CHANNEL,
+    ) -> None:
+        self.dsn: str = dsn
+        self.channel: str = channel
+        self.origin: str = uuid.uuid4().hex[:12]
+        self._apply: Callable[[dict[str, object]], None] = apply
+        self._flush_all: Callable[[], None] = flush_all
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._outbox: Optional[asyncio.Queue[str]] = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._seq_lock: Lock = Lock()
+        self._seq: int = 0
+        self._last_seq: dict[str, int] = {}
+        self._listening: bool = False
+        self._published_total: int = 0
+        self._received_total: int = 0
+        self._gap_flush_total: int = 0
+        self._reconnect_total: int = 0
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._outbox = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self._listen_loop()),
+            asyncio.create_task(self._publish_loop()),
+        ]
+
+    async def stop(self) -> None:
+        tasks = self._tasks
+        self._tasks = []
+        self._loop = None
+        for task in tasks:
+            _ = task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._listening = False
+
+    def publish(self, kind: str, **fields: object) -> None:
+        """로컬 캐시를 고친 뒤 다른 워커에 알림 (어느 스레드에서나 호출 가능)"""
+        loop = self._loop
+        outbox = self._outbox
+        if loop is None or outbox is None:
+            return
+        # 순번 부여와 큐 적재를 한 잠금 안에서 해야 순번 순서대로 보내진다
+        with self._seq_lock:
+            self._seq += 1
+            seq = self._seq
+            payload = json.dumps(
+                {"o": self.origin, "s": seq, "k": kind, **fields},
+                separators=(",", ":"),
+                ensure_ascii=False,
+                default=str,
+            )
+            if len(payload.encode("utf-8")) > CACHE_BUS_MAX_PAYLOAD_BYTES:
+                payload = json.dumps(
+                    {"o": self.origin, "s": seq, "k": "flush"}, separators=(",", ":")
+                )
+            try:
+                loop.call_soon_threadsafe(outbox.put_nowait, payload)
+            except RuntimeError:
+                # 종료 중인 루프 - 다른 워커는 순번 차이로 놓친 것을 알아챈다
+                pass
+
+    def handle(self, payload: str) -> None:
+        try:
+            message = cast(object, json.loads(payload))
+        except ValueError:
+            return
+        if not isinstance(message, dict):
+            return
+        message = cast(dict[str, object], message)
+        origin = message.get("o")
+        seq = message.get("s")
+        if not isinstance(origin, str) or not isinstance(seq, int):
+            return
+        if origin == self.origin:
+            return
+
+        self._received_total += 1
+        last_seq = self._last_seq.get(origin)
+        self._last_seq[origin] = seq
+        if message.get("k") == "flush" or (
+            last_seq is not None and seq != last_seq + 1
+        ):
+            if message.get("k") != "flush":
+                self._gap_flush_total += 1
+            self._flush_all()
+            return
+        self._apply(message)
+
+    async def _listen_loop(self) -> None:
+        backoff = 1.0
+        connected_before = False
+        while True:
+            try:
+                async with await AsyncConnection.connect(
+                    self.dsn, autocommit=True
+                ) as conn:
+                    _ = await conn.execute(
+                        sql.SQL("LISTEN {}").format(sql.Identifier(self.channel))
+                    )
+                    self._listening = True
+                    if connected_before:
+                        self._reconnect_total += 1
+                        self._flush_all()
+                    connected_before = True
+                    backoff = 1.0
+                    async for notify in conn.notifies():
+                        try:
+                            self.handle(notify.payload)
+                        except Exception as error:
+                            print(f"[cache-bus] apply error: {error}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                print(f"[cache-bus] listener disconnected: {error}")
+            self._listening = False
+            await asyncio.sleep(backoff + random.uniform(0, backoff))
+            backoff = min(backoff * 2, CACHE_BUS_RECONNECT_MAX_SECONDS)
+
+    async def _publish_loop(self) -> None:
+        assert self._outbox is not None
+        outbox = self._outbox
+        backoff = 1.0
+        while True:
+            payload = await outbox.get()
+            try:
+                async with await AsyncConnection.connect(
+                    self.dsn, autocommit=True
+                ) as conn:
+                    backoff = 1.0
+                    while True:
+                        _ = await conn.execute(
+                            "SELECT pg_notify(%s, %s)", (self.channel, payload)
+                        )
+                        self._published_total += 1
+                        payload = await outbox.get()
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                # 보내지 못한 메시지는 버린다 - 받는 쪽이 순번 차이로 전체 비우기를 한다
+                print(f"[cache-bus] publish failed: {error}")
+                await asyncio.sleep(backoff + random.uniform(0, backoff))
+                backoff = min(backoff * 2, CACHE_BUS_RECONNECT_MAX_SECONDS)
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "origin": self.origin,
+            "listening": self._listening,
+            "pending": self._outbox.qsize() if self._outbox is not None else 0,
+            "published_total": self._published_total,
+            "received_total": self._received_total,
+            "gap_flush_total": self._gap_flush_total,
+            "reconnect_total": self._reconnect_total,
+        }
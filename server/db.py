@@ -2,12 +2,17 @@
 
 import os
 import hashlib
-from psycopg2.extras import Json, RealDictCursor
-from psycopg2.pool import SimpleConnectionPool
+import time
+from collections import deque
+from datetime import datetime
+from psycopg2 import errors, sql
+from psycopg2.extensions import connection as PgConnection
+from psycopg2.extras import Json, RealDictCursor, RealDictRow, execute_values
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 from contextlib import contextmanager
-from typing import Mapping, Optional
+from typing import Generator, Iterable, Mapping, Optional
 from dotenv import load_dotenv
-from threading import Lock
+from threading import BoundedSemaphore, Lock
 
 # .env 파일 로드
 _ = load_dotenv(".env")
@@ -15,317 +20,154 @@ _ = load_dotenv(".env")
 DATABASE_URL = os.getenv("DATABASE_URL")
 DB_POOL_MIN_CONN = int(os.getenv("DB_POOL_MIN_CONN", "1"))
 DB_POOL_MAX_CONN = int(os.getenv("DB_POOL_MAX_CONN", "12"))
-
-_db_pool: SimpleConnectionPool | None = None
-_db_pool_lock = Lock()
+DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "10"))
+DB_POOL_WAIT_WINDOW_SIZE = 500
 
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL is not set. Please check server/.env file")
 
 
-@contextmanager
-def get_db_connection():
-    """데이터베이스 연결 컨텍스트 매니저"""
+class DatabasePoolTimeout(PoolError):
+    """커넥션 풀에서 제한 시간 안에 연결을 얻지 못함"""
+
+
+class BlockingConnectionPool:
+    """가득 차면 PoolError 대신 timeout까지 대기하는 스레드 안전 커넥션 풀"""
+
+    def __init__(
+        self, minconn: int, maxconn: int, timeout: float, **kwargs: object
+    ) -> None:
+        self.maxconn: int = maxconn
+        self.timeout: float = timeout
+        self._pool: ThreadedConnectionPool = ThreadedConnectionPool(
+            minconn, maxconn, **kwargs
+        )
+        self._slots: BoundedSemaphore = BoundedSemaphore(maxconn)
+        self._stats_lock: Lock = Lock()
+        self._wait_ms: deque[float] = deque(maxlen=DB_POOL_WAIT_WINDOW_SIZE)
+        self._in_use: int = 0
+        self._waiting: int = 0
+        self._checkout_total: int = 0
+        self._waited_total: int = 0
+        self._timeout_total: int = 0
+
+    def getconn(self, timeout: Optional[float] = None) -> PgConnection:
+        wait_timeout = self.timeout if timeout is None else timeout
+        started_at = time.perf_counter()
+        acquired = self._slots.acquire(blocking=False)
+        if not acquired:
+            with self._stats_lock:
+                self._waiting += 1
+            try:
+                acquired = self._slots.acquire(timeout=wait_timeout)
+            finally:
+                with self._stats_lock:
+                    self._waiting -= 1
+        wait_ms = (time.perf_counter() - started_at) * 1000
+
+        if not acquired:
+            with self._stats_lock:
+                self._timeout_total += 1
+            raise DatabasePoolTimeout(
+                f"connection pool timeout after {wait_timeout:.1f}s"
+            )
+
+        try:
+            conn = self._pool.getconn()
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._stats_lock:
+            self._in_use += 1
+            self._checkout_total += 1
+            if wait_ms >= 1:
+                self._waited_total += 1
+            self._wait_ms.append(wait_ms)
+        return conn
+
+    def putconn(self, conn: PgConnection) -> None:
+        try:
+            # 끊어진 연결은 풀에 되돌리지 않고 닫는다
+            self._pool.putconn(conn, close=bool(conn.closed))
+        finally:
+            with self._stats_lock:
+                self._in_use -= 1
+            self._slots.release()
+
+    def closeall(self) -> None:
+        self._pool.closeall()
+
+    def stats(self) -> dict[str, object]:
+        with self._stats_lock:
+            waits = sorted(self._wait_ms)
+            snapshot: dict[str, object] = {
+                "max_connections": self.maxconn,
+                "timeout_seconds": self.timeout,
+                "in_use": self._in_use,
+                "waiting": self._waiting,
+                "checkout_total": self._checkout_total,
+                "waited_total": self._waited_total,
+                "timeout_total": self._timeout_total,
+            }
+
+        def _percentile(ratio: float) -> float:
+            if not waits:
+                return 0.0
+            return round(waits[min(round((len(waits) - 1) * ratio), len(waits) - 1)], 2)
+
+        snapshot["wait_ms_p50"] = _percentile(0.5)
+        snapshot["wait_ms_p95"] = _percentile(0.95)
+        snapshot["wait_ms_max"] = round(waits[-1], 2) if waits else 0.0
+        return snapshot
+
+
+_db_pool: BlockingConnectionPool | None = None
+_db_pool_lock = Lock()
+
+
+def _get_db_pool() -> BlockingConnectionPool:
     global _db_pool
 
     if _db_pool is None:
         with _db_pool_lock:
             if _db_pool is None:
-                _db_pool = SimpleConnectionPool(
+                _db_pool = BlockingConnectionPool(
                     minconn=DB_POOL_MIN_CONN,
                     maxconn=DB_POOL_MAX_CONN,
+                    timeout=DB_POOL_TIMEOUT_SECONDS,
                     dsn=DATABASE_URL,
                 )
+    return _db_pool
+
 
-    conn = _db_pool.getconn()
+@contextmanager
+def get_db_connection():
+    """데이터베이스 연결 컨텍스트 매니저"""
+    pool = _get_db_pool()
+    conn = pool.getconn()
     try:
         yield conn
     finally:
-        _db_pool.putconn(conn)
-
-
-def init_db():
-    """테이블 초기화 (처음 한 번만 실행)"""
-    with get_db_connection() as conn:
-        with conn.cursor() as cur:
-            # Users 테이블
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS users (
-                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                    email VARCHAR(255) UNIQUE,
-                    nickname VARCHAR(100) UNIQUE NOT NULL,
-                    bio TEXT,
-                    avatar_url VARCHAR(500),
-                    role VARCHAR(20) DEFAULT 'user',
-                    status VARCHAR(20) DEFAULT 'active',
-                    provider VARCHAR(20) DEFAULT 'local',
-                    provider_user_id VARCHAR(255),
-                    email_verified BOOLEAN DEFAULT FALSE,
-                    suspended_reason TEXT,
-                    suspended_at TIMESTAMP,
-                    suspended_by UUID REFERENCES users(id),
-                    delete_scheduled_at TIMESTAMP,
-                    deleted_at TIMESTAMP,
-                    deleted_by UUID REFERENCES users(id),
-                    token_version INTEGER DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT NOW(),
-                    updated_at TIMESTAMP DEFAULT NOW()
-                )
-            """)
-
-            # Projects 테이블
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS projects (
-                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                    author_id UUID REFERENCES users(id),
-                    title VARCHAR(255) NOT NULL,
-                    summary VARCHAR(500) NOT NULL,
-                    description TEXT,
-                    thumbnail_url VARCHAR(500),
-                    demo_url VARCHAR(500),
-                    repo_url VARCHAR(500),
-                    platform VARCHAR(50) DEFAULT 'web',
-                    status VARCHAR(20) DEFAULT 'published',
-                    like_count INTEGER DEFAULT 0,
-                    comment_count INTEGER DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT NOW(),
-                    updated_at TIMESTAMP DEFAULT NOW()
-                )
-            """)
-
-            # Comments 테이블
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS comments (
-                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                    project_id UUID REFERENCES projects(id) ON DELETE CASCADE,
-                    author_id UUID REFERENCES users(id),
-                    parent_id UUID REFERENCES comments(id),
-                    content TEXT NOT NULL,
-                    status VARCHAR(20) DEFAULT 'visible',
-                    like_count INTEGER DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT NOW(),
-                    updated_at TIMESTAMP DEFAULT NOW()
-                )
-            """)
-
-            # Reports 테이블
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS reports (
-                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                    target_type VARCHAR(20) NOT NULL,
-                    target_id UUID NOT NULL,
-                    reporter_id UUID REFERENCES users(id),
-                    reason VARCHAR(50) NOT NULL,
-                    memo TEXT,
-                    status VARCHAR(20) DEFAULT 'open',
-                    created_at TIMESTAMP DEFAULT NOW(),
-                    resolved_at TIMESTAMP
-                )
-            """)
-
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS admin_action_logs (
-                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                    admin_id UUID REFERENCES users(id),
-                    action_type VARCHAR(50) NOT NULL,
-                    target_type VARCHAR(20) NOT NULL,
-                    target_id UUID NOT NULL,
-                    reason TEXT,
-                    created_at TIMESTAMP DEFAULT NOW()
-                )
-            """)
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS moderation_settings (
-                    id INTEGER PRIMARY KEY CHECK (id = 1),
-                    blocked_keywords TEXT[] DEFAULT '{}',
-                    auto_hide_report_threshold INTEGER DEFAULT 3,
-                    home_filter_tabs JSONB DEFAULT '[]'::jsonb,
-                    explore_filter_tabs JSONB DEFAULT '[]'::jsonb,
-                    admin_log_retention_days INTEGER DEFAULT 365,
-                    admin_log_view_window_days INTEGER DEFAULT 30,
-                    admin_log_mask_reasons BOOLEAN DEFAULT TRUE,
-                    updated_at TIMESTAMP DEFAULT NOW()
-                )
-            """)
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS site_contents (
-                    content_key VARCHAR(100) PRIMARY KEY,
-                    content_json JSONB NOT NULL,
-                    updated_at TIMESTAMP DEFAULT NOW()
-                )
-            """)
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS oauth_runtime_settings (
-                    id INTEGER PRIMARY KEY CHECK (id = 1),
-                    google_oauth_enabled BOOLEAN DEFAULT FALSE,
-                    google_redirect_uri TEXT,
-                    google_frontend_redirect_uri TEXT,
-                    updated_at TIMESTAMP DEFAULT NOW()
-                )
-            """)
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS oauth_state_tokens (
-                    state_hash VARCHAR(64) PRIMARY KEY,
-                    expires_at TIMESTAMP NOT NULL,
-                    consumed_at TIMESTAMP,
-                    created_at TIMESTAMP DEFAULT NOW()
-                )
-            """)
-
-            # 기본 사용자 생성 (테스트용)
-            cur.execute(
-                """
-                INSERT INTO users (id, nickname, role)
-                VALUES ('11111111-1111-1111-1111-111111111111', 'devkim', 'admin')
-                ON CONFLICT DO NOTHING
-                """
-            )
-            # 컬럼 추가 (password - 해시된 비밀번호)
-            cur.execute("""
-                ALTER TABLE users ADD COLUMN IF NOT EXISTS password_hash VARCHAR(255)
-            """)
-            cur.execute("""
-                ALTER TABLE users ADD COLUMN IF NOT EXISTS limited_until TIMESTAMP
-            """)
-            cur.execute("""
-                ALTER TABLE users ADD COLUMN IF NOT EXISTS limited_reason TEXT
-            """)
-            cur.execute("""
-                ALTER TABLE users ADD COLUMN IF NOT EXISTS status VARCHAR(20) DEFAULT 'active'
-            """)
-            cur.execute("""
-                ALTER TABLE users ADD COLUMN IF NOT EXISTS provider VARCHAR(20) DEFAULT 'local'
-            """)
-            cur.execute("""
-                ALTER TABLE users ADD COLUMN IF NOT EXISTS provider_user_id VARCHAR(255)
-            """)
-            cur.execute("""
-                ALTER TABLE users ADD COLUMN IF NOT EXISTS email_verified BOOLEAN DEFAULT FALSE
-            """)
-            cur.execute("""
-                ALTER TABLE users ADD COLUMN IF NOT EXISTS suspended_reason TEXT
-            """)
-            cur.execute("""
-                ALTER TABLE users ADD COLUMN IF NOT EXISTS suspended_at TIMESTAMP
-            """)
-            cur.execute("""
-                ALTER TABLE users ADD COLUMN IF NOT EXISTS suspended_by UUID REFERENCES users(id)
-            """)
-            cur.execute("""
-                ALTER TABLE users ADD COLUMN IF NOT EXISTS delete_scheduled_at TIMESTAMP
-            """)
-            cur.execute("""
-                ALTER TABLE users ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP
-            """)
-            cur.execute("""
-                ALTER TABLE users ADD COLUMN IF NOT EXISTS deleted_by UUID REFERENCES users(id)
-            """)
-            cur.execute("""
-                ALTER TABLE users ADD COLUMN IF NOT EXISTS token_version INTEGER DEFAULT 0
-            """)
-            cur.execute("""
-                UPDATE users SET status = 'active' WHERE status IS NULL
-            """)
-            cur.execute("""
-                UPDATE users SET token_version = 0 WHERE token_version IS NULL
-            """)
-            cur.execute("""
-                UPDATE users SET provider = 'local' WHERE provider IS NULL
-            """)
-            cur.execute(
-                """
-                INSERT INTO moderation_settings (id, blocked_keywords, auto_hide_report_threshold)
-                VALUES (1, '{}', 3)
-                ON CONFLICT (id) DO NOTHING
-                """
-            )
-            cur.execute(
-                """
-                ALTER TABLE moderation_settings
-                ADD COLUMN IF NOT EXISTS home_filter_tabs JSONB DEFAULT '[]'::jsonb
-                """
-            )
-            cur.execute(
-                """
-                ALTER TABLE moderation_settings
-                ADD COLUMN IF NOT EXISTS explore_filter_tabs JSONB DEFAULT '[]'::jsonb
-                """
-            )
-            cur.execute(
-                """
-                ALTER TABLE moderation_settings
-                ADD COLUMN IF NOT EXISTS admin_log_retention_days INTEGER DEFAULT 365
-                """
-            )
-            cur.execute(
-                """
-                ALTER TABLE moderation_settings
-                ADD COLUMN IF NOT EXISTS admin_log_view_window_days INTEGER DEFAULT 30
-                """
-            )
-            cur.execute(
-                """
-                ALTER TABLE moderation_settings
-                ADD COLUMN IF NOT EXISTS admin_log_mask_reasons BOOLEAN DEFAULT TRUE
-                """
-            )
-            cur.execute(
-                """
-                INSERT INTO oauth_runtime_settings (id, google_oauth_enabled)
-                VALUES (1, FALSE)
-                ON CONFLICT (id) DO NOTHING
-                """
-            )
+        pool.putconn(conn)
 
-            # 컬럼 추가 (tags - 배열 타입)
-            cur.execute("""
-                ALTER TABLE projects ADD COLUMN IF NOT EXISTS tags TEXT[] DEFAULT '{}'
-            """)
-
-            cur.execute("""
-                CREATE INDEX IF NOT EXISTS idx_projects_status_created_at
-                ON projects (status, created_at DESC)
-            """)
-            cur.execute("""
-                CREATE INDEX IF NOT EXISTS idx_projects_status_like_count
-                ON projects (status, like_count DESC)
-            """)
-            cur.execute("""
-                CREATE INDEX IF NOT EXISTS idx_projects_status_platform_created_at
-                ON projects (status, platform, created_at DESC)
-            """)
-            cur.execute("""
-                CREATE INDEX IF NOT EXISTS idx_projects_tags_gin
-                ON projects USING GIN (tags)
-            """)
-            cur.execute("""
-                CREATE UNIQUE INDEX IF NOT EXISTS idx_users_provider_provider_user_id
-                ON users (provider, provider_user_id)
-                WHERE provider_user_id IS NOT NULL
-            """)
-            cur.execute("""
-                CREATE INDEX IF NOT EXISTS idx_oauth_state_tokens_expires_at
-                ON oauth_state_tokens (expires_at)
-            """)
-            cur.execute("""
-                CREATE INDEX IF NOT EXISTS idx_oauth_state_tokens_consumed_at
-                ON oauth_state_tokens (consumed_at)
-            """)
-            cur.execute("""
-                CREATE INDEX IF NOT EXISTS idx_admin_action_logs_created_at
-                ON admin_action_logs (created_at DESC)
-            """)
-            cur.execute("""
-                CREATE INDEX IF NOT EXISTS idx_admin_action_logs_target
-                ON admin_action_logs (target_type, target_id)
-            """)
-            cur.execute("""
-                CREATE INDEX IF NOT EXISTS idx_admin_action_logs_action_type
-                ON admin_action_logs (action_type)
-            """)
 
-            conn.commit()
-            print("✅ Database tables initialized successfully!")
+def get_db_pool_stats() -> dict[str, object]:
+    """커넥션 풀 대기/체크아웃 지표 (풀 생성 전이면 빈 지표)"""
+    if _db_pool is None:
+        return {
+            "max_connections": DB_POOL_MAX_CONN,
+            "timeout_seconds": DB_POOL_TIMEOUT_SECONDS,
+            "in_use": 0,
+            "waiting": 0,
+            "checkout_total": 0,
+            "waited_total": 0,
+            "timeout_total": 0,
+            "wait_ms_p50": 0.0,
+            "wait_ms_p95": 0.0,
+            "wait_ms_max": 0.0,
+        }
+    return _db_pool.stats()
 
 
 def ensure_site_contents_table(cur):
@@ -341,9 +183,18 @@ def ensure_site_contents_table(cur):
 
 
 def get_projects(
-    sort: str = "latest", platform: Optional[str] = None, tag: Optional[str] = None
+    sort: str = "latest",
+    platform: Optional[str] = None,
+    tag: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[tuple[object, str]] = None,
 ):
-    """프로젝트 목록 조회"""
+    """프로젝트 목록 조회 (keyset 페이지네이션)
+
+    cursor는 직전 페이지 마지막 행의 정렬 키다.
+    latest는 (created_at, id), popular는 (like_count, id)를 사용해
+    idx_projects_status_created_at / idx_projects_status_like_count 인덱스를 그대로 탄다.
+    """
     with get_db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             query = """
@@ -362,10 +213,21 @@ def get_projects(
                 query += " AND EXISTS (SELECT 1 FROM unnest(p.tags) AS t WHERE LOWER(t) = LOWER(%s))"
                 params.append(tag)
 
+            if cursor is not None:
+                if sort == "popular":
+                    query += " AND (p.like_count, p.id) < (%s::integer, %s::uuid)"
+                else:
+                    query += " AND (p.created_at, p.id) < (%s::timestamp, %s::uuid)"
+                params.extend(cursor)
+
             if sort == "popular":
-                query += " ORDER BY p.like_count DESC"
+                query += " ORDER BY p.like_count DESC, p.id DESC"
             else:
-                query += " ORDER BY p.created_at DESC"
+                query += " ORDER BY p.created_at DESC, p.id DESC"
+
+            if limit is not None:
+                query += " LIMIT %s"
+                params.append(limit)
 
             cur.execute(query, params)
             return cur.fetchall()
@@ -542,56 +404,255 @@ def create_project(data: dict[str, object]):
             return cur.fetchone()
 
 
-def like_project(project_id: str):
-    """프로젝트 좋아요 증가"""
+def get_project_like_count(project_id: str) -> Optional[int]:
+    """프로젝트의 현재 좋아요 수 조회 (없으면 None)"""
     with get_db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(
+                "SELECT like_count FROM projects WHERE id = %s",
+                (project_id,),
+            )
+            result = cur.fetchone()
+            return int(result["like_count"]) if result else None
+
+
+def apply_project_like_deltas(deltas: Mapping[str, int]) -> dict[str, int]:
+    """누적된 좋아요 증감을 한 번의 UPDATE로 반영하고 최종 값을 반환"""
+    if not deltas:
+        return {}
+
+    # 여러 워커가 동시에 반영해도 교착되지 않도록 id 순서로 잠금
+    values = sorted(deltas.items())
+    with get_db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            rows = execute_values(
+                cur,
                 """
-                UPDATE projects SET like_count = like_count + 1
-                WHERE id = %s
-                RETURNING like_count
+                UPDATE projects AS p
+                SET like_count = GREATEST(0, p.like_count + d.delta)
+                FROM (VALUES %s) AS d(id, delta)
+                WHERE p.id = d.id::uuid
+                RETURNING p.id, p.like_count
             """,
-                (project_id,),
+                values,
+                template="(%s, %s::integer)",
+                fetch=True,
             )
             conn.commit()
-            result = cur.fetchone()
-            return result["like_count"] if result else 0
+            return {str(row["id"]): int(row["like_count"]) for row in rows}
 
 
-def unlike_project(project_id: str):
-    """프로젝트 좋아요 취소"""
+def reconcile_project_like_counts(project_ids: Iterable[str]) -> dict[str, int]:
+    """project_likes를 다시 세어 like_count를 맞추고 최종 값을 반환
+
+    증감 반영이 커밋됐는지 알 수 없을 때(반영 실패)나 주기 점검에서만 쓴다.
+    """
+    ids = sorted(set(project_ids))
+    if not ids:
+        return {}
+
     with get_db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            # 여러 워커가 동시에 반영해도 교착되지 않도록 id 순서로 잠금
             cur.execute(
                 """
-                UPDATE projects SET like_count = GREATEST(0, like_count - 1)
-                WHERE id = %s
-                RETURNING like_count
+                WITH locked AS (
+                    SELECT id FROM projects
+                    WHERE id = ANY(%s::uuid[])
+                    ORDER BY id
+                    FOR UPDATE
+                )
+                UPDATE projects AS p
+                SET like_count = (
+                    SELECT COUNT(*) FROM project_likes AS l
+                    WHERE l.project_id = p.id
+                )
+                FROM locked
+                WHERE p.id = locked.id
+                RETURNING p.id, p.like_count
             """,
-                (project_id,),
+                (ids,),
             )
+            rows = cur.fetchall()
             conn.commit()
-            result = cur.fetchone()
-            return result["like_count"] if result else 0
+            return {str(row["id"]): int(row["like_count"]) for row in rows}
+
+
+def reconcile_drifted_project_like_counts() -> dict[str, int]:
+    """like_count가 project_likes 행 수와 어긋난 프로젝트만 다시 맞춘다"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT p.id
+                FROM projects AS p
+                LEFT JOIN project_likes AS l ON l.project_id = p.id
+                GROUP BY p.id
+                HAVING p.like_count <> COUNT(l.project_id)
+            """
+            )
+            ids = [str(row[0]) for row in cur.fetchall()]
+        conn.commit()
+    return reconcile_project_like_counts(ids)
+
+
+def add_project_like(project_id: str, user_id: str) -> Optional[bool]:
+    """사용자 좋아요 기록 (이미 눌렀으면 False, 프로젝트가 없으면 None)"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            try:
+                cur.execute(
+                    """
+                    INSERT INTO project_likes (project_id, user_id)
+                    VALUES (%s, %s)
+                    ON CONFLICT (project_id, user_id) DO NOTHING
+                    RETURNING project_id
+                """,
+                    (project_id, user_id),
+                )
+            except errors.ForeignKeyViolation:
+                conn.rollback()
+                return None
+            inserted = cur.fetchone() is not None
+            conn.commit()
+            return inserted
 
 
-def get_comments(project_id: str, sort: str = "latest"):
-    """프로젝트 댓글 목록"""
+def remove_project_like(project_id: str, user_id: str) -> bool:
+    """사용자 좋아요 취소 (누른 적이 없으면 False)"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                DELETE FROM project_likes
+                WHERE project_id = %s AND user_id = %s
+                RETURNING project_id
+            """,
+                (project_id, user_id),
+            )
+            deleted = cur.fetchone() is not None
+            conn.commit()
+            return deleted
+
+
+def get_liked_project_ids(user_id: str, project_ids: list[str]) -> set[str]:
+    """주어진 프로젝트 중 사용자가 좋아요한 id 집합"""
+    if not project_ids:
+        return set()
+
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT project_id FROM project_likes
+                WHERE user_id = %s AND project_id = ANY(%s::uuid[])
+            """,
+                (user_id, project_ids),
+            )
+            return {str(row[0]) for row in cur.fetchall()}
+
+
+def get_comment_threads(
+    project_id: str,
+    sort: str = "latest",
+    limit: int = 20,
+    cursor: Optional[tuple[object, str]] = None,
+    replies_limit: int = 3,
+):
+    """최상위 댓글 한 페이지와 스레드별 답글 일부를 한 번에 조회
+
+    최상위 댓글은 keyset 페이지네이션(latest: (created_at, id), popular:
+    (like_count, id)), 답글은 최상위 댓글마다 LATERAL로 (parent_id, created_at)
+    인덱스를 따라 오래된 순으로 replies_limit + 1개만 읽는다(마지막 한 개는 더 있는지
+    확인용). 결과는 root_rank(페이지 내 순서), depth 순으로 정렬되고 각 행에 root_id가,
+    최상위 댓글 행에는 reply_count(보이는 답글 수)가 붙는다.
+    """
+    if sort == "popular":
+        order_by = "c.like_count DESC, c.id DESC"
+        keyset = " AND (c.like_count, c.id) < (%s::integer, %s::uuid)"
+    else:
+        order_by = "c.created_at DESC, c.id DESC"
+        keyset = " AND (c.created_at, c.id) < (%s::timestamp, %s::uuid)"
+
+    params: list[object] = [project_id]
+    page_filter = ""
+    if cursor is not None:
+        page_filter = keyset
+        params.extend(cursor)
+    params.extend([limit, replies_limit + 1])
+
     with get_db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            query = """
-                SELECT c.*, u.nickname as author_nickname
+            cur.execute(
+                f"""
+                WITH page AS (
+                    SELECT c.*, ROW_NUMBER() OVER (ORDER BY {order_by}) AS root_rank
+                    FROM comments c
+                    WHERE c.project_id = %s
+                      AND c.status = 'visible'
+                      AND c.parent_id IS NULL{page_filter}
+                    ORDER BY {order_by}
+                    LIMIT %s
+                )
+                SELECT page.*, u.nickname AS author_nickname,
+                       page.id AS root_id, 0 AS depth, replies.reply_count
+                FROM page
+                JOIN users u ON page.author_id = u.id
+                CROSS JOIN LATERAL (
+                    SELECT COUNT(*) AS reply_count
+                    FROM comments r
+                    WHERE r.parent_id = page.id AND r.status = 'visible'
+                ) AS replies
+                UNION ALL
+                SELECT r.*, page.root_rank, u.nickname AS author_nickname,
+                       page.id AS root_id, 1 AS depth, NULL AS reply_count
+                FROM page
+                CROSS JOIN LATERAL (
+                    SELECT *
+                    FROM comments r
+                    WHERE r.parent_id = page.id AND r.status = 'visible'
+                    ORDER BY r.created_at, r.id
+                    LIMIT %s
+                ) AS r
+                JOIN users u ON r.author_id = u.id
+                ORDER BY root_rank, depth, created_at, id
+            """,
+                params,
+            )
+            return cur.fetchall()
+
+
+def get_comment_replies(
+    comment_id: str,
+    limit: int = 20,
+    cursor: Optional[tuple[object, str]] = None,
+):
+    """댓글의 답글을 오래된 순으로 조회 (keyset: (created_at, id))"""
+    params: list[object] = [comment_id, comment_id]
+    reply_filter = ""
+    if cursor is not None:
+        reply_filter = " AND (c.created_at, c.id) > (%s::timestamp, %s::uuid)"
+        params.extend(cursor)
+    params.append(limit)
+
+    with get_db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(
+                f"""
+                SELECT c.*, u.nickname AS author_nickname, 1 AS depth
                 FROM comments c
                 JOIN users u ON c.author_id = u.id
-                WHERE c.project_id = %s AND c.status = 'visible'
-            """
-            if sort == "popular":
-                query += " ORDER BY c.like_count DESC"
-            else:
-                query += " ORDER BY c.created_at DESC"
-
-            cur.execute(query, (project_id,))
+                WHERE c.parent_id = %s
+                  AND c.status = 'visible'
+                  AND EXISTS (
+                      SELECT 1 FROM comments root
+                      WHERE root.id = %s AND root.status = 'visible'
+                  ){reply_filter}
+                ORDER BY c.created_at, c.id
+                LIMIT %s
+            """,
+                params,
+            )
             return cur.fetchall()
 
 
@@ -625,25 +686,115 @@ def create_comment(
             return cur.fetchone()
 
 
-def report_comment(
-    comment_id: str,
+# 로그인 없이 받던 예전 신고의 reporter_id - 서로 다른 신고자 수에서 뺀다
+LEGACY_ANONYMOUS_REPORTER_ID = "11111111-1111-1111-1111-111111111111"
+
+
+def create_report(
+    target_type: str,
+    target_id: str,
     reason: str,
-    reporter_id: str = "11111111-1111-1111-1111-111111111111",
+    reporter_id: str,
     memo: Optional[str] = None,
+    auto_hide_threshold: Optional[int] = None,
 ):
-    """댓글 신고"""
+    """신고 등록 + 대상별 open 신고 수 증가, 임계치 도달 시 대상 자동 숨김
+
+    이미 신고한 사용자의 신고는 받지 않으므로 open 신고 수가 곧 서로 다른 신고자 수다.
+    유일 인덱스는 새 신고에만 걸려 있어 예전 신고와의 중복은 직접 확인한다.
+    반환값: 대상이 없으면 None, 이미 신고했으면 (None, None),
+    그 외에는 (신고, 자동 숨김된 대상 행 또는 None)
+    """
+    target_table = "projects" if target_type == "project" else "comments"
     with get_db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(
+                f"SELECT 1 FROM {target_table} WHERE id = %s",
+                (target_id,),
+            )
+            if cur.fetchone() is None:
+                conn.rollback()
+                return None
+            try:
+                cur.execute(
+                    """
+                    INSERT INTO reports (target_type, target_id, reporter_id, reason, memo)
+                    SELECT %s, %s, %s, %s, %s
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM reports
+                        WHERE target_type = %s AND target_id = %s AND reporter_id = %s
+                    )
+                    RETURNING *
+                """,
+                    (
+                        target_type,
+                        target_id,
+                        reporter_id,
+                        reason,
+                        memo,
+                        target_type,
+                        target_id,
+                        reporter_id,
+                    ),
+                )
+            except errors.UniqueViolation:
+                # 같은 사용자의 동시 신고
+                conn.rollback()
+                return None, None
+            report = cur.fetchone()
+            if report is None:
+                conn.rollback()
+                return None, None
             cur.execute(
                 """
-                INSERT INTO reports (target_type, target_id, reporter_id, reason, memo)
-                VALUES ('comment', %s, %s, %s, %s)
-                RETURNING *
+                INSERT INTO report_counters (target_type, target_id, open_count)
+                VALUES (%s, %s, 1)
+                ON CONFLICT (target_type, target_id)
+                DO UPDATE SET open_count = report_counters.open_count + 1,
+                              updated_at = NOW()
+                RETURNING open_count
             """,
-                (comment_id, reporter_id, reason, memo),
+                (target_type, target_id),
             )
+            counter = cur.fetchone()
+            open_count = int(counter["open_count"]) if counter else 0
+
+            hidden = None
+            if auto_hide_threshold and open_count >= auto_hide_threshold:
+                if target_type == "project":
+                    cur.execute(
+                        """
+                        UPDATE projects
+                        SET status = 'hidden', updated_at = NOW()
+                        WHERE id = %s AND status = 'published'
+                        RETURNING *
+                    """,
+                        (target_id,),
+                    )
+                    hidden = cur.fetchone()
+                elif target_type == "comment":
+                    cur.execute(
+                        """
+                        UPDATE comments
+                        SET status = 'hidden', updated_at = NOW()
+                        WHERE id = %s AND status = 'visible'
+                        RETURNING *
+                    """,
+                        (target_id,),
+                    )
+                    hidden = cur.fetchone()
+                    if hidden:
+                        cur.execute(
+                            """
+                            UPDATE projects
+                            SET comment_count = GREATEST(0, comment_count - 1)
+                            WHERE id = %s
+                        """,
+                            (hidden["project_id"],),
+                        )
+
             conn.commit()
-            return cur.fetchone()
+            return report, hidden
 
 
 def get_reports(status: Optional[str] = None, limit: int = 50, offset: int = 0):
@@ -682,6 +833,11 @@ def update_report(report_id: str, new_status: str):
     """신고 처리 상태 변경"""
     with get_db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(
+                "SELECT status FROM reports WHERE id = %s FOR UPDATE",
+                (report_id,),
+            )
+            previous = cur.fetchone()
             if new_status in ["resolved", "rejected"]:
                 cur.execute(
                     """
@@ -700,8 +856,38 @@ def update_report(report_id: str, new_status: str):
                 """,
                     (new_status, report_id),
                 )
+            updated = cur.fetchone()
+
+            # open 상태에서 벗어나거나 다시 열리면 대상별 신고 수를 다시 센다
+            # (예전 중복 신고가 있을 수 있어 증감 대신 서로 다른 신고자 수로 맞춘다)
+            if (
+                previous
+                and updated
+                and (previous["status"] == "open") != (new_status == "open")
+            ):
+                cur.execute(
+                    """
+                    UPDATE report_counters
+                    SET open_count = (
+                            SELECT COUNT(DISTINCT reporter_id)
+                            FROM reports
+                            WHERE target_type = %s AND target_id = %s
+                              AND status = 'open'
+                              AND reporter_id <> %s
+                        ),
+                        updated_at = NOW()
+                    WHERE target_type = %s AND target_id = %s
+                """,
+                    (
+                        updated["target_type"],
+                        updated["target_id"],
+                        LEGACY_ANONYMOUS_REPORTER_ID,
+                        updated["target_type"],
+                        updated["target_id"],
+                    ),
+                )
             conn.commit()
-            return cur.fetchone()
+            return updated
 
 
 def create_admin_action_log(
@@ -711,16 +897,21 @@ def create_admin_action_log(
     target_id: str,
     reason: Optional[str] = None,
 ):
+    insert = """
+        INSERT INTO admin_action_logs (admin_id, action_type, target_type, target_id, reason)
+        VALUES (%s, %s, %s, %s, %s)
+        RETURNING *
+    """
+    params = (admin_id, action_type, target_type, target_id, reason)
     with get_db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(
-                """
-                INSERT INTO admin_action_logs (admin_id, action_type, target_type, target_id, reason)
-                VALUES (%s, %s, %s, %s, %s)
-                RETURNING *
-                """,
-                (admin_id, action_type, target_type, target_id, reason),
-            )
+            try:
+                cur.execute(insert, params)
+            except errors.CheckViolation:
+                # 이번 달 파티션이 아직 없으면(관리 작업이 오래 멈춘 경우) 만들고 다시 기록
+                conn.rollback()
+                cur.execute("SELECT ensure_admin_action_log_partition(LOCALTIMESTAMP)")
+                cur.execute(insert, params)
             conn.commit()
             return cur.fetchone()
 
@@ -754,21 +945,127 @@ def get_admin_action_logs(limit: int = 50, view_window_days: Optional[int] = Non
             return cur.fetchall()
 
 
-def cleanup_admin_action_logs(retention_days: int) -> int:
+def get_admin_action_log_retention_cutoff(retention_days: int) -> datetime:
+    """보관 기간이 지난 로그의 기준 시각 (DB 시계 기준)"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT (NOW() - (%s * INTERVAL '1 day'))::timestamp",
+                (retention_days,),
+            )
+            row = cur.fetchone()
+            assert row is not None
+            return row[0]
+
+
+def delete_admin_action_logs_batch(cutoff: datetime, batch_size: int) -> int:
+    """cutoff 이전 로그를 오래된 순으로 최대 batch_size개 삭제하고 바로 커밋
+
+    한 번에 지우는 양을 제한해 트랜잭션과 WAL을 작게 유지한다.
+    """
     with get_db_connection() as conn:
         with conn.cursor() as cur:
+            # 바깥 조건에도 created_at을 걸어야 파티션 가지치기가 된다
             cur.execute(
                 """
                 DELETE FROM admin_action_logs
-                WHERE created_at < NOW() - (%s * INTERVAL '1 day')
+                WHERE created_at < %(cutoff)s
+                  AND (id, created_at) IN (
+                    SELECT id, created_at
+                    FROM admin_action_logs
+                    WHERE created_at < %(cutoff)s
+                    ORDER BY created_at
+                    LIMIT %(limit)s
+                    FOR UPDATE SKIP LOCKED
+                )
                 """,
-                (retention_days,),
+                {"cutoff": cutoff, "limit": batch_size},
             )
             deleted_count = cur.rowcount
             conn.commit()
             return deleted_count
 
 
+def ensure_admin_action_log_partitions(months_ahead: int = 2) -> list[str]:
+    """이번 달부터 months_ahead개월 뒤까지 월별 파티션을 만들고 새로 만든 이름 반환"""
+    created: list[str] = []
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            for offset in range(months_ahead + 1):
+                cur.execute(
+                    """
+                    SELECT ensure_admin_action_log_partition(
+                        (date_trunc('month', NOW()) + make_interval(months => %s))::timestamp
+                    )
+                    """,
+                    (offset,),
+                )
+                row = cur.fetchone()
+                conn.commit()
+                if row and row[0]:
+                    created.append(row[0])
+    return created
+
+
+def drop_expired_admin_action_log_partitions(cutoff: datetime) -> list[str]:
+    """범위 전체가 cutoff 이전인 월별 파티션을 통째로 삭제 (행 DELETE 없이)
+
+    DETACH PARTITION ... CONCURRENTLY로 떼어 낸 뒤 지우므로 부모 테이블에는
+    로그 기록을 막는 잠금을 걸지 않는다. cutoff가 걸친 달의 나머지 행은
+    delete_admin_action_logs_batch로 지운다.
+    """
+    dropped: list[str] = []
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            # 떼어 냈지만 지우지 못한 파티션과 DETACH가 중간에 끊긴 파티션도 이어서 정리
+            cur.execute(
+                r"""
+                SELECT c.relname, i.inhrelid IS NOT NULL, COALESCE(i.inhdetachpending, FALSE)
+                FROM pg_class c
+                LEFT JOIN pg_inherits i
+                  ON i.inhrelid = c.oid
+                 AND i.inhparent = 'admin_action_logs'::regclass
+                WHERE c.relkind = 'r'
+                  AND pg_table_is_visible(c.oid)
+                  AND c.relname ~ '^admin_action_logs_p\d{6}$'
+                  AND to_timestamp(right(c.relname, 6), 'YYYYMM')::timestamp
+                      + INTERVAL '1 month' <= %s
+                ORDER BY c.relname
+                """,
+                (cutoff,),
+            )
+            partitions = [(row[0], row[1], row[2]) for row in cur.fetchall()]
+            conn.commit()
+            if not partitions:
+                return dropped
+
+            # CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없다
+            conn.autocommit = True
+            try:
+                # 잠금을 오래 기다리며 로그 기록을 막지 않도록 짧게 제한
+                cur.execute("SET lock_timeout = '5s'")
+                for name, attached, detach_pending in partitions:
+                    try:
+                        if attached:
+                            detach = (
+                                "ALTER TABLE admin_action_logs DETACH PARTITION {} FINALIZE"
+                                if detach_pending
+                                else "ALTER TABLE admin_action_logs DETACH PARTITION {} CONCURRENTLY"
+                            )
+                            cur.execute(sql.SQL(detach).format(sql.Identifier(name)))
+                        cur.execute(
+                            sql.SQL("DROP TABLE {}").format(sql.Identifier(name))
+                        )
+                    except errors.LockNotAvailable:
+                        # 다음 관리 작업 실행 때 다시 시도한다
+                        break
+                    dropped.append(name)
+            finally:
+                cur.execute("RESET lock_timeout")
+                conn.autocommit = False
+    return dropped
+
+
 def get_latest_policy_update_action():
     with get_db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
@@ -1007,6 +1304,11 @@ def delete_user_now(user_id: str, admin_id: str, reason: str):
 
 
 def purge_due_user_deletions(limit: int = 200):
+    """삭제 예약이 지난 계정을 삭제 처리
+
+    그사이 관리자가 예약을 취소했을 수 있으므로 바깥 UPDATE에서도 상태를 다시 확인하고,
+    다른 트랜잭션이 잡고 있는 행은 건너뛴다.
+    """
     with get_db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(
@@ -1026,7 +1328,9 @@ def purge_due_user_deletions(limit: int = 200):
                       AND delete_scheduled_at <= NOW()
                     ORDER BY delete_scheduled_at ASC
                     LIMIT %s
+                    FOR UPDATE SKIP LOCKED
                 )
+                  AND status = 'pending_delete'
                 RETURNING id, email, nickname, role, status, created_at, limited_until, limited_reason,
                           suspended_reason, suspended_at, suspended_by, delete_scheduled_at, deleted_at, deleted_by, token_version
                 """,
@@ -1051,6 +1355,15 @@ def get_moderation_settings():
             return cur.fetchone()
 
 
+def get_moderation_settings_updated_at():
+    """정책 설정 변경 여부 확인용 updated_at 조회"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT updated_at FROM moderation_settings WHERE id = 1")
+            row = cur.fetchone()
+            return row[0] if row else None
+
+
 def update_moderation_settings(
     blocked_keywords: list[str],
     auto_hide_report_threshold: int,
@@ -1091,6 +1404,329 @@ def update_moderation_settings(
             return cur.fetchone()
 
 
+MODERATION_SWEEP_COLUMNS = """
+    id, status, phase, last_id, scanned_count, hidden_count, batch_count,
+    requested_by, keywords, error, started_at, updated_at, finished_at
+"""
+
+
+def create_moderation_sweep(
+    requested_by: Optional[str] = None, keywords: Optional[list[str]] = None
+):
+    """새 금칙어 소급 점검 작업 생성 (진행 중인 이전 작업은 superseded 처리)
+
+    keywords가 있으면 그 금칙어만 점검하고, None이면 전체 금칙어로 점검한다.
+    """
+    with get_db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(
+                """
+                UPDATE moderation_sweeps
+                SET status = 'superseded', updated_at = NOW(), finished_at = NOW()
+                WHERE status = 'running'
+                """
+            )
+            cur.execute(
+                f"""
+                INSERT INTO moderation_sweeps (requested_by, keywords)
+                VALUES (%s, %s)
+                RETURNING {MODERATION_SWEEP_COLUMNS}
+                """,
+                (requested_by, keywords),
+            )
+            conn.commit()
+            return cur.fetchone()
+
+
+def get_latest_moderation_sweep():
+    with get_db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(
+                f"""
+                SELECT {MODERATION_SWEEP_COLUMNS}
+                FROM moderation_sweeps
+                ORDER BY started_at DESC
+                LIMIT 1
+                """
+            )
+            return cur.fetchone()
+
+
+def claim_stale_moderation_sweep(stale_seconds: float):
+    """진행 중이지만 stale_seconds 동안 배치 기록이 없는 점검 작업을 가져옴
+
+    updated_at을 갱신해 두므로 여러 워커가 동시에 호출해도 한 곳만 이어서 실행한다.
+    """
+    with get_db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(
+                f"""
+                UPDATE moderation_sweeps
+                SET updated_at = NOW()
+                WHERE id = (
+                    SELECT id
+                    FROM moderation_sweeps
+                    WHERE status = 'running'
+                      AND updated_at < NOW() - make_interval(secs => %s)
+                    ORDER BY started_at DESC
+                    LIMIT 1
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING {MODERATION_SWEEP_COLUMNS}
+                """,
+                (stale_seconds,),
+            )
+            sweep = cur.fetchone()
+            conn.commit()
+            return sweep
+
+
+def iter_moderation_sweep_batches(
+    phase: str, after_id: Optional[str], batch_size: int
+) -> Generator[list[RealDictRow], None, None]:
+    """점검 대상(projects/comments)을 id 순서로 서버 측 커서에서 배치 단위로 읽기"""
+    if phase == "projects":
+        query = """
+            SELECT id, CONCAT_WS(' ', title, summary, description) AS content
+            FROM projects
+            WHERE status = 'published' AND (%s::uuid IS NULL OR id > %s::uuid)
+            ORDER BY id
+        """
+    else:
+        query = """
+            SELECT id, content
+            FROM comments
+            WHERE status = 'visible' AND (%s::uuid IS NULL OR id > %s::uuid)
+            ORDER BY id
+        """
+
+    with get_db_connection() as conn:
+        try:
+            with conn.cursor(
+                name=f"moderation_sweep_{phase}", cursor_factory=RealDictCursor
+            ) as cur:
+                cur.itersize = batch_size
+                cur.execute(query, (after_id, after_id))
+                while True:
+                    rows = cur.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield rows
+        finally:
+            conn.rollback()
+
+
+def apply_moderation_sweep_batch(
+    sweep_id: str,
+    phase: str,
+    hide_ids: list[str],
+    previous_last_id: Optional[str],
+    last_id: str,
+    scanned_count: int,
+) -> Optional[list[str]]:
+    """배치 결과를 한 트랜잭션으로 반영
+
+    체크포인트가 previous_last_id 그대로일 때만 반영하므로, 같은 작업을 다른
+    실행기가 먼저 진행했다면 뒤로 되돌리지 않고 None을 반환한다.
+    (작업이 더 이상 진행 중이 아닐 때도 None)
+    """
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE moderation_sweeps
+                SET last_id = %s,
+                    scanned_count = scanned_count + %s,
+                    batch_count = batch_count + 1,
+                    updated_at = NOW()
+                WHERE id = %s AND status = 'running' AND phase = %s
+                  AND last_id IS NOT DISTINCT FROM %s::uuid
+                RETURNING id
+                """,
+                (last_id, scanned_count, sweep_id, phase, previous_last_id),
+            )
+            if cur.fetchone() is None:
+                conn.rollback()
+                return None
+
+            hidden_ids: list[str] = []
+            if hide_ids and phase == "projects":
+                cur.execute(
+                    """
+                    UPDATE projects
+                    SET status = 'hidden', updated_at = NOW()
+                    WHERE id = ANY(%s::uuid[]) AND status = 'published'
+                    RETURNING id
+                    """,
+                    (hide_ids,),
+                )
+                hidden_ids = [str(row[0]) for row in cur.fetchall()]
+            elif hide_ids:
+                cur.execute(
+                    """
+                    WITH hidden AS (
+                        UPDATE comments
+                        SET status = 'hidden', updated_at = NOW()
+                        WHERE id = ANY(%s::uuid[]) AND status = 'visible'
+                        RETURNING id, project_id
+                    ),
+                    counted AS (
+                        UPDATE projects p
+                        SET comment_count = GREATEST(0, p.comment_count - h.hidden_count)
+                        FROM (
+                            SELECT project_id, COUNT(*) AS hidden_count
+                            FROM hidden
+                            GROUP BY project_id
+                        ) h
+                        WHERE p.id = h.project_id
+                    )
+                    SELECT id FROM hidden
+                    """,
+                    (hide_ids,),
+                )
+                hidden_ids = [str(row[0]) for row in cur.fetchall()]
+
+            if hidden_ids:
+                cur.execute(
+                    """
+                    UPDATE moderation_sweeps
+                    SET hidden_count = hidden_count + %s
+                    WHERE id = %s
+                    """,
+                    (len(hidden_ids), sweep_id),
+                )
+                cur.execute(
+                    """
+                    INSERT INTO moderation_sweep_hidden_items (sweep_id, target_type, target_id)
+                    SELECT %s, %s, UNNEST(%s::uuid[])
+                    ON CONFLICT DO NOTHING
+                    """,
+                    (
+                        sweep_id,
+                        "project" if phase == "projects" else "comment",
+                        hidden_ids,
+                    ),
+                )
+            conn.commit()
+            return hidden_ids
+
+
+def revert_moderation_sweep(sweep_id: str) -> Optional[dict[str, int]]:
+    """점검 작업이 숨긴 대상 중 아직 숨김 상태인 것을 복구 (없거나 이미 되돌렸으면 None)
+
+    진행 중인 작업이면 reverted로 바꿔 남은 배치가 반영되지 않게 한다.
+    """
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE moderation_sweeps
+                SET status = 'reverted',
+                    updated_at = NOW(),
+                    finished_at = COALESCE(finished_at, NOW())
+                WHERE id = %s AND status <> 'reverted'
+                RETURNING id
+                """,
+                (sweep_id,),
+            )
+            if cur.fetchone() is None:
+                conn.rollback()
+                return None
+
+            cur.execute(
+                """
+                WITH restored AS (
+                    UPDATE projects p
+                    SET status = 'published', updated_at = NOW()
+                    FROM moderation_sweep_hidden_items i
+                    WHERE i.sweep_id = %(sweep_id)s
+                      AND i.target_type = 'project'
+                      AND i.restored_at IS NULL
+                      AND p.id = i.target_id
+                      AND p.status = 'hidden'
+                    RETURNING p.id
+                )
+                UPDATE moderation_sweep_hidden_items
+                SET restored_at = NOW()
+                WHERE sweep_id = %(sweep_id)s
+                  AND target_type = 'project'
+                  AND target_id IN (SELECT id FROM restored)
+                """,
+                {"sweep_id": sweep_id},
+            )
+            projects_restored = cur.rowcount
+            cur.execute(
+                """
+                WITH restored AS (
+                    UPDATE comments c
+                    SET status = 'visible', updated_at = NOW()
+                    FROM moderation_sweep_hidden_items i
+                    WHERE i.sweep_id = %(sweep_id)s
+                      AND i.target_type = 'comment'
+                      AND i.restored_at IS NULL
+                      AND c.id = i.target_id
+                      AND c.status = 'hidden'
+                    RETURNING c.id, c.project_id
+                ),
+                counted AS (
+                    UPDATE projects p
+                    SET comment_count = p.comment_count + r.restored_count
+                    FROM (
+                        SELECT project_id, COUNT(*) AS restored_count
+                        FROM restored
+                        GROUP BY project_id
+                    ) r
+                    WHERE p.id = r.project_id
+                )
+                UPDATE moderation_sweep_hidden_items
+                SET restored_at = NOW()
+                WHERE sweep_id = %(sweep_id)s
+                  AND target_type = 'comment'
+                  AND target_id IN (SELECT id FROM restored)
+                """,
+                {"sweep_id": sweep_id},
+            )
+            comments_restored = cur.rowcount
+            conn.commit()
+            return {
+                "projects_restored": projects_restored,
+                "comments_restored": comments_restored,
+            }
+
+
+def advance_moderation_sweep_phase(sweep_id: str, phase: str) -> bool:
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE moderation_sweeps
+                SET phase = %s, last_id = NULL, updated_at = NOW()
+                WHERE id = %s AND status = 'running'
+                RETURNING id
+                """,
+                (phase, sweep_id),
+            )
+            advanced = cur.fetchone() is not None
+            conn.commit()
+            return advanced
+
+
+def finish_moderation_sweep(
+    sweep_id: str, status: str, error: Optional[str] = None
+) -> None:
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE moderation_sweeps
+                SET status = %s, error = %s, updated_at = NOW(), finished_at = NOW()
+                WHERE id = %s AND status = 'running'
+                """,
+                (status, error, sweep_id),
+            )
+            conn.commit()
+
+
 def get_oauth_runtime_settings():
     with get_db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
@@ -1185,6 +1821,191 @@ def cleanup_oauth_state_tokens():
             conn.commit()
 
 
+def consume_rate_limit_token(
+    bucket_key: str, capacity: int, refill_per_second: float
+) -> tuple[bool, float]:
+    """토큰 버킷에서 토큰 하나를 원자적으로 사용 (행 하나 upsert)
+
+    반환값: (허용 여부, 사용 후 남은 토큰)
+    """
+    # 마지막 사용 이후 채워진 토큰까지 더한 현재 토큰 수 (b는 기존 행)
+    refilled = """LEAST(
+        %(capacity)s::double precision,
+        b.tokens + EXTRACT(EPOCH FROM EXCLUDED.updated_at - b.updated_at)::double precision
+            * %(rate)s::double precision
+    )"""
+    with get_db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(
+                f"""
+                INSERT INTO rate_limit_buckets AS b
+                    (bucket_key, tokens, allowed, updated_at, idle_until)
+                VALUES (
+                    %(key)s, %(capacity)s - 1, TRUE, clock_timestamp(),
+                    clock_timestamp() + make_interval(secs => %(idle)s)
+                )
+                ON CONFLICT (bucket_key) DO UPDATE
+                SET tokens = {refilled} - CASE WHEN {refilled} >= 1 THEN 1 ELSE 0 END,
+                    allowed = {refilled} >= 1,
+                    updated_at = EXCLUDED.updated_at,
+                    idle_until = EXCLUDED.idle_until
+                RETURNING b.allowed, b.tokens
+            """,
+                {
+                    "key": bucket_key,
+                    "capacity": capacity,
+                    "rate": refill_per_second,
+                    "idle": capacity / refill_per_second,
+                },
+            )
+            row = cur.fetchone()
+            conn.commit()
+            if not row:
+                return True, float(capacity - 1)
+            return bool(row["allowed"]), float(row["tokens"])
+
+
+def cleanup_rate_limit_buckets() -> int:
+    """가득 찬 상태로 돌아간 버킷 삭제 - 지워도 다음 요청 결과가 같다"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM rate_limit_buckets WHERE idle_until <= NOW()")
+            deleted = cur.rowcount
+            conn.commit()
+            return deleted
+
+
+def acquire_maintenance_lease(
+    name: str, holder: str, ttl_seconds: float, run_interval_seconds: float
+):
+    """작업 임대(lease)를 새로 잡거나 연장하고 잡은 경우 행을 반환
+
+    비어 있거나 만료된 임대, 또는 이미 내가 가진 임대만 가져온다.
+    반환 행의 due는 마지막 실행 후 run_interval_seconds가 지났는지 여부다.
+    (시각 비교를 DB에서 해 워커 간 시계 차이의 영향을 받지 않는다)
+    """
+    with get_db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(
+                """
+                INSERT INTO maintenance_leases AS l (name, holder, acquired_at, expires_at)
+                VALUES (%(name)s, %(holder)s, NOW(), NOW() + make_interval(secs => %(ttl)s))
+                ON CONFLICT (name) DO UPDATE
+                SET holder = EXCLUDED.holder,
+                    acquired_at = CASE
+                        WHEN l.holder = EXCLUDED.holder THEN l.acquired_at
+                        ELSE EXCLUDED.acquired_at
+                    END,
+                    expires_at = EXCLUDED.expires_at
+                WHERE l.holder = EXCLUDED.holder OR l.holder IS NULL OR l.expires_at <= NOW()
+                RETURNING l.*,
+                    (l.last_run_finished_at IS NULL
+                     OR l.last_run_finished_at <= NOW() - make_interval(secs => %(interval)s)) AS due
+                """,
+                {
+                    "name": name,
+                    "holder": holder,
+                    "ttl": ttl_seconds,
+                    "interval": run_interval_seconds,
+                },
+            )
+            row = cur.fetchone()
+            conn.commit()
+            return row
+
+
+def release_maintenance_lease(name: str, holder: str) -> bool:
+    """종료 시 임대를 바로 내려놓아 다른 워커가 기다리지 않고 이어받게 함"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE maintenance_leases
+                SET holder = NULL, expires_at = NOW()
+                WHERE name = %s AND holder = %s
+                """,
+                (name, holder),
+            )
+            released = cur.rowcount > 0
+            conn.commit()
+            return released
+
+
+def record_maintenance_run_started(name: str, holder: str) -> bool:
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE maintenance_leases
+                SET last_run_holder = holder,
+                    last_run_started_at = NOW(),
+                    last_run_error = NULL
+                WHERE name = %s AND holder = %s
+                """,
+                (name, holder),
+            )
+            started = cur.rowcount > 0
+            conn.commit()
+            return started
+
+
+def record_maintenance_run_finished(
+    name: str,
+    holder: str,
+    stats: Mapping[str, object],
+    error: Optional[str] = None,
+) -> bool:
+    """실행 결과 기록 (그 사이 다른 워커가 새 실행을 시작했다면 기록하지 않음)"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE maintenance_leases
+                SET last_run_finished_at = NOW(),
+                    last_run_stats = %s,
+                    last_run_error = %s
+                WHERE name = %s AND last_run_holder = %s
+                """,
+                (Json(dict(stats)), error, name, holder),
+            )
+            recorded = cur.rowcount > 0
+            conn.commit()
+            return recorded
+
+
+def record_maintenance_run_progress(
+    name: str, holder: str, stats: Mapping[str, object]
+) -> bool:
+    """실행 중 진행 상황 기록 - 다른 워커의 관리자 API에서도 볼 수 있게 함"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE maintenance_leases
+                SET last_run_stats = %s
+                WHERE name = %s AND last_run_holder = %s
+                """,
+                (Json(dict(stats)), name, holder),
+            )
+            recorded = cur.rowcount > 0
+            conn.commit()
+            return recorded
+
+
+def get_maintenance_lease(name: str):
+    with get_db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(
+                """
+                SELECT *, (holder IS NOT NULL AND expires_at > NOW()) AS active
+                FROM maintenance_leases
+                WHERE name = %s
+                """,
+                (name,),
+            )
+            return cur.fetchone()
+
+
 def get_site_content(content_key: str):
     with get_db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
@@ -0,0 +1,124 @@
+# pyright: reportUnknownVariableType=false, reportUnknownMemberType=false, reportUnknownArgumentType=false, reportDeprecated=false
+
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from dotenv import load_dotenv
+from psycopg import AsyncConnection, sql
+from psycopg.rows import DictRow, dict_row
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
+
+from db import DB_POOL_TIMEOUT_SECONDS, DatabasePoolTimeout
+
+# .env 파일 로드
+_ = load_dotenv(".env")
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+ASYNC_DB_POOL_MIN_CONN = int(os.getenv("ASYNC_DB_POOL_MIN_CONN", "1"))
+ASYNC_DB_POOL_MAX_CONN = int(os.getenv("ASYNC_DB_POOL_MAX_CONN", "8"))
+
+USER_COLUMNS = "id, email, nickname, role, status, provider, provider_user_id, email_verified, avatar_url, bio, token_version, created_at"
+
+_async_db_pool: Optional[AsyncConnectionPool[AsyncConnection[DictRow]]] = None
+
+if not DATABASE_URL:
+    raise ValueError("DATABASE_URL is not set. Please check server/.env file")
+
+
+async def open_async_db_pool() -> None:
+    """이벤트 루프에서 사용할 비동기 커넥션 풀 생성"""
+    global _async_db_pool
+
+    if _async_db_pool is not None:
+        return
+    pool = AsyncConnectionPool(
+        conninfo=DATABASE_URL or "",
+        connection_class=AsyncConnection[DictRow],
+        kwargs={"row_factory": dict_row},
+        min_size=ASYNC_DB_POOL_MIN_CONN,
+        max_size=ASYNC_DB_POOL_MAX_CONN,
+        timeout=DB_POOL_TIMEOUT_SECONDS,
+        open=False,
+    )
+    await pool.open()
+    _async_db_pool = pool
+
+
+async def close_async_db_pool() -> None:
+    global _async_db_pool
+
+    if _async_db_pool is None:
+        return
+    pool = _async_db_pool
+    _async_db_pool = None
+    await pool.close()
+
+
+@asynccontextmanager
+async def get_async_db_connection() -> AsyncIterator[AsyncConnection[DictRow]]:
+    """비동기 데이터베이스 연결 컨텍스트 매니저"""
+    if _async_db_pool is None:
+        await open_async_db_pool()
+    assert _async_db_pool is not None
+
+    try:
+        async with _async_db_pool.connection() as conn:
+            yield conn
+    except PoolTimeout as error:
+        raise DatabasePoolTimeout(str(error)) from error
+
+
+async def get_user_by_id(user_id: str) -> Optional[DictRow]:
+    """ID로 사용자 조회"""
+    async with get_async_db_connection() as conn:
+        async with conn.cursor() as cur:
+            _ = await cur.execute(
+                f"SELECT {USER_COLUMNS} FROM users WHERE id = %s",
+                (user_id,),
+            )
+            return await cur.fetchone()
+
+
+async def get_user_by_nickname(nickname: str) -> Optional[DictRow]:
+    """닉네임으로 사용자 조회"""
+    async with get_async_db_connection() as conn:
+        async with conn.cursor() as cur:
+            _ = await cur.execute(
+                f"SELECT {USER_COLUMNS} FROM users WHERE nickname = %s",
+                (nickname,),
+            )
+            return await cur.fetchone()
+
+
+async def update_user_profile(
+    user_id: str, updates: dict[str, object]
+) -> Optional[DictRow]:
+    allowed_fields = ["nickname", "bio", "avatar_url"]
+    fields_to_update: list[sql.Composable] = []
+    params: list[object] = []
+
+    for field in allowed_fields:
+        if field in updates:
+            fields_to_update.append(sql.SQL("{} = %s").format(sql.Identifier(field)))
+            params.append(updates[field])
+
+    if not fields_to_update:
+        return None
+
+    query = sql.SQL(
+        """
+        UPDATE users
+        SET {}, updated_at = NOW()
+        WHERE id = %s
+        RETURNING """
+        + USER_COLUMNS
+    ).format(sql.SQL(", ").join(fields_to_update))
+    params.append(user_id)
+
+    async with get_async_db_connection() as conn:
+        async with conn.cursor() as cur:
+            _ = await cur.execute(query, params)
+            updated = await cur.fetchone()
+            await conn.commit()
+            return updated
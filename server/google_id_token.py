@@ -0,0 +1,138 @@
+# pyright: reportDeprecated=false
+
+import re
+import time
+from typing import Callable, Mapping, Optional, cast
+
+from jose import JWTError, jwt
+
+from http_client import request_json_with_headers
+
+GOOGLE_JWKS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+GOOGLE_ID_TOKEN_ISSUERS = ["accounts.google.com", "https://accounts.google.com"]
+GOOGLE_ID_TOKEN_ALGORITHM = "RS256"
+# 서버 간 시계 오차 허용 (exp/iat 검사)
+GOOGLE_ID_TOKEN_LEEWAY_SECONDS = 60
+# Cache-Control이 없을 때의 키 캐시 시간
+GOOGLE_JWKS_DEFAULT_MAX_AGE_SECONDS = 3600
+# 모르는 kid로 인한 재조회 최소 간격 (위조 토큰으로 키 조회를 반복시키지 않도록)
+GOOGLE_JWKS_MIN_REFRESH_INTERVAL_SECONDS = 60
+
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+class InvalidGoogleIdToken(Exception):
+    """서명, aud, iss, exp 중 하나라도 맞지 않는 id_token"""
+
+
+def parse_cache_max_age(cache_control: Optional[str]) -> Optional[int]:
+    if not cache_control:
+        return None
+    match = _MAX_AGE_PATTERN.search(cache_control)
+    return int(match.group(1)) if match else None
+
+
+class GoogleJWKSCache:
+    """Google 서명 키(JWKS)를 Cache-Control max-age 동안 메모리에 보관"""
+
+    def __init__(
+        self, url: str = GOOGLE_JWKS_URL, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.url: str = url
+        self._clock: Callable[[], float] = clock
+        self._keys: dict[str, dict[str, object]] = {}
+        self._expires_at: float = 0.0
+        self._fetched_at: Optional[float] = None
+        self._fetch_total: int = 0
+
+    def set_keys(
+        self,
+        jwks: Mapping[str, object],
+        max_age: float = GOOGLE_JWKS_DEFAULT_MAX_AGE_SECONDS,
+    ) -> None:
+        """키 집합 교체 (조회 결과 반영, 테스트에서 고정 키 주입)"""
+        raw_keys = jwks.get("keys")
+        keys: dict[str, dict[str, object]] = {}
+        if isinstance(raw_keys, list):
+            for raw_key in cast(list[object], raw_keys):
+                if isinstance(raw_key, dict):
+                    key = cast(dict[str, object], raw_key)
+                    kid = key.get("kid")
+                    if isinstance(kid, str) and kid:
+                        keys[kid] = key
+        now = self._clock()
+        self._keys = keys
+        self._fetched_at = now
+        self._expires_at = now + max_age
+
+    async def refresh(self) -> None:
+        payload, headers = await request_json_with_headers("GET", self.url)
+        max_age = parse_cache_max_age(headers.get("cache-control"))
+        self._fetch_total += 1
+        self.set_keys(
+            payload,
+            max_age=GOOGLE_JWKS_DEFAULT_MAX_AGE_SECONDS if max_age is None else max_age,
+        )
+
+    async def get_key(self, kid: str) -> Optional[dict[str, object]]:
+        now = self._clock()
+        if now >= self._expires_at:
+            await self.refresh()
+        elif kid not in self._keys and (
+            self._fetched_at is None
+            or now - self._fetched_at >= GOOGLE_JWKS_MIN_REFRESH_INTERVAL_SECONDS
+        ):
+            # 키 교체 직후에는 새 kid가 캐시에 없을 수 있다
+            await self.refresh()
+        return self._keys.get(kid)
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "keys": len(self._keys),
+            "fetch_total": self._fetch_total,
+            "expires_in_seconds": max(0.0, round(self._expires_at - self._clock(), 1)),
+        }
+
+
+google_jwks_cache = GoogleJWKSCache()
+
+
+async def verify_google_id_token(
+    id_token: str,
+    client_id: str,
+    jwks_cache: Optional[GoogleJWKSCache] = None,
+    access_token: Optional[str] = None,
+) -> dict[str, object]:
+    """id_token 서명을 캐시된 JWKS로 검증하고 aud, iss, exp를 확인한 클레임 반환
+
+    인가 코드 교환으로 받은 id_token에는 at_hash가 들어 있으므로 함께 받은
+    access_token을 넘겨야 검증된다.
+    키 조회 실패는 http_client.OutboundHTTPError로 그대로 올라간다.
+    """
+    cache = jwks_cache or google_jwks_cache
+    try:
+        header = jwt.get_unverified_header(id_token)
+    except JWTError as error:
+        raise InvalidGoogleIdToken("malformed id_token") from error
+
+    kid = header.get("kid")
+    if header.get("alg") != GOOGLE_ID_TOKEN_ALGORITHM or not isinstance(kid, str):
+        raise InvalidGoogleIdToken("unsupported id_token header")
+
+    key = await cache.get_key(kid)
+    if key is None:
+        raise InvalidGoogleIdToken(f"unknown signing key kid={kid}")
+
+    try:
+        claims = jwt.decode(
+            id_token,
+            key,
+            algorithms=[GOOGLE_ID_TOKEN_ALGORITHM],
+            audience=client_id,
+            issuer=GOOGLE_ID_TOKEN_ISSUERS,
+            access_token=access_token,
+            options={"leeway": GOOGLE_ID_TOKEN_LEEWAY_SECONDS},
+        )
+    except JWTError as error:
+        raise InvalidGoogleIdToken(str(error)) from error
+    return cast(dict[str, object], claims)
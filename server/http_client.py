@@ -0,0 +1,130 @@
+# pyright: reportDeprecated=false
+
+import asyncio
+import importlib.util
+import os
+import random
+from typing import Mapping, Optional, cast
+
+import httpx
+
+# 외부 API 호출 단계별 제한 시간 (연결, 응답 대기, 요청 전송, 풀 대기)
+OUTBOUND_HTTP_TIMEOUT = httpx.Timeout(
+    connect=float(os.getenv("OUTBOUND_HTTP_CONNECT_TIMEOUT_SECONDS", "3")),
+    read=float(os.getenv("OUTBOUND_HTTP_READ_TIMEOUT_SECONDS", "5")),
+    write=3.0,
+    pool=2.0,
+)
+OUTBOUND_HTTP_MAX_CONNECTIONS = int(os.getenv("OUTBOUND_HTTP_MAX_CONNECTIONS", "20"))
+OUTBOUND_HTTP_RETRIES = 2
+OUTBOUND_HTTP_BACKOFF_SECONDS = 0.2
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+class OutboundHTTPError(Exception):
+    """외부 API 호출 실패 (재시도 후에도 실패했거나 JSON 객체가 아닌 응답)"""
+
+
+def _http2_available() -> bool:
+    # httpx의 HTTP/2는 h2 패키지가 있을 때만 켤 수 있다
+    return importlib.util.find_spec("h2") is not None
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=_http2_available(),
+        timeout=OUTBOUND_HTTP_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=OUTBOUND_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=OUTBOUND_HTTP_MAX_CONNECTIONS,
+            keepalive_expiry=60.0,
+        ),
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """keep-alive 연결을 재사용하는 공유 비동기 HTTP 클라이언트"""
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        _http_client = _create_http_client()
+    return _http_client
+
+
+async def close_http_client() -> None:
+    global _http_client
+
+    if _http_client is None:
+        return
+    client = _http_client
+    _http_client = None
+    await client.aclose()
+
+
+def _retry_delay(attempt: int) -> float:
+    # full jitter: 0 ~ base * 2^attempt 사이에서 무작위로 기다린다
+    return random.uniform(0, OUTBOUND_HTTP_BACKOFF_SECONDS * (2**attempt))
+
+
+async def request_json(
+    method: str,
+    url: str,
+    *,
+    data: Optional[Mapping[str, str]] = None,
+    params: Optional[Mapping[str, str]] = None,
+    retries: int = OUTBOUND_HTTP_RETRIES,
+) -> dict[str, object]:
+    """JSON 객체를 돌려주는 외부 API 호출"""
+    payload, _ = await request_json_with_headers(
+        method, url, data=data, params=params, retries=retries
+    )
+    return payload
+
+
+async def request_json_with_headers(
+    method: str,
+    url: str,
+    *,
+    data: Optional[Mapping[str, str]] = None,
+    params: Optional[Mapping[str, str]] = None,
+    retries: int = OUTBOUND_HTTP_RETRIES,
+) -> tuple[dict[str, object], httpx.Headers]:
+    """외부 API 호출 후 (JSON 객체, 응답 헤더) 반환 (일시적 오류는 지터를 두고 재시도)
+
+    POST는 요청이 서버에 닿지 않은 연결 단계 오류만 재시도한다.
+    (OAuth 인가 코드처럼 한 번만 쓸 수 있는 값을 두 번 보내지 않기 위해)
+    """
+    idempotent = method.upper() in {"GET", "HEAD"}
+    attempt = 0
+    while True:
+        try:
+            response = await get_http_client().request(
+                method, url, data=data, params=params
+            )
+        except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as error:
+            if attempt >= retries:
+                raise OutboundHTTPError(f"{method} {url} failed: {error}") from error
+        except httpx.TransportError as error:
+            if not idempotent or attempt >= retries:
+                raise OutboundHTTPError(f"{method} {url} failed: {error}") from error
+        else:
+            retryable = response.status_code in RETRYABLE_STATUS_CODES
+            if not (retryable and idempotent and attempt < retries):
+                if response.is_error:
+                    raise OutboundHTTPError(
+                        f"{method} {url} returned status={response.status_code}"
+                    )
+                try:
+                    payload = cast(object, response.json())
+                except ValueError as error:
+                    raise OutboundHTTPError(
+                        f"{method} {url} returned non-JSON body"
+                    ) from error
+                if not isinstance(payload, dict):
+                    raise OutboundHTTPError(f"{method} {url} returned non-object body")
+                return cast(dict[str, object], payload), response.headers
+
+        await asyncio.sleep(_retry_delay(attempt))
+        attempt += 1
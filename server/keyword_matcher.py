@@ -0,0 +1,270 @@
+# pyright: reportDeprecated=false
+
+from collections import deque
+from typing import Iterable, Iterator, Mapping, NamedTuple, Optional
+
+
+class KeywordMatch(NamedTuple):
+    keyword: str
+    category: str
+    start: int
+    end: int
+
+
+class KeywordMatcher:
+    """Aho-Corasick 기반 다중 금칙어 매처 (텍스트 길이에 선형)"""
+
+    def __init__(self, keywords: Iterable[tuple[str, str]]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # 노드에서 끝나는 금칙어 인덱스 (-1이면 없음)
+        self._terminal: list[int] = [-1]
+        # 실패 링크를 따라 처음 만나는 종료 노드 (0이면 없음)
+        self._dict_link: list[int] = [0]
+        self._keywords: list[tuple[str, str]] = []
+
+        for keyword, category in keywords:
+            if keyword:
+                self._add(keyword, category)
+        self._build_links()
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def _add(self, keyword: str, category: str) -> None:
+        node = 0
+        for char in keyword:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._terminal.append(-1)
+                self._dict_link.append(0)
+            node = next_node
+        # 같은 금칙어가 여러 분류에 있으면 먼저 등록된 분류를 유지한다
+        if self._terminal[node] == -1:
+            self._terminal[node] = len(self._keywords)
+            self._keywords.append((keyword, category))
+
+    def _build_links(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                fail_node = self._goto[fallback].get(char, 0)
+                if fail_node == child:
+                    fail_node = 0
+                self._fail[child] = fail_node
+                self._dict_link[child] = (
+                    fail_node
+                    if self._terminal[fail_node] != -1
+                    else self._dict_link[fail_node]
+                )
+                queue.append(child)
+
+    def advance(self, node: int, char: str) -> int:
+        """상태 node에서 문자 하나를 읽은 다음 상태"""
+        while node and char not in self._goto[node]:
+            node = self._fail[node]
+        return self._goto[node].get(char, 0)
+
+    def outputs(self, node: int) -> Iterator[tuple[str, str]]:
+        """상태 node에서 끝나는 (금칙어, 분류) 전부 (긴 것부터)"""
+        match_node = node if self._terminal[node] != -1 else self._dict_link[node]
+        while match_node:
+            yield self._keywords[self._terminal[match_node]]
+            match_node = self._dict_link[match_node]
+
+    def output(self, node: int) -> Optional[tuple[str, str]]:
+        """상태 node에서 끝나는 (금칙어, 분류) 하나"""
+        match_node = node if self._terminal[node] != -1 else self._dict_link[node]
+        if not match_node:
+            return None
+        return self._keywords[self._terminal[match_node]]
+
+    def _match_at(self, node: int, end: int) -> KeywordMatch:
+        keyword, category = self._keywords[self._terminal[node]]
+        return KeywordMatch(keyword, category, end - len(keyword), end)
+
+    def find_first(self, text: str) -> Optional[KeywordMatch]:
+        """가장 먼저 끝나는 금칙어 하나를 반환"""
+        node = 0
+        for index, char in enumerate(text):
+            node = self.advance(node, char)
+            match_node = node if self._terminal[node] != -1 else self._dict_link[node]
+            if match_node:
+                return self._match_at(match_node, index + 1)
+        return None
+
+    def find_all(self, text: str) -> list[KeywordMatch]:
+        """겹치는 경우를 포함한 모든 금칙어 위치"""
+        matches: list[KeywordMatch] = []
+        node = 0
+        for index, char in enumerate(text):
+            node = self.advance(node, char)
+            match_node = node if self._terminal[node] != -1 else self._dict_link[node]
+            while match_node:
+                matches.append(self._match_at(match_node, index + 1))
+                match_node = self._dict_link[match_node]
+        return matches
+
+
+HANGUL_SYLLABLE_FIRST = 0xAC00
+HANGUL_SYLLABLE_LAST = 0xD7A3
+CHOSEONG_FIRST = 0x1100
+CHOSEONG_LAST = 0x1112
+JUNGSEONG_FIRST = 0x1161
+JUNGSEONG_LAST = 0x11A7
+JONGSEONG_FIRST = 0x11A8
+JONGSEONG_LAST = 0x11C2
+# 소리 없는 초성 ㅇ - 전체 패턴에서는 무시해 '십알'과 '시발'을 같게 본다
+SILENT_CHOSEONG = "\u110b"
+# 종성(받침) -> 같은 소리의 초성 (겹받침은 둘로 분리)
+JONGSEONG_AS_CHOSEONG = (
+    "",
+    "\u1100",
+    "\u1101",
+    "\u1100\u1109",
+    "\u1102",
+    "\u1102\u110c",
+    "\u1102\u1112",
+    "\u1103",
+    "\u1105",
+    "\u1105\u1100",
+    "\u1105\u1106",
+    "\u1105\u1107",
+    "\u1105\u1109",
+    "\u1105\u1110",
+    "\u1105\u1111",
+    "\u1105\u1112",
+    "\u1106",
+    "\u1107",
+    "\u1107\u1109",
+    "\u1109",
+    "\u110a",
+    "\u110b",
+    "\u110c",
+    "\u110e",
+    "\u110f",
+    "\u1110",
+    "\u1111",
+    "\u1112",
+)
+
+
+def decompose_hangul(char: str) -> tuple[str, str]:
+    """문자 하나를 (전체 자모열, 초성 매칭용 기호열)로 분해
+
+    NFKC 정규화 후의 문자를 기준으로 하므로 호환 자모(ㅅ)는 이미
+    조합형 초성(U+1109)으로 바뀌어 들어온다.
+    초성 매칭용 기호열은 직접 입력한 자음(낱자)만 초성으로 내보낸다. 완성된 음절은
+    음절 그대로 돌려줘 자음 낱자 연속이 끊기게 한다. ('서버'가 ㅅㅂ에 걸리지 않도록)
+    """
+    code = ord(char)
+    if HANGUL_SYLLABLE_FIRST <= code <= HANGUL_SYLLABLE_LAST:
+        offset = code - HANGUL_SYLLABLE_FIRST
+        choseong = chr(CHOSEONG_FIRST + offset // 588)
+        jungseong = chr(JUNGSEONG_FIRST + (offset % 588) // 28)
+        jongseong = JONGSEONG_AS_CHOSEONG[offset % 28]
+        full = ("" if choseong == SILENT_CHOSEONG else choseong) + jungseong + jongseong
+        return full, char
+    if CHOSEONG_FIRST <= code <= CHOSEONG_LAST:
+        return ("" if char == SILENT_CHOSEONG else char), char
+    if JUNGSEONG_FIRST <= code <= JUNGSEONG_LAST:
+        return char, char
+    if JONGSEONG_FIRST <= code <= JONGSEONG_LAST:
+        mapped = JONGSEONG_AS_CHOSEONG[code - JONGSEONG_FIRST + 1]
+        return mapped, mapped
+    return char, char
+
+
+def is_choseong_pattern(keyword: str) -> bool:
+    return bool(keyword) and all(
+        CHOSEONG_FIRST <= ord(char) <= CHOSEONG_LAST for char in keyword
+    )
+
+
+class HangulKeywordMatcher:
+    """자모 단위로 분해한 텍스트에서 전체/초성 금칙어를 한 번에 찾는 매처
+
+    - 전체 패턴(예: 도박)은 음절을 자모로 풀어 비교하므로 'ㄷㅗ박',
+      '돕악' 같은 음절 쪼개기 변형도 잡는다. 단 음절 경계에서 시작해 음절
+      경계에서 끝나야 하므로 '대만'(대마+ㄴ)이나 '도바기'(도박이 '기'에 걸침)는
+      걸리지 않는다. 받침이 다른 표기는 금칙어나 spellings에 따로 적어야 한다.
+    - 초성으로만 된 패턴(예: ㅅㅂ)은 직접 입력한 자음 낱자가 이어진 부분과
+      비교한다. 완성 음절은 spellings에 적힌 표기(예: 시발, 씨발)일 때만 그 초성
+      금칙어로 본다. 음절 초성을 모두 비교하면 '서버', '소비자' 같은 일반 단어가 걸린다.
+    """
+
+    def __init__(
+        self,
+        keywords: Iterable[tuple[str, str]],
+        spellings: Optional[Mapping[str, Iterable[str]]] = None,
+    ) -> None:
+        full_patterns: list[tuple[str, str]] = []
+        choseong_patterns: list[tuple[str, str]] = []
+        # 자모 패턴 -> (원래 금칙어, 분류), 먼저 등록된 분류 유지
+        self._full_keywords: dict[str, tuple[str, str]] = {}
+        self._choseong_keywords: dict[str, tuple[str, str]] = {}
+
+        for keyword, category in keywords:
+            if is_choseong_pattern(keyword):
+                if keyword not in self._choseong_keywords:
+                    self._choseong_keywords[keyword] = (keyword, category)
+                    choseong_patterns.append((keyword, category))
+                # 허용된 완성 음절 표기는 전체 패턴으로 찾고 초성 금칙어로 보고한다
+                forms = spellings.get(keyword, ()) if spellings else ()
+            else:
+                forms = (keyword,)
+            for form in forms:
+                pattern = "".join(decompose_hangul(char)[0] for char in form)
+                if pattern and pattern not in self._full_keywords:
+                    self._full_keywords[pattern] = (keyword, category)
+                    full_patterns.append((pattern, category))
+
+        self._full: KeywordMatcher = KeywordMatcher(full_patterns)
+        self._choseong: KeywordMatcher = KeywordMatcher(choseong_patterns)
+
+    def __len__(self) -> int:
+        return len(self._full) + len(self._choseong)
+
+    def find_first(self, text: str) -> Optional[KeywordMatch]:
+        """텍스트를 한 번 훑으며 전체 자모열과 자음 낱자열을 함께 검사"""
+        full_node = 0
+        choseong_node = 0
+        # 자모열 위치 -> 원문 위치, 그 자모가 원문 문자의 첫 자모인지
+        full_sources: list[int] = []
+        full_starts: list[bool] = []
+        choseong_sources: list[int] = []
+
+        for index, char in enumerate(text):
+            full_symbols, choseong_symbols = decompose_hangul(char)
+            last = len(full_symbols) - 1
+            for offset, symbol in enumerate(full_symbols):
+                full_sources.append(index)
+                full_starts.append(offset == 0)
+                full_node = self._full.advance(full_node, symbol)
+                if offset != last:
+                    continue
+                for pattern, _ in self._full.outputs(full_node):
+                    start = len(full_sources) - len(pattern)
+                    if not full_starts[start]:
+                        continue
+                    keyword, category = self._full_keywords[pattern]
+                    return KeywordMatch(
+                        keyword, category, full_sources[start], index + 1
+                    )
+            for symbol in choseong_symbols:
+                choseong_sources.append(index)
+                choseong_node = self._choseong.advance(choseong_node, symbol)
+                found = self._choseong.output(choseong_node)
+                if found:
+                    keyword, category = self._choseong_keywords[found[0]]
+                    start = choseong_sources[len(choseong_sources) - len(found[0])]
+                    return KeywordMatch(keyword, category, start, index + 1)
+        return None
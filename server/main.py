@@ -1,36 +1,57 @@
 # pyright: reportUnknownVariableType=false, reportUnknownArgumentType=false, reportUnknownMemberType=false, reportUnknownParameterType=false, reportUnknownLambdaType=false, reportCallInDefaultInitializer=false, reportDeprecated=false
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Header, Query
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse, Response
 from fastapi.security import OAuth2PasswordBearer
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request as StarletteRequest
 from pydantic import BaseModel
-from typing import Optional, Mapping, Protocol, Sequence, TypedDict, cast
-from datetime import timedelta
+from typing import Callable, Iterable, Optional, Mapping, Sequence, TypedDict, cast
+from datetime import datetime, timedelta
 import asyncio
+import base64
+import gzip
 import re
 import unicodedata
 import time
 import os
 import json
+import math
 import secrets
+import socket
+import uuid
 from urllib.parse import urlparse, urlencode, quote
-from urllib.request import Request, urlopen
-from threading import Lock
+from threading import Event, Lock
 from contextlib import asynccontextmanager, suppress
-from collections import deque
+from functools import cache
+from collections import OrderedDict, deque
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+)
 
 from db import (
-    init_db,
+    DATABASE_URL,
+    DatabasePoolTimeout,
+    get_db_pool_stats,
     get_projects,
     get_project,
     create_project,
-    like_project,
-    unlike_project,
-    get_comments,
+    get_project_like_count,
+    add_project_like,
+    apply_project_like_deltas,
+    reconcile_project_like_counts,
+    reconcile_drifted_project_like_counts,
+    remove_project_like,
+    get_liked_project_ids,
+    get_comment_replies,
+    get_comment_threads,
     create_comment,
-    report_comment,
+    create_report,
     get_reports,
     get_reports_count,
     update_report,
@@ -40,7 +61,6 @@ from db import (
     get_user_by_provider,
     get_user_by_nickname,
     get_user_by_id,
-    update_user_profile,
     get_user_projects,
     get_admin_projects,
     update_project_admin,
@@ -48,7 +68,10 @@ from db import (
     set_project_status,
     create_admin_action_log,
     get_admin_action_logs,
-    cleanup_admin_action_logs,
+    get_admin_action_log_retention_cutoff,
+    delete_admin_action_logs_batch,
+    drop_expired_admin_action_log_partitions,
+    ensure_admin_action_log_partitions,
     get_latest_policy_update_action,
     get_admin_users,
     limit_user,
@@ -63,16 +86,57 @@ from db import (
     approve_user,
     reject_user,
     get_moderation_settings,
+    get_moderation_settings_updated_at,
     update_moderation_settings,
+    create_moderation_sweep,
+    get_latest_moderation_sweep,
+    claim_stale_moderation_sweep,
+    revert_moderation_sweep,
+    iter_moderation_sweep_batches,
+    apply_moderation_sweep_batch,
+    advance_moderation_sweep_phase,
+    finish_moderation_sweep,
     get_oauth_runtime_settings,
     update_oauth_runtime_settings,
     create_oauth_state_token,
     consume_oauth_state_token,
     cleanup_oauth_state_tokens,
+    consume_rate_limit_token,
+    cleanup_rate_limit_buckets,
+    acquire_maintenance_lease,
+    release_maintenance_lease,
+    record_maintenance_run_started,
+    record_maintenance_run_progress,
+    record_maintenance_run_finished,
+    get_maintenance_lease,
     get_site_content,
     upsert_site_content,
 )
+from db_async import (
+    open_async_db_pool,
+    close_async_db_pool,
+    get_user_by_id as get_user_by_id_async,
+    get_user_by_nickname as get_user_by_nickname_async,
+    update_user_profile as update_user_profile_async,
+)
+from google_id_token import (
+    InvalidGoogleIdToken,
+    google_jwks_cache,
+    verify_google_id_token,
+)
+from http_client import OutboundHTTPError, close_http_client, request_json
+from cache_bus import CacheInvalidationBus
+from keyword_matcher import HangulKeywordMatcher, KeywordMatch
+from migrations import run_migrations
+from rate_limit import (
+    InMemoryRateLimiter,
+    RateLimitPolicy,
+    RateLimiter,
+    SharedRateLimiter,
+)
 from auth import (
+    PasswordHasherBusy,
+    password_hash_pool,
     verify_password,
     get_password_hash,
     create_access_token,
@@ -93,54 +157,531 @@ async def lifespan(app: FastAPI):
 app = FastAPI(title="VibeCoder Playground API", lifespan=lifespan)
 
 PROJECT_LIST_CACHE_TTL_SECONDS = 12.0
+PROJECT_LIST_CACHE_STALE_TTL_SECONDS = 60.0
+PROJECT_LIST_REFRESH_WORKERS = 2
+PROJECT_LIST_DEFAULT_LIMIT = 24
+PROJECT_LIST_MAX_LIMIT = 100
+COMMENT_PAGE_DEFAULT_LIMIT = 20
+COMMENT_PAGE_MAX_LIMIT = 100
+COMMENT_REPLIES_DEFAULT_LIMIT = 3
+COMMENT_REPLIES_MAX_LIMIT = 50
+PROJECT_LIST_INFLIGHT_WAIT_SECONDS = 10.0
+PROJECT_LIST_GZIP_MIN_BYTES = 1024
 PROJECT_PERF_WINDOW_SIZE = 300
+PROJECT_LIKE_FLUSH_INTERVAL_SECONDS = 0.5
+PROJECT_LIKE_FLUSH_MAX_EVENTS = 200
+ProjectCacheKey = tuple[str, Optional[str], Optional[str], int]
+# (원본 JSON 바이트, gzip 바이트) - gzip은 최소 크기 미만이면 None
+EncodedProjectPage = tuple[bytes, Optional[bytes]]
 _project_list_cache: dict[
-    tuple[str, Optional[str], Optional[str]], tuple[float, list[dict[str, object]]]
+    ProjectCacheKey,
+    tuple[
+        float,
+        float,
+        list[dict[str, object]],
+        Optional[str],
+        Optional[EncodedProjectPage],
+    ],
 ] = {}
 _project_list_cache_lock = Lock()
-_project_perf_samples: deque[tuple[float, float, int]] = deque(
+_project_list_cache_generation = 0
+_project_list_refreshing: set[ProjectCacheKey] = set()
+_project_list_refresh_executor: Optional[ThreadPoolExecutor] = None
+_project_list_inflight: dict[ProjectCacheKey, Future[EncodedProjectPage]] = {}
+_project_perf_samples: deque[tuple[float, float, int, int]] = deque(
     maxlen=PROJECT_PERF_WINDOW_SIZE
 )
 _project_perf_lock = Lock()
+_project_coalesced_total = 0
+_project_stale_served_total = 0
+_project_background_refresh_total = 0
 
 
 def _project_cache_key(
-    sort: str, platform: Optional[str], tag: Optional[str]
-) -> tuple[str, Optional[str], Optional[str]]:
-    return (sort, platform, tag)
+    sort: str, platform: Optional[str], tag: Optional[str], limit: int
+) -> ProjectCacheKey:
+    return (sort, platform, tag, limit)
+
+
+def _encode_project_page(
+    items: Sequence[Mapping[str, object]],
+    next_cursor: Optional[str],
+    compress: bool = True,
+) -> EncodedProjectPage:
+    payload = {"items": list(items), "next_cursor": next_cursor}
+    body = json.dumps(
+        jsonable_encoder(payload),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    gzip_body = (
+        gzip.compress(body)
+        if compress and len(body) >= PROJECT_LIST_GZIP_MIN_BYTES
+        else None
+    )
+    return body, gzip_body
+
+
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Accept-Encoding에서 gzip의 q 값이 0보다 큰지 (gzip이 없으면 * 항목을 따른다)"""
+    qualities: dict[str, float] = {}
+    for entry in (accept_encoding or "").lower().split(","):
+        coding, _, params = entry.partition(";")
+        coding = coding.strip()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+def _project_page_response(
+    encoded: EncodedProjectPage, accept_encoding: Optional[str]
+) -> Response:
+    body, gzip_body = encoded
+    # 같은 URL이 Accept-Encoding에 따라 달라지므로 두 표현 모두 Vary를 보낸다
+    headers = {"Vary": "Accept-Encoding"}
+    if gzip_body is not None and _accepts_gzip(accept_encoding):
+        return Response(
+            content=gzip_body,
+            media_type="application/json",
+            headers={**headers, "Content-Encoding": "gzip"},
+        )
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
-def _get_cached_projects(
-    sort: str, platform: Optional[str], tag: Optional[str]
-) -> Optional[list[dict[str, object]]]:
+def _get_cached_project_page(
+    sort: str, platform: Optional[str], tag: Optional[str], limit: int
+) -> Optional[EncodedProjectPage]:
+    """soft TTL 이내면 그대로, soft~hard TTL 사이면 stale 본문을 반환하고 백그라운드 갱신을 예약한다."""
+    global _project_stale_served_total
     now = time.perf_counter()
-    key = _project_cache_key(sort, platform, tag)
+    key = _project_cache_key(sort, platform, tag, limit)
     with _project_list_cache_lock:
         cached = _project_list_cache.get(key)
         if not cached:
             return None
-        expires_at, items = cached
-        if expires_at <= now:
+        fresh_until, stale_until, items, next_cursor, encoded = cached
+        if stale_until <= now:
             _ = _project_list_cache.pop(key, None)
             return None
-        return [dict(item) for item in items]
+        is_stale = fresh_until <= now
+        should_refresh = is_stale and key not in _project_list_refreshing
+        if should_refresh:
+            _project_list_refreshing.add(key)
+
+    if encoded is None:
+        # 제자리 패치된 항목은 다음 조회에서 한 번만 다시 인코딩한다.
+        encoded = _encode_project_page(items, next_cursor)
+        with _project_list_cache_lock:
+            if _project_list_cache.get(key) is cached:
+                _project_list_cache[key] = (
+                    fresh_until,
+                    stale_until,
+                    items,
+                    next_cursor,
+                    encoded,
+                )
+    if is_stale:
+        with _project_perf_lock:
+            _project_stale_served_total += 1
+    if should_refresh:
+        _schedule_project_refresh(key)
+    return encoded
 
 
 def _set_cached_projects(
     sort: str,
     platform: Optional[str],
     tag: Optional[str],
+    limit: int,
     items: Sequence[Mapping[str, object]],
+    next_cursor: Optional[str],
+    generation: Optional[int] = None,
+    encoded: Optional[EncodedProjectPage] = None,
 ) -> None:
-    key = _project_cache_key(sort, platform, tag)
-    expires_at = time.perf_counter() + PROJECT_LIST_CACHE_TTL_SECONDS
+    key = _project_cache_key(sort, platform, tag, limit)
+    if encoded is None:
+        encoded = _encode_project_page(items, next_cursor)
+    now = time.perf_counter()
     with _project_list_cache_lock:
-        _project_list_cache[key] = (expires_at, [dict(item) for item in items])
+        # 조회 도중 무효화가 일어났다면 변경 이전 결과를 다시 캐시하지 않는다.
+        if generation is not None and generation != _project_list_cache_generation:
+            return
+        _project_list_cache[key] = (
+            now + PROJECT_LIST_CACHE_TTL_SECONDS,
+            now + PROJECT_LIST_CACHE_STALE_TTL_SECONDS,
+            [dict(item) for item in items],
+            next_cursor,
+            encoded,
+        )
 
 
-def _invalidate_projects_cache() -> None:
+def _invalidate_projects_cache(broadcast: bool = True) -> None:
+    global _project_list_cache_generation
     with _project_list_cache_lock:
         _project_list_cache.clear()
+        _project_list_cache_generation += 1
+    if broadcast:
+        _cache_bus.publish("projects")
+
+
+def _project_sort_key(sort: str, row: Mapping[str, object]) -> tuple[float, str]:
+    if sort == "popular":
+        like_count = row.get("like_count")
+        return (
+            float(like_count) if isinstance(like_count, int) else 0.0,
+            str(row["id"]),
+        )
+    created_at = row.get("created_at")
+    return (
+        created_at.timestamp() if isinstance(created_at, datetime) else 0.0,
+        str(row["id"]),
+    )
+
+
+def _project_matches_cache_key(
+    key: ProjectCacheKey, project: Mapping[str, object]
+) -> bool:
+    _, platform, tag, _ = key
+    if project.get("status") != "published":
+        return False
+    if platform and str(project.get("platform") or "").lower() != platform.lower():
+        return False
+    if tag:
+        tags = project.get("tags")
+        if not isinstance(tags, list):
+            return False
+        if tag.lower() not in {str(item).lower() for item in cast(list[object], tags)}:
+            return False
+    return True
+
+
+def _find_cached_project(
+    items: Sequence[Mapping[str, object]], project_id: str
+) -> Optional[int]:
+    for index, item in enumerate(items):
+        if str(item.get("id")) == project_id:
+            return index
+    return None
+
+
+def _reorder_cached_page(
+    sort: str,
+    items: list[dict[str, object]],
+    next_cursor: Optional[str],
+    boundary: Optional[tuple[float, str]],
+) -> Optional[tuple[list[dict[str, object]], Optional[str]]]:
+    ordered = sorted(items, key=lambda row: _project_sort_key(sort, row), reverse=True)
+    if next_cursor is None or boundary is None:
+        return ordered, next_cursor
+    if not ordered or _project_sort_key(sort, ordered[-1]) < boundary:
+        # 페이지 마지막 행이 뒤로 밀리면 페이지 밖 행과의 순서를 알 수 없어 키를 버린다.
+        return None
+    return ordered, _encode_project_cursor(sort, ordered[-1])
+
+
+def _apply_project_cache_change(
+    project: Mapping[str, object], broadcast: bool = True
+) -> None:
+    """프로젝트 생성/수정/상태 변경을 그 프로젝트가 걸리는 캐시 키에만 반영한다."""
+    global _project_list_cache_generation
+    project_id = str(project["id"])
+    with _project_list_cache_lock:
+        _project_list_cache_generation += 1
+        for key, cached in list(_project_list_cache.items()):
+            fresh_until, stale_until, items, next_cursor, _ = cached
+            sort, _, _, limit = key
+            index = _find_cached_project(items, project_id)
+            matches = _project_matches_cache_key(key, project)
+            if index is None and not matches:
+                continue
+
+            boundary = _project_sort_key(sort, items[-1]) if items else None
+            if index is None:
+                if (
+                    next_cursor is not None
+                    and boundary is not None
+                    and _project_sort_key(sort, project) < boundary
+                ):
+                    continue
+                if (
+                    next_cursor is not None
+                    or len(items) >= limit
+                    or "author_nickname" not in project
+                ):
+                    del _project_list_cache[key]
+                    continue
+                updated_items = [*items, dict(project)]
+            elif not matches:
+                if next_cursor is not None:
+                    del _project_list_cache[key]
+                    continue
+                updated_items = items[:index] + items[index + 1 :]
+            else:
+                updated_items = list(items)
+                updated_items[index] = {**items[index], **project}
+
+            page = _reorder_cached_page(sort, updated_items, next_cursor, boundary)
+            if page is None:
+                del _project_list_cache[key]
+                continue
+            _project_list_cache[key] = (
+                fresh_until,
+                stale_until,
+                page[0],
+                page[1],
+                None,
+            )
+    if broadcast:
+        # 다른 워커에는 행 전체 대신 캐시 키 판정에 필요한 필드만 보낸다
+        _cache_bus.publish(
+            "project",
+            id=project_id,
+            status=project.get("status"),
+            platform=project.get("platform"),
+            tags=project.get("tags"),
+        )
+
+
+def _drop_cached_project(project: Mapping[str, object]) -> None:
+    """다른 워커에서 바뀐 프로젝트 - 그 프로젝트를 담았거나 담을 수 있는 키만 버린다."""
+    global _project_list_cache_generation
+    project_id = str(project["id"])
+    with _project_list_cache_lock:
+        _project_list_cache_generation += 1
+        for key, cached in list(_project_list_cache.items()):
+            items = cached[2]
+            if _find_cached_project(
+                items, project_id
+            ) is not None or _project_matches_cache_key(key, project):
+                del _project_list_cache[key]
+
+
+def _patch_cached_project_like_count(
+    project_id: str, like_count: int, broadcast: bool = True
+) -> None:
+    """좋아요 변경은 like_count만 고치고, popular 순서가 바뀔 수 있는 키만 다시 정렬한다."""
+    with _project_list_cache_lock:
+        for key, cached in list(_project_list_cache.items()):
+            fresh_until, stale_until, items, next_cursor, _ = cached
+            sort = key[0]
+            index = _find_cached_project(items, project_id)
+            if index is None:
+                # 페이지 밖 프로젝트가 마지막 행을 넘어서면 popular 첫 페이지에 들어올 수 있다.
+                if (
+                    sort == "popular"
+                    and next_cursor is not None
+                    and items
+                    and like_count >= _project_sort_key(sort, items[-1])[0]
+                ):
+                    del _project_list_cache[key]
+                continue
+
+            updated_items = list(items)
+            updated_items[index] = {**items[index], "like_count": like_count}
+            if sort != "popular":
+                _project_list_cache[key] = (
+                    fresh_until,
+                    stale_until,
+                    updated_items,
+                    next_cursor,
+                    None,
+                )
+                continue
+
+            page = _reorder_cached_page(
+                sort, updated_items, next_cursor, _project_sort_key(sort, items[-1])
+            )
+            if page is None:
+                del _project_list_cache[key]
+                continue
+            _project_list_cache[key] = (
+                fresh_until,
+                stale_until,
+                page[0],
+                page[1],
+                None,
+            )
+    if broadcast:
+        _cache_bus.publish("project_like", id=project_id, like_count=like_count)
+
+
+def _get_project_refresh_executor() -> ThreadPoolExecutor:
+    global _project_list_refresh_executor
+    with _project_list_cache_lock:
+        if _project_list_refresh_executor is None:
+            _project_list_refresh_executor = ThreadPoolExecutor(
+                max_workers=PROJECT_LIST_REFRESH_WORKERS,
+                thread_name_prefix="project-list-refresh",
+            )
+        return _project_list_refresh_executor
+
+
+def _refresh_cached_projects(key: ProjectCacheKey) -> None:
+    global _project_background_refresh_total
+    sort, platform, tag, limit = key
+    try:
+        _ = _load_projects_single_flight(
+            sort=sort, platform=platform, tag=tag, limit=limit
+        )
+        with _project_perf_lock:
+            _project_background_refresh_total += 1
+    except Exception as error:
+        print(f"[perf] /api/projects background refresh failed key={key}: {error}")
+    finally:
+        with _project_list_cache_lock:
+            _project_list_refreshing.discard(key)
+
+
+def _schedule_project_refresh(key: ProjectCacheKey) -> None:
+    try:
+        _ = _get_project_refresh_executor().submit(_refresh_cached_projects, key)
+    except RuntimeError:
+        # 종료 중인 executor에는 예약할 수 없다. 다음 요청이 다시 시도한다.
+        with _project_list_cache_lock:
+            _project_list_refreshing.discard(key)
+
+
+def _shutdown_project_refresh_executor() -> None:
+    global _project_list_refresh_executor
+    with _project_list_cache_lock:
+        executor = _project_list_refresh_executor
+        _project_list_refresh_executor = None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _encode_keyset_cursor(tag: str, sort: str, row: Mapping[str, object]) -> str:
+    """(태그, 정렬 키, id) 커서 - 태그가 다른 목록의 커서는 받지 않는다"""
+    if sort == "popular":
+        sort_value: object = row.get("like_count") or 0
+    else:
+        created_at = row.get("created_at")
+        sort_value = (
+            created_at.isoformat()
+            if isinstance(created_at, datetime)
+            else str(created_at)
+        )
+    raw = json.dumps([tag, sort_value, str(row["id"])], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_keyset_cursor(tag: str, sort: str, cursor: str) -> tuple[object, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        decoded = cast(
+            object, json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        )
+        if not isinstance(decoded, list) or len(decoded) != 3:
+            raise ValueError("cursor must have 3 parts")
+        cursor_tag, sort_value, row_id = cast(list[object], decoded)
+        if cursor_tag != tag or not isinstance(row_id, str):
+            raise ValueError("cursor sort mismatch")
+        _ = uuid.UUID(row_id)
+        if sort == "popular":
+            if not isinstance(sort_value, int):
+                raise ValueError("like_count cursor must be int")
+            return sort_value, row_id
+        if not isinstance(sort_value, str):
+            raise ValueError("created_at cursor must be str")
+        return datetime.fromisoformat(sort_value), row_id
+    except (ValueError, TypeError, UnicodeError) as error:
+        raise HTTPException(
+            status_code=400, detail="유효하지 않은 커서입니다"
+        ) from error
+
+
+def _encode_project_cursor(sort: str, row: Mapping[str, object]) -> str:
+    return _encode_keyset_cursor(sort, sort, row)
+
+
+def _decode_project_cursor(sort: str, cursor: str) -> tuple[object, str]:
+    return _decode_keyset_cursor(sort, sort, cursor)
+
+
+def _encode_comment_cursor(sort: str, row: Mapping[str, object]) -> str:
+    return _encode_keyset_cursor(f"comment:{sort}", sort, row)
+
+
+def _decode_comment_cursor(sort: str, cursor: str) -> tuple[object, str]:
+    return _decode_keyset_cursor(f"comment:{sort}", sort, cursor)
+
+
+def _fetch_project_page(
+    sort: str,
+    platform: Optional[str],
+    tag: Optional[str],
+    limit: int,
+    cursor: Optional[tuple[object, str]] = None,
+) -> tuple[list[dict[str, object]], Optional[str]]:
+    rows = get_projects(
+        sort=sort, platform=platform, tag=tag, limit=limit + 1, cursor=cursor
+    )
+    items = cast(list[dict[str, object]], rows[:limit])
+    next_cursor = (
+        _encode_project_cursor(sort, items[-1]) if len(rows) > limit and items else None
+    )
+    return items, next_cursor
+
+
+def _load_projects_single_flight(
+    sort: str,
+    platform: Optional[str],
+    tag: Optional[str],
+    limit: int,
+) -> tuple[EncodedProjectPage, bool]:
+    """캐시 미스 시 같은 키의 동시 요청은 한 스레드만 DB를 조회하고 나머지는 결과를 기다린다."""
+    key = _project_cache_key(sort, platform, tag, limit)
+    with _project_list_cache_lock:
+        generation = _project_list_cache_generation
+        inflight = _project_list_inflight.get(key)
+        is_leader = inflight is None
+        if inflight is None:
+            inflight = Future()
+            _project_list_inflight[key] = inflight
+
+    if not is_leader:
+        try:
+            return inflight.result(timeout=PROJECT_LIST_INFLIGHT_WAIT_SECONDS), True
+        except FutureTimeoutError:
+            items, next_cursor = _fetch_project_page(
+                sort=sort, platform=platform, tag=tag, limit=limit
+            )
+            return _encode_project_page(items, next_cursor), False
+
+    try:
+        items, next_cursor = _fetch_project_page(
+            sort=sort, platform=platform, tag=tag, limit=limit
+        )
+        encoded = _encode_project_page(items, next_cursor)
+        _set_cached_projects(
+            sort=sort,
+            platform=platform,
+            tag=tag,
+            limit=limit,
+            items=items,
+            next_cursor=next_cursor,
+            generation=generation,
+            encoded=encoded,
+        )
+        inflight.set_result(encoded)
+        return encoded, False
+    except BaseException as error:
+        inflight.set_exception(error)
+        raise
+    finally:
+        with _project_list_cache_lock:
+            if _project_list_inflight.get(key) is inflight:
+                _ = _project_list_inflight.pop(key, None)
 
 
 def _percentile(values: list[float], ratio: float) -> float:
@@ -152,20 +693,34 @@ def _percentile(values: list[float], ratio: float) -> float:
     return ordered[index]
 
 
-def _record_project_perf(elapsed_ms: float, db_ms: float, cache_hit: bool) -> None:
+def _record_project_perf(
+    elapsed_ms: float, db_ms: float, cache_hit: bool, coalesced: bool = False
+) -> None:
+    global _project_coalesced_total
     with _project_perf_lock:
-        _project_perf_samples.append((elapsed_ms, db_ms, 1 if cache_hit else 0))
+        _project_perf_samples.append(
+            (elapsed_ms, db_ms, 1 if cache_hit else 0, 1 if coalesced else 0)
+        )
+        if coalesced:
+            _project_coalesced_total += 1
 
 
 def _project_perf_snapshot() -> dict[str, object]:
     with _project_perf_lock:
         samples = list(_project_perf_samples)
+        coalesced_total = _project_coalesced_total
+        stale_served_total = _project_stale_served_total
+        background_refresh_total = _project_background_refresh_total
 
     if not samples:
         return {
             "window_size": PROJECT_PERF_WINDOW_SIZE,
             "sample_count": 0,
             "cache_hit_rate": 0.0,
+            "coalesced_count": 0,
+            "coalesced_total": coalesced_total,
+            "stale_served_total": stale_served_total,
+            "background_refresh_total": background_refresh_total,
             "elapsed_ms_p50": 0.0,
             "elapsed_ms_p95": 0.0,
             "db_ms_p50": 0.0,
@@ -173,13 +728,18 @@ def _project_perf_snapshot() -> dict[str, object]:
         }
 
     elapsed_values = [row[0] for row in samples]
-    db_values = [row[1] for row in samples if row[2] == 0]
+    db_values = [row[1] for row in samples if row[2] == 0 and row[3] == 0]
     cache_hit_rate = sum(row[2] for row in samples) / len(samples)
+    coalesced_count = sum(row[3] for row in samples)
 
     return {
         "window_size": PROJECT_PERF_WINDOW_SIZE,
         "sample_count": len(samples),
         "cache_hit_rate": round(cache_hit_rate, 4),
+        "coalesced_count": coalesced_count,
+        "coalesced_total": coalesced_total,
+        "stale_served_total": stale_served_total,
+        "background_refresh_total": background_refresh_total,
         "elapsed_ms_p50": round(_percentile(elapsed_values, 0.5), 2),
         "elapsed_ms_p95": round(_percentile(elapsed_values, 0.95), 2),
         "db_ms_p50": round(_percentile(db_values, 0.5), 2),
@@ -187,6 +747,145 @@ def _project_perf_snapshot() -> dict[str, object]:
     }
 
 
+# 좋아요 write-behind 버퍼: project_id -> (기준 like_count, 버퍼 반영 like_count)
+_project_like_buffer: dict[str, tuple[int, int]] = {}
+# flush 중인 증감분 - flush 도중 새로 읽은 기준값에 더해 응답 값을 맞춘다
+_project_like_flushing: dict[str, int] = {}
+# 증감 반영이 실패해 커밋 여부를 알 수 없는 프로젝트 - 다음 flush에서 행 수로 다시 맞춘다
+_project_like_reconcile_ids: set[str] = set()
+_project_like_buffer_lock = Lock()
+_project_like_flush_lock = Lock()
+_project_like_pending_events = 0
+# 버퍼가 가득 차면 요청 스레드 대신 백그라운드 flush 루프를 깨운다
+_project_like_flush_requested = Event()
+_project_like_flush_task: Optional[asyncio.Task[None]] = None
+_project_like_flush_total = 0
+_project_like_flushed_rows_total = 0
+_project_like_flush_error_total = 0
+_project_like_last_flush_ms = 0.0
+
+
+def _buffer_project_like(project_id: str, delta: int) -> int:
+    """좋아요 증감을 버퍼에 누적하고 버퍼 기준 like_count를 반환"""
+    global _project_like_pending_events
+    with _project_like_buffer_lock:
+        entry = _project_like_buffer.get(project_id)
+
+    if entry is None:
+        base_count = get_project_like_count(project_id)
+        if base_count is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        with _project_like_buffer_lock:
+            base_count += _project_like_flushing.get(project_id, 0)
+            entry = _project_like_buffer.setdefault(
+                project_id, (base_count, base_count)
+            )
+
+    with _project_like_buffer_lock:
+        base_count, buffered_count = _project_like_buffer.get(project_id, entry)
+        if delta == 0:
+            return buffered_count
+        buffered_count = max(0, buffered_count + delta)
+        _project_like_buffer[project_id] = (base_count, buffered_count)
+        _project_like_pending_events += 1
+        should_flush = _project_like_pending_events >= PROJECT_LIKE_FLUSH_MAX_EVENTS
+
+    if should_flush:
+        _project_like_flush_requested.set()
+    return buffered_count
+
+
+def flush_project_like_buffer() -> int:
+    """버퍼에 쌓인 좋아요 증감을 한 번의 UPDATE로 DB에 반영"""
+    global _project_like_buffer, _project_like_pending_events
+    global _project_like_flush_total, _project_like_flushed_rows_total
+    global _project_like_flush_error_total, _project_like_last_flush_ms
+
+    with _project_like_flush_lock:
+        with _project_like_buffer_lock:
+            pending = _project_like_buffer
+            _project_like_buffer = {}
+            _project_like_pending_events = 0
+            reconcile_ids = set(_project_like_reconcile_ids)
+            # 다시 셀 프로젝트의 증감분은 행 수에 이미 들어 있으므로 더하지 않는다
+            deltas = {
+                project_id: buffered_count - base_count
+                for project_id, (base_count, buffered_count) in pending.items()
+                if buffered_count != base_count and project_id not in reconcile_ids
+            }
+            _project_like_flushing.update(deltas)
+
+        if not deltas and not reconcile_ids:
+            return 0
+
+        started_at = time.perf_counter()
+        try:
+            like_counts = apply_project_like_deltas(deltas)
+        except Exception:
+            _restore_failed_project_like_flush(pending, deltas)
+            raise
+        if reconcile_ids:
+            try:
+                like_counts.update(reconcile_project_like_counts(reconcile_ids))
+            except Exception:
+                _restore_failed_project_like_flush(pending, reconcile_ids)
+                raise
+
+        with _project_like_buffer_lock:
+            _project_like_flushing.clear()
+            _project_like_reconcile_ids.difference_update(reconcile_ids)
+            _project_like_flush_total += 1
+            _project_like_flushed_rows_total += len(like_counts)
+            _project_like_last_flush_ms = (time.perf_counter() - started_at) * 1000
+            # flush 이후 들어온 증감분은 캐시 값에 그대로 얹어 보여준다
+            visible_counts = {
+                project_id: like_count
+                + (
+                    _project_like_buffer[project_id][1]
+                    - _project_like_buffer[project_id][0]
+                    if project_id in _project_like_buffer
+                    else 0
+                )
+                for project_id, like_count in like_counts.items()
+            }
+
+    for project_id, like_count in visible_counts.items():
+        _patch_cached_project_like_count(project_id, max(0, like_count))
+    return len(like_counts)
+
+
+def _restore_failed_project_like_flush(
+    pending: dict[str, tuple[int, int]], project_ids: Iterable[str]
+) -> None:
+    """반영에 실패한 프로젝트는 증감을 다시 더하지 않고 다음 flush에서 행 수로 맞춘다
+
+    UPDATE가 커밋된 뒤 연결이 끊겼을 수도 있어 증감을 다시 더하면 두 번 반영될 수 있다.
+    """
+    global _project_like_flush_error_total
+
+    with _project_like_buffer_lock:
+        _project_like_flushing.clear()
+        for project_id in project_ids:
+            _project_like_reconcile_ids.add(project_id)
+            # 응답에 보여 줄 버퍼 기준 값은 남겨 둔다
+            if project_id in pending:
+                _ = _project_like_buffer.setdefault(project_id, pending[project_id])
+        _project_like_flush_error_total += 1
+
+
+def _project_like_buffer_snapshot() -> dict[str, object]:
+    with _project_like_buffer_lock:
+        return {
+            "pending_projects": len(_project_like_buffer),
+            "pending_events": _project_like_pending_events,
+            "reconcile_pending_projects": len(_project_like_reconcile_ids),
+            "flush_total": _project_like_flush_total,
+            "flushed_rows_total": _project_like_flushed_rows_total,
+            "flush_error_total": _project_like_flush_error_total,
+            "last_flush_ms": round(_project_like_last_flush_ms, 2),
+        }
+
+
 BASELINE_BLOCKED_KEYWORD_CATEGORIES: dict[str, list[str]] = {
     "비하/혐오": [
         "성별비하",
@@ -218,6 +917,12 @@ BASELINE_BLOCKED_KEYWORD_CATEGORIES: dict[str, list[str]] = {
     ],
 }
 
+# 초성 금칙어를 완성 음절로 풀어 쓴 표기. 초성이 같은 일반 단어(서버, 쓰레기 등)가
+# 걸리지 않도록 여기 적힌 표기만 초성 금칙어로 본다 (받침이 다른 변형도 따로 적는다)
+BASELINE_CHOSEONG_KEYWORD_SPELLINGS: dict[str, list[str]] = {
+    "ㅅㅂ": ["시발", "씨발", "시빨", "씨빨", "시팔", "씨팔"],
+}
+
 DEFAULT_HOME_FILTER_TABS: list[dict[str, str]] = [
     {"id": "all", "label": "전체"},
     {"id": "web", "label": "Web"},
@@ -308,6 +1013,34 @@ app.add_middleware(
 )
 app.add_middleware(GZipMiddleware, minimum_size=1024)
 
+DB_POOL_RETRY_AFTER_SECONDS = 1
+
+
+@app.exception_handler(DatabasePoolTimeout)
+async def handle_db_pool_timeout(
+    request: StarletteRequest, exc: DatabasePoolTimeout
+) -> JSONResponse:
+    """커넥션 풀 대기 시간 초과는 503으로 응답"""
+    _ = request, exc
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "요청이 많아 잠시 후 다시 시도해 주세요"},
+        headers={"Retry-After": str(DB_POOL_RETRY_AFTER_SECONDS)},
+    )
+
+
+@app.exception_handler(PasswordHasherBusy)
+async def handle_password_hasher_busy(
+    request: StarletteRequest, exc: PasswordHasherBusy
+) -> JSONResponse:
+    """비밀번호 해시 대기열 초과는 기다리지 않고 503으로 응답"""
+    _ = request, exc
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "요청이 많아 잠시 후 다시 시도해 주세요"},
+        headers={"Retry-After": str(DB_POOL_RETRY_AFTER_SECONDS)},
+    )
+
 
 # ============ Models ============
 
@@ -369,9 +1102,29 @@ GOOGLE_OAUTH_STATE_TTL_SECONDS = 600
 DEFAULT_ADMIN_LOG_RETENTION_DAYS = 365
 DEFAULT_ADMIN_LOG_VIEW_WINDOW_DAYS = 30
 ADMIN_LOG_CLEANUP_INTERVAL_SECONDS = 6 * 60 * 60
+# 보관 기간 정리는 작은 배치로 나눠 지우고 배치마다 커밋 후 쉰다
+ADMIN_LOG_RETENTION_BATCH_SIZE = int(
+    os.getenv("ADMIN_LOG_RETENTION_BATCH_SIZE", "5000")
+)
+ADMIN_LOG_RETENTION_BATCH_PAUSE_SECONDS = 0.1
+# 관리자 로그 월별 파티션을 미리 만들어 둘 개월 수
+ADMIN_LOG_PARTITION_MONTHS_AHEAD = 2
 SYSTEM_ADMIN_USER_ID = "11111111-1111-1111-1111-111111111111"
 _admin_log_cleanup_task: Optional[asyncio.Task[None]] = None
 
+# 관리 작업(로그 정리, 삭제 예약 계정 처리)은 임대를 가진 워커 하나만 실행한다
+MAINTENANCE_LEASE_NAME = "admin_maintenance"
+MAINTENANCE_LEASE_TTL_SECONDS = 120
+MAINTENANCE_LEASE_RENEW_SECONDS = 30
+MAINTENANCE_WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+_maintenance_stop = Event()
+# 종료 중이면 임대를 잃은 실행이 끝나도 _maintenance_stop을 다시 풀지 않는다
+_maintenance_shutting_down = False
+_maintenance_run_task: Optional[asyncio.Task[dict[str, object]]] = None
+_maintenance_is_leader = False
+_maintenance_leader_since: Optional[float] = None
+_maintenance_runs_total = 0
+
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID", "")
 GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET", "")
 GOOGLE_REDIRECT_URI = os.getenv(
@@ -398,12 +1151,6 @@ class UserContext(TypedDict):
     bio: str | None
 
 
-class _ReadableResponse(Protocol):
-    def __enter__(self) -> "_ReadableResponse": ...
-    def __exit__(self, exc_type: object, exc: object, tb: object) -> bool: ...
-    def read(self) -> bytes: ...
-
-
 class AdminReportUpdateRequest(BaseModel):
     status: str
     reason: Optional[str] = None
@@ -626,11 +1373,61 @@ def get_effective_blocked_keywords(custom_keywords: list[str]) -> list[str]:
     return normalize_keyword_list(combined)
 
 
-def text_contains_blocked_keyword(text: str, blocked_keywords: list[str]) -> bool:
+CUSTOM_KEYWORD_CATEGORY = "사용자 지정"
+
+
+def _normalized_choseong_spellings() -> dict[str, list[str]]:
+    return {
+        normalize_text_for_filter(keyword): normalize_keyword_list(forms)
+        for keyword, forms in BASELINE_CHOSEONG_KEYWORD_SPELLINGS.items()
+    }
+
+
+# (정책 updated_at, 컴파일된 매처)
+_blocked_keyword_matcher_cache: Optional[tuple[object, HangulKeywordMatcher]] = None
+_blocked_keyword_matcher_lock = Lock()
+
+
+def get_blocked_keyword_matcher(
+    settings: Mapping[str, object],
+) -> HangulKeywordMatcher:
+    """기본 금칙어 + 정책 버전(updated_at)마다 한 번만 자모 매처를 컴파일"""
+    global _blocked_keyword_matcher_cache
+    version = settings.get("updated_at")
+    with _blocked_keyword_matcher_lock:
+        cached = _blocked_keyword_matcher_cache
+    if cached is not None and version is not None and cached[0] == version:
+        return cached[1]
+
+    baseline_categories = cast(
+        dict[str, list[str]], settings.get("baseline_keyword_categories") or {}
+    )
+    blocked_keywords = cast(list[str], settings.get("blocked_keywords") or [])
+    matcher = HangulKeywordMatcher(
+        [
+            (keyword, category)
+            for category, keywords in baseline_categories.items()
+            for keyword in keywords
+        ]
+        + [(keyword, CUSTOM_KEYWORD_CATEGORY) for keyword in blocked_keywords],
+        spellings=_normalized_choseong_spellings(),
+    )
+    with _blocked_keyword_matcher_lock:
+        _blocked_keyword_matcher_cache = (version, matcher)
+    return matcher
+
+
+def find_blocked_keyword(
+    text: str, settings: Mapping[str, object]
+) -> Optional[KeywordMatch]:
     normalized_text = normalize_text_for_filter(text)
     if not normalized_text:
-        return False
-    return any(keyword in normalized_text for keyword in blocked_keywords)
+        return None
+    return get_blocked_keyword_matcher(settings).find_first(normalized_text)
+
+
+def blocked_keyword_detail(message: str, match: KeywordMatch) -> str:
+    return f"{message} ({match.category}: {match.keyword})"
 
 
 def get_blocked_user_message(user_status: str) -> str:
@@ -743,7 +1540,68 @@ def write_admin_action_log(
     )
 
 
+MODERATION_SETTINGS_CHECK_INTERVAL_SECONDS = 2.0
+# (다음 버전 확인 시각, moderation_settings.updated_at, 계산된 설정)
+_moderation_settings_cache: Optional[tuple[float, object, dict[str, object]]] = None
+_moderation_settings_cache_lock = Lock()
+
+
+def invalidate_moderation_settings_cache(broadcast: bool = True) -> None:
+    global _moderation_settings_cache
+    with _moderation_settings_cache_lock:
+        _moderation_settings_cache = None
+    if broadcast:
+        _cache_bus.publish("moderation_settings")
+
+
 def get_effective_moderation_settings() -> dict[str, object]:
+    """updated_at 기준으로 캐시된 유효 정책 설정"""
+    global _moderation_settings_cache
+    with _moderation_settings_cache_lock:
+        cached = _moderation_settings_cache
+    now = time.perf_counter()
+    if cached is not None:
+        check_after, cached_version, cached_settings = cached
+        if now < check_after:
+            return dict(cached_settings)
+        if get_moderation_settings_updated_at() == cached_version:
+            with _moderation_settings_cache_lock:
+                if _moderation_settings_cache is cached:
+                    _moderation_settings_cache = (
+                        now + MODERATION_SETTINGS_CHECK_INTERVAL_SECONDS,
+                        cached_version,
+                        cached_settings,
+                    )
+            return dict(cached_settings)
+
+    settings = _load_effective_moderation_settings()
+    with _moderation_settings_cache_lock:
+        if _moderation_settings_cache is cached:
+            _moderation_settings_cache = (
+                now + MODERATION_SETTINGS_CHECK_INTERVAL_SECONDS,
+                settings["updated_at"],
+                settings,
+            )
+    return dict(settings)
+
+
+@cache
+def _normalized_baseline_keywords() -> tuple[frozenset[str], dict[str, list[str]]]:
+    baseline_keywords = normalize_keyword_list(
+        [
+            keyword
+            for keywords in BASELINE_BLOCKED_KEYWORD_CATEGORIES.values()
+            for keyword in keywords
+        ]
+    )
+    baseline_categories = {
+        category: normalize_keyword_list(keywords)
+        for category, keywords in BASELINE_BLOCKED_KEYWORD_CATEGORIES.items()
+    }
+    return frozenset(baseline_keywords), baseline_categories
+
+
+def _load_effective_moderation_settings() -> dict[str, object]:
     settings = get_moderation_settings()
     if not settings:
         raise HTTPException(status_code=404, detail="정책 설정을 찾을 수 없습니다")
@@ -753,13 +1611,7 @@ def get_effective_moderation_settings() -> dict[str, object]:
     )
     raw_keywords = settings.get("blocked_keywords") or []
     normalized_raw_keywords = normalize_keyword_list(raw_keywords)
-    baseline_keywords = normalize_keyword_list(
-        [
-            keyword
-            for keywords in BASELINE_BLOCKED_KEYWORD_CATEGORIES.values()
-            for keyword in keywords
-        ]
-    )
+    baseline_keywords, baseline_categories = _normalized_baseline_keywords()
     custom_keywords = [
         keyword
         for keyword in normalized_raw_keywords
@@ -786,10 +1638,6 @@ def get_effective_moderation_settings() -> dict[str, object]:
         maximum=365,
     )
     admin_log_mask_reasons = bool(settings.get("admin_log_mask_reasons", True))
-    baseline_categories = {
-        category: normalize_keyword_list(keywords)
-        for category, keywords in BASELINE_BLOCKED_KEYWORD_CATEGORIES.items()
-    }
     latest_policy_action = get_latest_policy_update_action()
 
     last_updated_by = None
@@ -805,7 +1653,10 @@ def get_effective_moderation_settings() -> dict[str, object]:
         "id": settings["id"],
         "blocked_keywords": effective_keywords,
         "custom_blocked_keywords": custom_keywords,
-        "baseline_keyword_categories": baseline_categories,
+        "baseline_keyword_categories": {
+            category: list(keywords)
+            for category, keywords in baseline_categories.items()
+        },
         "auto_hide_report_threshold": settings["auto_hide_report_threshold"],
         "home_filter_tabs": home_filter_tabs,
         "explore_filter_tabs": explore_filter_tabs,
@@ -865,12 +1716,179 @@ def ensure_baseline_moderation_settings() -> None:
             admin_log_view_window_days=admin_log_view_window_days,
             admin_log_mask_reasons=admin_log_mask_reasons,
         )
+        invalidate_moderation_settings_cache()
+
+
+MODERATION_SWEEP_BATCH_SIZE = 500
+# 이 시간 동안 배치 기록이 없는 진행 중 작업은 실행기가 죽은 것으로 보고 이어받는다
+MODERATION_SWEEP_STALE_SECONDS = 120
+MODERATION_SWEEP_PHASES = ("projects", "comments")
+_moderation_sweep_executor: Optional[ThreadPoolExecutor] = None
+_moderation_sweep_executor_lock = Lock()
+_moderation_sweep_stop = Event()
+
+
+def _get_moderation_sweep_executor() -> ThreadPoolExecutor:
+    global _moderation_sweep_executor
+    with _moderation_sweep_executor_lock:
+        if _moderation_sweep_executor is None:
+            _moderation_sweep_stop.clear()
+            _moderation_sweep_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="moderation-sweep",
+            )
+        return _moderation_sweep_executor
+
+
+def _shutdown_moderation_sweep() -> None:
+    """진행 중인 배치까지만 마치고 중단 (다음 시작 시 이어서 진행)"""
+    global _moderation_sweep_executor
+    with _moderation_sweep_executor_lock:
+        executor = _moderation_sweep_executor
+        _moderation_sweep_executor = None
+    if executor is None:
+        return
+    _moderation_sweep_stop.set()
+    executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _moderation_sweep_matcher(
+    keywords: Optional[Sequence[str]],
+) -> Callable[[str], Optional[KeywordMatch]]:
+    """점검에 쓸 매칭 함수 (keywords가 있으면 그 금칙어만, 없으면 현재 정책 전체)"""
+    if not keywords:
+        settings = get_effective_moderation_settings()
+        return lambda content: find_blocked_keyword(content, settings)
+    matcher = HangulKeywordMatcher(
+        [(keyword, CUSTOM_KEYWORD_CATEGORY) for keyword in keywords],
+        spellings=_normalized_choseong_spellings(),
+    )
+    return lambda content: matcher.find_first(normalize_text_for_filter(content))
+
+
+def run_moderation_sweep(
+    sweep_id: str,
+    phase: str,
+    after_id: Optional[str],
+    admin_id: Optional[str],
+    keywords: Optional[Sequence[str]] = None,
+) -> None:
+    """기존 프로젝트/댓글을 배치 단위로 훑어 금칙어가 있으면 숨김 처리"""
+    try:
+        find_keyword = _moderation_sweep_matcher(keywords)
+        phases = MODERATION_SWEEP_PHASES[MODERATION_SWEEP_PHASES.index(phase) :]
+        for index, current_phase in enumerate(phases):
+            if index > 0:
+                if not advance_moderation_sweep_phase(sweep_id, current_phase):
+                    return
+                after_id = None
+
+            batches = iter_moderation_sweep_batches(
+                current_phase, after_id, MODERATION_SWEEP_BATCH_SIZE
+            )
+            try:
+                for rows in batches:
+                    if _moderation_sweep_stop.is_set():
+                        return
+                    hide_ids = [
+                        str(row["id"])
+                        for row in rows
+                        if find_keyword(str(row["content"] or ""))
+                    ]
+                    last_id = str(rows[-1]["id"])
+                    hidden_ids = apply_moderation_sweep_batch(
+                        sweep_id=sweep_id,
+                        phase=current_phase,
+                        hide_ids=hide_ids,
+                        previous_last_id=after_id,
+                        last_id=last_id,
+                        scanned_count=len(rows),
+                    )
+                    if hidden_ids is None:
+                        # 새 작업으로 대체되었거나 다른 실행기가 이어서 진행 중
+                        return
+                    after_id = last_id
+                    if not hidden_ids:
+                        continue
+                    if current_phase == "projects":
+                        _invalidate_projects_cache()
+                    write_admin_action_log(
+                        admin_id=admin_id or SYSTEM_ADMIN_USER_ID,
+                        action_type="moderation_sweep_hidden",
+                        target_type="moderation_sweep",
+                        target_id=sweep_id,
+                        reason=(
+                            f"phase={current_phase}, scanned={len(rows)}, "
+                            f"hidden={len(hidden_ids)}"
+                        ),
+                    )
+            finally:
+                batches.close()
+
+        finish_moderation_sweep(sweep_id, "completed")
+    except Exception as error:
+        print(f"[moderation-sweep] sweep {sweep_id} failed: {error}")
+        with suppress(Exception):
+            finish_moderation_sweep(sweep_id, "failed", str(error))
+
+
+def start_moderation_sweep(
+    requested_by: Optional[str] = None, keywords: Optional[list[str]] = None
+) -> dict[str, object]:
+    sweep = create_moderation_sweep(requested_by, keywords)
+    if not sweep:
+        raise HTTPException(
+            status_code=500, detail="금칙어 점검 작업 생성에 실패했습니다"
+        )
+    _ = _get_moderation_sweep_executor().submit(
+        run_moderation_sweep,
+        str(sweep["id"]),
+        str(sweep["phase"]),
+        None,
+        requested_by,
+        keywords,
+    )
+    return serialize_moderation_sweep(sweep)
+
+
+def resume_moderation_sweep() -> bool:
+    """실행기가 멈춘 점검 작업을 마지막 체크포인트부터 이어서 실행 (관리 작업 리더가 호출)"""
+    sweep = claim_stale_moderation_sweep(MODERATION_SWEEP_STALE_SECONDS)
+    if not sweep:
+        return False
+    _ = _get_moderation_sweep_executor().submit(
+        run_moderation_sweep,
+        str(sweep["id"]),
+        str(sweep["phase"]),
+        str(sweep["last_id"]) if sweep.get("last_id") else None,
+        str(sweep["requested_by"]) if sweep.get("requested_by") else None,
+        cast(Optional[list[str]], sweep.get("keywords")),
+    )
+    return True
+
+
+def serialize_moderation_sweep(sweep: Mapping[str, object]) -> dict[str, object]:
+    payload = dict(sweep)
+    for key in ("id", "last_id", "requested_by"):
+        if payload.get(key) is not None:
+            payload[key] = str(payload[key])
+
+    started_at = sweep.get("started_at")
+    ended_at = sweep.get("finished_at") or sweep.get("updated_at")
+    rows_per_second = 0.0
+    if isinstance(started_at, datetime) and isinstance(ended_at, datetime):
+        elapsed_seconds = (ended_at - started_at).total_seconds()
+        if elapsed_seconds > 0:
+            rows_per_second = cast(int, sweep["scanned_count"]) / elapsed_seconds
+    payload["rows_per_second"] = round(rows_per_second, 2)
+    return payload
 
 
 def perform_due_user_deletion_cleanup() -> int:
     deleted_users = purge_due_user_deletions(limit=200)
     for deleted_user in deleted_users:
         target_id = str(deleted_user["id"])
+        _invalidate_user_context(target_id)
         write_admin_action_log(
             admin_id=SYSTEM_ADMIN_USER_ID,
             action_type="user_deleted",
@@ -881,22 +1899,320 @@ def perform_due_user_deletion_cleanup() -> int:
     return len(deleted_users)
 
 
+def _admin_log_retention_progress(
+    progress: dict[str, object], started_at: float
+) -> dict[str, object]:
+    elapsed_seconds = time.perf_counter() - started_at
+    deleted_count = cast(int, progress["deleted_count"])
+    return {
+        **progress,
+        "elapsed_seconds": round(elapsed_seconds, 2),
+        "rows_per_second": (
+            round(deleted_count / elapsed_seconds, 2) if elapsed_seconds > 0 else 0.0
+        ),
+    }
+
+
+def cleanup_admin_action_logs_in_batches(
+    retention_days: int,
+    on_progress: Optional[Callable[[dict[str, object]], None]] = None,
+) -> dict[str, object]:
+    """보관 기간이 지난 관리자 로그를 정리하고 진행 상황 반환
+
+    범위 전체가 기준 시각 이전인 월별 파티션은 통째로 삭제하고, 기준 시각이 걸친
+    달의 나머지 행만 배치 단위로 지운다. 배치마다 커밋하므로 중간에 멈춰도 지운 만큼은 남고, 다음 실행이 이어서 지운다.
+    배치 사이에는 배치에 걸린 시간 이상 쉬어 운영 트래픽에 DB 자원을 양보한다.
+    """
+    started_at = time.perf_counter()
+    cutoff = get_admin_action_log_retention_cutoff(retention_days)
+    dropped_partitions = drop_expired_admin_action_log_partitions(cutoff)
+    if dropped_partitions:
+        print(f"[admin-log] dropped expired partitions: {dropped_partitions}")
+    progress: dict[str, object] = {
+        "status": "running",
+        "retention_days": retention_days,
+        "cutoff": cutoff.isoformat(),
+        "dropped_partitions": dropped_partitions,
+        "batch_size": ADMIN_LOG_RETENTION_BATCH_SIZE,
+        "batch_count": 0,
+        "deleted_count": 0,
+    }
+    while True:
+        if _maintenance_stop.is_set():
+            progress["status"] = "stopped"
+            break
+        batch_started_at = time.perf_counter()
+        deleted = delete_admin_action_logs_batch(cutoff, ADMIN_LOG_RETENTION_BATCH_SIZE)
+        batch_seconds = time.perf_counter() - batch_started_at
+        progress["batch_count"] = cast(int, progress["batch_count"]) + 1
+        progress["deleted_count"] = cast(int, progress["deleted_count"]) + deleted
+        if deleted < ADMIN_LOG_RETENTION_BATCH_SIZE:
+            progress["status"] = "completed"
+            break
+        if on_progress is not None:
+            on_progress(_admin_log_retention_progress(progress, started_at))
+        _ = _maintenance_stop.wait(
+            max(ADMIN_LOG_RETENTION_BATCH_PAUSE_SECONDS, batch_seconds)
+        )
+    return _admin_log_retention_progress(progress, started_at)
+
+
+def _report_admin_log_retention_progress(progress: dict[str, object]) -> None:
+    try:
+        _ = record_maintenance_run_progress(
+            MAINTENANCE_LEASE_NAME,
+            MAINTENANCE_WORKER_ID,
+            {"admin_log_retention": progress},
+        )
+    except Exception as error:
+        print(f"[admin-log] retention progress error: {error}")
+
+
+def run_admin_maintenance() -> dict[str, object]:
+    """관리 작업 한 번 실행 후 통계 반환 (임대를 가진 워커만 호출)
+
+    임대를 잃거나 종료 중이면(_maintenance_stop) 남은 단계를 건너뛴다.
+    """
+    started_at = time.perf_counter()
+    settings = get_effective_moderation_settings()
+    retention_days = cast(int, settings["admin_log_retention_days"])
+    created_partitions = ensure_admin_action_log_partitions(
+        ADMIN_LOG_PARTITION_MONTHS_AHEAD
+    )
+    retention = cleanup_admin_action_logs_in_batches(
+        retention_days, on_progress=_report_admin_log_retention_progress
+    )
+    deleted_count = cast(int, retention["deleted_count"])
+    if deleted_count > 0:
+        print(f"[admin-log] cleaned up {deleted_count} expired action logs")
+    user_deleted_count = 0
+    if not _maintenance_stop.is_set():
+        user_deleted_count = perform_due_user_deletion_cleanup()
+    if user_deleted_count > 0:
+        print(
+            f"[admin-user] auto-deleted {user_deleted_count} due pending_delete accounts"
+        )
+    bucket_deleted_count = 0
+    if RATE_LIMIT_BACKEND == "postgres" and not _maintenance_stop.is_set():
+        bucket_deleted_count = cleanup_rate_limit_buckets()
+    # 좋아요 카운터는 flush마다 증감만 더하므로 어긋난 값은 여기서 행 수로 바로잡는다
+    reconciled_like_counts: dict[str, int] = {}
+    if not _maintenance_stop.is_set():
+        reconciled_like_counts = reconcile_drifted_project_like_counts()
+    for project_id, like_count in reconciled_like_counts.items():
+        _patch_cached_project_like_count(project_id, like_count)
+    if reconciled_like_counts:
+        print(
+            f"[project-like] reconciled {len(reconciled_like_counts)} drifted like counts"
+        )
+    return {
+        "stopped": _maintenance_stop.is_set(),
+        "admin_logs_deleted": deleted_count,
+        "admin_log_retention": retention,
+        "admin_log_partitions_created": created_partitions,
+        "users_deleted": user_deleted_count,
+        "rate_limit_buckets_deleted": bucket_deleted_count,
+        "project_like_counts_reconciled": len(reconciled_like_counts),
+        "duration_ms": round((time.perf_counter() - started_at) * 1000, 1),
+    }
+
+
+def _set_maintenance_leader(is_leader: bool) -> None:
+    global _maintenance_is_leader, _maintenance_leader_since
+
+    if is_leader and not _maintenance_is_leader:
+        _maintenance_leader_since = time.time()
+        print(f"[maintenance] {MAINTENANCE_WORKER_ID} became leader")
+    elif not is_leader:
+        _maintenance_leader_since = None
+    _maintenance_is_leader = is_leader
+
+
+async def _renew_maintenance_lease() -> bool:
+    lease = await asyncio.to_thread(
+        acquire_maintenance_lease,
+        MAINTENANCE_LEASE_NAME,
+        MAINTENANCE_WORKER_ID,
+        MAINTENANCE_LEASE_TTL_SECONDS,
+        ADMIN_LOG_CLEANUP_INTERVAL_SECONDS,
+    )
+    _set_maintenance_leader(lease is not None)
+    return lease is not None and bool(lease["due"])
+
+
+async def run_admin_maintenance_tick() -> bool:
+    """임대를 잡거나 연장하고, 리더이면서 실행할 때가 됐으면 관리 작업 실행
+
+    반환값: 이번 차례에 관리 작업을 실행했는지 여부
+    """
+    global _maintenance_runs_total, _maintenance_run_task
+
+    due = await _renew_maintenance_lease()
+    if _maintenance_is_leader:
+        try:
+            _ = await asyncio.to_thread(resume_moderation_sweep)
+        except Exception as error:
+            print(f"[moderation-sweep] resume error: {error}")
+    if not due:
+        return False
+    started = await asyncio.to_thread(
+        record_maintenance_run_started, MAINTENANCE_LEASE_NAME, MAINTENANCE_WORKER_ID
+    )
+    if not started:
+        _set_maintenance_leader(False)
+        return False
+
+    run = asyncio.create_task(asyncio.to_thread(run_admin_maintenance))
+    _maintenance_run_task = run
+    # 실행이 임대 만료보다 길어져도 다른 워커가 끼어들지 않도록 중간에 연장한다
+    lease_lost = False
+    renewed_at = time.monotonic()
+    try:
+        while True:
+            done, _ = await asyncio.wait({run}, timeout=MAINTENANCE_LEASE_RENEW_SECONDS)
+            if done:
+                break
+            if lease_lost:
+                continue
+            try:
+                _ = await _renew_maintenance_lease()
+                if _maintenance_is_leader:
+                    renewed_at = time.monotonic()
+            except Exception as error:
+                print(f"[maintenance] lease renew error: {error}")
+            # 임대를 빼앗겼거나 만료될 때까지 연장하지 못했으면 다른 워커가 실행을
+            # 시작할 수 있으므로, 배치 사이에서 멈추도록 알리고 끝나기를 기다린다
+            if (
+                not _maintenance_is_leader
+                or time.monotonic() - renewed_at >= MAINTENANCE_LEASE_TTL_SECONDS
+            ):
+                lease_lost = True
+                _set_maintenance_leader(False)
+                _maintenance_stop.set()
+                print("[maintenance] lease lost during run, stopping")
+    finally:
+        _maintenance_run_task = None
+        if lease_lost and not _maintenance_shutting_down:
+            _maintenance_stop.clear()
+
+    stats: dict[str, object] = {}
+    error_message: Optional[str] = "maintenance lease lost" if lease_lost else None
+    try:
+        stats = run.result()
+    except Exception as error:
+        error_message = str(error)
+        print(f"[maintenance] run error: {error}")
+    _maintenance_runs_total += 1
+    _ = await asyncio.to_thread(
+        record_maintenance_run_finished,
+        MAINTENANCE_LEASE_NAME,
+        MAINTENANCE_WORKER_ID,
+        stats,
+        error_message,
+    )
+    return True
+
+
 async def run_admin_log_cleanup_loop() -> None:
+    """모든 워커가 돌리지만 임대를 가진 리더만 실제 작업을 한다
+
+    리더가 죽으면 연장이 멈춰 MAINTENANCE_LEASE_TTL_SECONDS 뒤 임대가 만료되고,
+    다음 차례에 다른 워커가 이어받는다. 실행 주기는 DB의 마지막 실행 시각을 기준으로 한다.
+    """
+    while not _maintenance_shutting_down:
+        try:
+            _ = await run_admin_maintenance_tick()
+        except Exception as error:
+            _set_maintenance_leader(False)
+            print(f"[maintenance] loop error: {error}")
+        if _maintenance_shutting_down:
+            break
+        await asyncio.sleep(MAINTENANCE_LEASE_RENEW_SECONDS)
+
+
+async def _stop_admin_maintenance() -> None:
+    """진행 중인 관리 작업이 멈출 때까지 기다린 뒤 임대를 놓는다
+
+    실행 중에 임대를 먼저 놓으면 다른 워커가 같은 작업을 겹쳐 시작할 수 있다.
+    """
+    global _admin_log_cleanup_task, _maintenance_shutting_down
+    _maintenance_shutting_down = True
+    _maintenance_stop.set()
+    task = _admin_log_cleanup_task
+    _admin_log_cleanup_task = None
+    if task is not None:
+        if _maintenance_run_task is not None:
+            # 실행은 _maintenance_stop을 보고 배치 사이에서 멈춘다. 루프는 실행 기록을
+            # 남긴 뒤 종료 플래그를 보고 스스로 끝난다.
+            with suppress(Exception):
+                await task
+        else:
+            _ = task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+    await _release_maintenance_lease()
+
+
+async def _release_maintenance_lease() -> None:
+    if not _maintenance_is_leader:
+        return
+    try:
+        _ = await asyncio.to_thread(
+            release_maintenance_lease, MAINTENANCE_LEASE_NAME, MAINTENANCE_WORKER_ID
+        )
+    except Exception as error:
+        print(f"[maintenance] lease release error: {error}")
+    _set_maintenance_leader(False)
+
+
+def _maintenance_last_run_stats() -> Optional[Mapping[str, object]]:
+    lease = get_maintenance_lease(MAINTENANCE_LEASE_NAME)
+    if lease is None or lease["last_run_started_at"] is None:
+        return None
+    return lease["last_run_stats"] or {}
+
+
+def _maintenance_snapshot() -> dict[str, object]:
+    lease = get_maintenance_lease(MAINTENANCE_LEASE_NAME)
+    leader: Optional[dict[str, object]] = None
+    last_run: Optional[dict[str, object]] = None
+    if lease is not None:
+        if lease["active"]:
+            leader = {
+                "worker_id": lease["holder"],
+                "acquired_at": lease["acquired_at"],
+                "expires_at": lease["expires_at"],
+            }
+        if lease["last_run_started_at"] is not None:
+            last_run = {
+                "worker_id": lease["last_run_holder"],
+                "started_at": lease["last_run_started_at"],
+                "finished_at": lease["last_run_finished_at"],
+                "stats": lease["last_run_stats"],
+                "error": lease["last_run_error"],
+            }
+    return {
+        "worker_id": MAINTENANCE_WORKER_ID,
+        "is_leader": _maintenance_is_leader,
+        "leader_since": _maintenance_leader_since,
+        "runs_total": _maintenance_runs_total,
+        "leader": leader,
+        "last_run": last_run,
+        "interval_seconds": ADMIN_LOG_CLEANUP_INTERVAL_SECONDS,
+        "lease_ttl_seconds": MAINTENANCE_LEASE_TTL_SECONDS,
+    }
+
+
+async def run_project_like_flush_loop() -> None:
     while True:
+        _ = await asyncio.to_thread(
+            _project_like_flush_requested.wait, PROJECT_LIKE_FLUSH_INTERVAL_SECONDS
+        )
+        _project_like_flush_requested.clear()
         try:
-            settings = get_effective_moderation_settings()
-            retention_days = cast(int, settings["admin_log_retention_days"])
-            deleted_count = cleanup_admin_action_logs(retention_days=retention_days)
-            if deleted_count > 0:
-                print(f"[admin-log] cleaned up {deleted_count} expired action logs")
-            user_deleted_count = perform_due_user_deletion_cleanup()
-            if user_deleted_count > 0:
-                print(
-                    f"[admin-user] auto-deleted {user_deleted_count} due pending_delete accounts"
-                )
+            _ = await asyncio.to_thread(flush_project_like_buffer)
         except Exception as error:
-            print(f"[admin-log] cleanup loop error: {error}")
-        await asyncio.sleep(ADMIN_LOG_CLEANUP_INTERVAL_SECONDS)
+            print(f"[project-like] flush error: {error}")
 
 
 # ============ Startup Event ============
@@ -905,33 +2221,62 @@ async def run_admin_log_cleanup_loop() -> None:
 async def startup_event():
     """앱 시작 시 DB 테이블 초기화"""
     try:
-        init_db()
+        applied_migrations = run_migrations()
+        if applied_migrations:
+            print(f"✅ Database migrations applied: {applied_migrations}")
+        await open_async_db_pool()
+        if CACHE_BUS_ENABLED:
+            await _cache_bus.start()
         ensure_baseline_moderation_settings()
-        settings = get_effective_moderation_settings()
-        _ = cleanup_admin_action_logs(
-            retention_days=cast(int, settings["admin_log_retention_days"])
-        )
-        _ = perform_due_user_deletion_cleanup()
         _ = get_about_content_payload()
+        items, next_cursor = _fetch_project_page(
+            sort="latest",
+            platform=None,
+            tag=None,
+            limit=PROJECT_LIST_DEFAULT_LIMIT,
+        )
         _set_cached_projects(
-            sort="latest", platform=None, tag=None, items=get_projects(sort="latest")
+            sort="latest",
+            platform=None,
+            tag=None,
+            limit=PROJECT_LIST_DEFAULT_LIMIT,
+            items=items,
+            next_cursor=next_cursor,
         )
-        global _admin_log_cleanup_task
+        global _admin_log_cleanup_task, _maintenance_shutting_down
         if _admin_log_cleanup_task is None or _admin_log_cleanup_task.done():
+            _maintenance_shutting_down = False
+            _maintenance_stop.clear()
             _admin_log_cleanup_task = asyncio.create_task(run_admin_log_cleanup_loop())
     except Exception as e:
         print(f"⚠️  DB initialization warning: {e}")
 
+    global _project_like_flush_task
+    if _project_like_flush_task is None or _project_like_flush_task.done():
+        _project_like_flush_task = asyncio.create_task(run_project_like_flush_loop())
 
-async def shutdown_event() -> None:
-    global _admin_log_cleanup_task
-    if _admin_log_cleanup_task is None:
-        return
 
-    _ = _admin_log_cleanup_task.cancel()
-    with suppress(asyncio.CancelledError):
-        await _admin_log_cleanup_task
-    _admin_log_cleanup_task = None
+async def shutdown_event() -> None:
+    global _project_like_flush_task
+    _maintenance_stop.set()
+    _shutdown_project_refresh_executor()
+    _shutdown_moderation_sweep()
+    password_hash_pool.shutdown()
+    if _project_like_flush_task is not None:
+        _ = _project_like_flush_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await _project_like_flush_task
+        _project_like_flush_task = None
+        # 취소된 루프가 남긴 대기 스레드를 깨운다
+        _project_like_flush_requested.set()
+    try:
+        _ = flush_project_like_buffer()
+    except Exception as error:
+        print(f"[project-like] final flush error: {error}")
+    await _stop_admin_maintenance()
+    await _cache_bus.stop()
+    await close_async_db_pool()
+    await close_http_client()
 
 
 # ============ Health Check ============
@@ -967,41 +2312,65 @@ def list_projects(
     sort: str = "latest",
     platform: Optional[str] = None,
     tag: Optional[str] = None,
+    limit: int = PROJECT_LIST_DEFAULT_LIMIT,
+    cursor: Optional[str] = None,
+    accept_encoding: Optional[str] = Header(default=None),
 ):
     """프로젝트 목록 조회"""
     request_started = time.perf_counter()
     normalized_sort = "popular" if sort == "popular" else "latest"
+    page_limit = normalize_positive_int(
+        limit,
+        PROJECT_LIST_DEFAULT_LIMIT,
+        minimum=1,
+        maximum=PROJECT_LIST_MAX_LIMIT,
+    )
+    decoded_cursor = _decode_project_cursor(normalized_sort, cursor) if cursor else None
     try:
-        cached_items = _get_cached_projects(
-            sort=normalized_sort, platform=platform, tag=tag
+        # 첫 페이지만 캐시한다. 이후 페이지는 keyset 조건으로 인덱스를 바로 탄다.
+        # 캐시 적중 시에는 미리 인코딩해 둔 JSON(gzip) 바이트를 그대로 내려준다.
+        cached_page = (
+            _get_cached_project_page(
+                sort=normalized_sort, platform=platform, tag=tag, limit=page_limit
+            )
+            if decoded_cursor is None
+            else None
         )
-        if cached_items is not None:
-            for p in cached_items:
-                p["id"] = str(p["id"])
-                p["author_id"] = str(p["author_id"])
+        if cached_page is not None:
             elapsed_ms = (time.perf_counter() - request_started) * 1000
             _record_project_perf(elapsed_ms=elapsed_ms, db_ms=0.0, cache_hit=True)
             print(
                 f"[perf] /api/projects cache_hit=1 sort={normalized_sort} platform={platform} tag={tag} elapsed_ms={elapsed_ms:.2f}"
             )
-            return {"items": cached_items, "next_cursor": None}
+            return _project_page_response(cached_page, accept_encoding)
 
         db_started = time.perf_counter()
-        projects = get_projects(sort=normalized_sort, platform=platform, tag=tag)
+        coalesced = False
+        if decoded_cursor is None:
+            encoded, coalesced = _load_projects_single_flight(
+                sort=normalized_sort, platform=platform, tag=tag, limit=page_limit
+            )
+        else:
+            projects, next_cursor = _fetch_project_page(
+                sort=normalized_sort,
+                platform=platform,
+                tag=tag,
+                limit=page_limit,
+                cursor=decoded_cursor,
+            )
+            encoded = _encode_project_page(projects, next_cursor, compress=False)
         db_ms = (time.perf_counter() - db_started) * 1000
-        _set_cached_projects(
-            sort=normalized_sort, platform=platform, tag=tag, items=projects
-        )
-        # UUID를 문자열로 변환
-        for p in projects:
-            p["id"] = str(p["id"])
-            p["author_id"] = str(p["author_id"])
         elapsed_ms = (time.perf_counter() - request_started) * 1000
-        _record_project_perf(elapsed_ms=elapsed_ms, db_ms=db_ms, cache_hit=False)
+        _record_project_perf(
+            elapsed_ms=elapsed_ms, db_ms=db_ms, cache_hit=False, coalesced=coalesced
+        )
         print(
-            f"[perf] /api/projects cache_hit=0 sort={normalized_sort} platform={platform} tag={tag} db_ms={db_ms:.2f} elapsed_ms={elapsed_ms:.2f}"
+            f"[perf] /api/projects cache_hit=0 coalesced={int(coalesced)} sort={normalized_sort} platform={platform} tag={tag} cursor={int(decoded_cursor is not None)} db_ms={db_ms:.2f} elapsed_ms={elapsed_ms:.2f}"
         )
-        return {"items": projects, "next_cursor": None}
+        return _project_page_response(encoded, accept_encoding)
+    except DatabasePoolTimeout:
+        # 풀 고갈은 빈 목록 대신 503 핸들러로 넘긴다
+        raise
     except Exception as e:
         print(f"Error fetching projects: {e}")
         return {"items": [], "next_cursor": None}
@@ -1020,63 +2389,277 @@ def get_project_detail(project_id: str):
     return project
 
 
-@app.post("/api/projects/{project_id}/like")
-def like_project_endpoint(project_id: str):
-    """프로젝트 좋아요"""
-    try:
-        like_count = like_project(project_id)
-        _invalidate_projects_cache()
-        return {"like_count": like_count}
-    except Exception:
-        raise HTTPException(status_code=404, detail="Project not found")
+# ============ Rate Limit ============
 
+# memory: 워커별 버킷, postgres: 모든 워커가 rate_limit_buckets 테이블을 공유
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory").strip().lower()
+# 회원가입은 로그인 전이라 클라이언트 IP 기준으로 센다. 학교/회사 NAT처럼 여러 사용자가
+# 한 IP를 쓰는 환경에서는 한 시간 예산을 나눠 쓰므로 배포 환경에 맞게 늘린다.
+AUTH_REGISTER_LIMIT_PER_HOUR = max(
+    1, int(os.getenv("AUTH_REGISTER_LIMIT_PER_HOUR", "5"))
+)
+RATE_LIMIT_POLICIES: dict[str, RateLimitPolicy] = {
+    "auth_login": RateLimitPolicy(capacity=10, refill_per_second=10 / 60),
+    "auth_register": RateLimitPolicy(
+        capacity=AUTH_REGISTER_LIMIT_PER_HOUR,
+        refill_per_second=AUTH_REGISTER_LIMIT_PER_HOUR / 3600,
+    ),
+    "project_like": RateLimitPolicy(capacity=30, refill_per_second=1.0, per_user=True),
+    "comment_create": RateLimitPolicy(
+        capacity=10, refill_per_second=10 / 60, per_user=True
+    ),
+    "report_create": RateLimitPolicy(
+        capacity=10, refill_per_second=10 / 600, per_user=True
+    ),
+}
 
-@app.delete("/api/projects/{project_id}/like")
-def unlike_project_endpoint(project_id: str):
-    """프로젝트 좋아요 취소"""
-    try:
-        like_count = unlike_project(project_id)
-        _invalidate_projects_cache()
-        return {"like_count": like_count}
-    except Exception:
-        raise HTTPException(status_code=404, detail="Project not found")
+
+def _create_rate_limiter() -> RateLimiter:
+    if RATE_LIMIT_BACKEND == "postgres":
+        return SharedRateLimiter(consume_rate_limit_token)
+    return InMemoryRateLimiter()
+
+
+_rate_limiter: RateLimiter = _create_rate_limiter()
+
+
+def _enforce_rate_limit(policy_name: str, subject: str) -> None:
+    policy = RATE_LIMIT_POLICIES[policy_name]
+    retry_after = _rate_limiter.acquire(f"{policy_name}:{subject}", policy)
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=429,
+            detail="요청이 너무 많습니다. 잠시 후 다시 시도해 주세요",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+
+def rate_limit(policy_name: str) -> Callable[..., None]:
+    """라우트별 요청 제한 의존성 - 정책에 따라 사용자 또는 IP 단위로 센다"""
+    if RATE_LIMIT_POLICIES[policy_name].per_user:
+
+        def _limit_user(current_user: UserContext = Depends(get_current_user)) -> None:
+            _enforce_rate_limit(policy_name, f"user:{current_user['id']}")
+
+        return _limit_user
+
+    def _limit_ip(request: StarletteRequest) -> None:
+        client_host = request.client.host if request.client else "unknown"
+        _enforce_rate_limit(policy_name, f"ip:{client_host}")
+
+    return _limit_ip
 
 
 # ============ Comments API ============
 
 
+def _serialize_comment(row: Mapping[str, object]) -> dict[str, object]:
+    comment = {
+        key: value
+        for key, value in row.items()
+        if key not in {"root_id", "root_rank", "reply_rank", "reply_count"}
+    }
+    comment["id"] = str(row["id"])
+    comment["project_id"] = str(row["project_id"])
+    comment["author_id"] = str(row["author_id"])
+    if row.get("parent_id"):
+        comment["parent_id"] = str(row["parent_id"])
+    return comment
+
+
 @app.get("/api/projects/{project_id}/comments")
-def list_comments(project_id: str, sort: str = "latest"):
-    """프로젝트 댓글 목록 조회"""
-    comments = get_comments(project_id, sort=sort)
-    for c in comments:
-        c["id"] = str(c["id"])
-        c["project_id"] = str(c["project_id"])
-        c["author_id"] = str(c["author_id"])
-        if c.get("parent_id"):
-            c["parent_id"] = str(c["parent_id"])
-    return {"items": comments, "next_cursor": None}
+def list_comments(
+    project_id: str,
+    sort: str = "latest",
+    limit: int = COMMENT_PAGE_DEFAULT_LIMIT,
+    cursor: Optional[str] = None,
+    replies_limit: int = COMMENT_REPLIES_DEFAULT_LIMIT,
+):
+    """프로젝트 댓글 스레드 조회
 
+    최상위 댓글을 커서로 나눠 내려주고, 각 스레드에는 오래된 순으로
+    replies_limit개까지의 답글과 나머지를 이어 받을 replies_next_cursor를 붙인다.
+    """
+    normalized_sort = "popular" if sort == "popular" else "latest"
+    page_limit = normalize_positive_int(
+        limit, COMMENT_PAGE_DEFAULT_LIMIT, minimum=1, maximum=COMMENT_PAGE_MAX_LIMIT
+    )
+    thread_replies_limit = normalize_positive_int(
+        replies_limit,
+        COMMENT_REPLIES_DEFAULT_LIMIT,
+        minimum=0,
+        maximum=COMMENT_REPLIES_MAX_LIMIT,
+    )
+    decoded_cursor = _decode_comment_cursor(normalized_sort, cursor) if cursor else None
+    rows = get_comment_threads(
+        project_id,
+        sort=normalized_sort,
+        limit=page_limit + 1,
+        cursor=decoded_cursor,
+        replies_limit=thread_replies_limit,
+    )
 
-# ============ Reports API ============
+    items: list[dict[str, object]] = []
+    threads: dict[str, dict[str, object]] = {}
+    last_root: Optional[Mapping[str, object]] = None
+    has_more = False
+    for row in rows:
+        if cast(int, row["root_rank"]) > page_limit:
+            has_more = True
+            continue
+        root_id = str(row["root_id"])
+        if row["depth"] == 0:
+            last_root = row
+            thread = _serialize_comment(row)
+            thread["reply_count"] = row["reply_count"]
+            thread["replies"] = []
+            threads[root_id] = thread
+            items.append(thread)
+            continue
+        thread = threads[root_id]
+        cast(list[Mapping[str, object]], thread["replies"]).append(row)
+
+    for thread in items:
+        # replies_limit + 1번째 답글은 더 있는지 확인용
+        fetched_rows = cast(list[Mapping[str, object]], thread["replies"])
+        reply_rows = fetched_rows[:thread_replies_limit]
+        thread["replies"] = [_serialize_comment(reply) for reply in reply_rows]
+        # 커서가 None이면서 has_more_replies면 답글을 처음부터 받으면 된다
+        thread["has_more_replies"] = len(fetched_rows) > len(reply_rows)
+        thread["replies_next_cursor"] = (
+            _encode_comment_cursor("replies", reply_rows[-1])
+            if thread["has_more_replies"] and reply_rows
+            else None
+        )
 
+    next_cursor = (
+        _encode_comment_cursor(normalized_sort, last_root)
+        if has_more and last_root is not None
+        else None
+    )
+    return {"items": items, "next_cursor": next_cursor}
 
-@app.post("/api/comments/{comment_id}/report")
-def report_comment_endpoint(comment_id: str, report: ReportCreate):
-    """댓글 신고"""
-    new_report = report_comment(
-        comment_id=comment_id, reason=report.reason, memo=report.memo
+
+@app.get("/api/comments/{comment_id}/replies")
+def list_comment_replies(
+    comment_id: str,
+    limit: int = COMMENT_PAGE_DEFAULT_LIMIT,
+    cursor: Optional[str] = None,
+):
+    """스레드 답글 더 보기 (오래된 순)"""
+    page_limit = normalize_positive_int(
+        limit, COMMENT_PAGE_DEFAULT_LIMIT, minimum=1, maximum=COMMENT_PAGE_MAX_LIMIT
     )
-    if not new_report:
-        raise HTTPException(status_code=500, detail="신고 생성에 실패했습니다")
-    new_report["id"] = str(new_report["id"])
-    if new_report.get("reporter_id"):
-        new_report["reporter_id"] = str(new_report["reporter_id"])
-    return new_report
+    decoded_cursor = _decode_comment_cursor("replies", cursor) if cursor else None
+    rows = get_comment_replies(comment_id, limit=page_limit + 1, cursor=decoded_cursor)
+    items = [_serialize_comment(row) for row in rows[:page_limit]]
+    next_cursor = (
+        _encode_comment_cursor("replies", rows[page_limit - 1])
+        if len(rows) > page_limit
+        else None
+    )
+    return {"items": items, "next_cursor": next_cursor}
+
+
+# ============ Reports API ============
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+USER_CONTEXT_CACHE_TTL_SECONDS = 5.0
+USER_CONTEXT_CACHE_MAX_ENTRIES = 2048
+# user_id -> (만료 시각, token_version, 사용자 컨텍스트)
+_user_context_cache: OrderedDict[str, tuple[float, int, UserContext]] = OrderedDict()
+_user_context_cache_lock = Lock()
+_user_context_cache_generation = 0
+
+
+def _get_cached_user_context(user_id: str, token_version: int) -> Optional[UserContext]:
+    with _user_context_cache_lock:
+        entry = _user_context_cache.get(user_id)
+        if entry is None:
+            return None
+        expires_at, cached_token_version, context = entry
+        if expires_at <= time.perf_counter():
+            del _user_context_cache[user_id]
+            return None
+        if cached_token_version != token_version:
+            # 다른 버전의 토큰이면 DB 값으로 다시 판정한다
+            return None
+        _user_context_cache.move_to_end(user_id)
+        return context.copy()
+
+
+def _set_cached_user_context(
+    user_id: str, token_version: int, context: UserContext, generation: int
+) -> None:
+    with _user_context_cache_lock:
+        # 조회 도중 무효화가 있었다면 이전 값을 다시 넣지 않는다
+        if generation != _user_context_cache_generation:
+            return
+        _user_context_cache[user_id] = (
+            time.perf_counter() + USER_CONTEXT_CACHE_TTL_SECONDS,
+            token_version,
+            context,
+        )
+        _user_context_cache.move_to_end(user_id)
+        while len(_user_context_cache) > USER_CONTEXT_CACHE_MAX_ENTRIES:
+            _ = _user_context_cache.popitem(last=False)
+
+
+def _invalidate_user_context(
+    user_id: Optional[object] = None, broadcast: bool = True
+) -> None:
+    """사용자 상태/권한/토큰 버전이 바뀌면 호출 (None이면 전체 비움)"""
+    global _user_context_cache_generation
+    with _user_context_cache_lock:
+        _user_context_cache_generation += 1
+        if user_id is None:
+            _user_context_cache.clear()
+        else:
+            _ = _user_context_cache.pop(str(user_id), None)
+    if broadcast:
+        _cache_bus.publish("user", id=None if user_id is None else str(user_id))
+
+
+# ============ Cache Invalidation Bus ============
+
+CACHE_BUS_ENABLED = os.getenv("CACHE_BUS_ENABLED", "true").strip().lower() != "false"
+
+
+def _flush_local_caches() -> None:
+    """놓친 무효화 메시지가 있을 수 있을 때 이 워커의 캐시를 모두 비운다"""
+    _invalidate_projects_cache(broadcast=False)
+    _invalidate_user_context(broadcast=False)
+    invalidate_moderation_settings_cache(broadcast=False)
+
+
+def _apply_cache_invalidation(message: dict[str, object]) -> None:
+    """다른 워커가 보낸 무효화 메시지를 이 워커의 캐시에 반영"""
+    kind = message.get("k")
+    target_id = message.get("id")
+    if kind == "projects":
+        _invalidate_projects_cache(broadcast=False)
+    elif kind == "project" and isinstance(target_id, str):
+        _drop_cached_project(message)
+    elif kind == "project_like" and isinstance(target_id, str):
+        like_count = message.get("like_count")
+        if isinstance(like_count, int):
+            _patch_cached_project_like_count(target_id, like_count, broadcast=False)
+    elif kind == "user":
+        _invalidate_user_context(target_id, broadcast=False)
+    elif kind == "moderation_settings":
+        invalidate_moderation_settings_cache(broadcast=False)
+    else:
+        _flush_local_caches()
+
+
+_cache_bus = CacheInvalidationBus(
+    dsn=DATABASE_URL or "",
+    apply=_apply_cache_invalidation,
+    flush_all=_flush_local_caches,
+)
+
 
 async def get_current_user(token: str = Depends(oauth2_scheme)):
     payload = decode_token(token)
@@ -1087,7 +2670,17 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
     if not isinstance(user_id, str) or not user_id:
         raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다")
 
-    user = get_user_by_id(user_id)
+    token_version_claim = payload.get("sv")
+    token_version_from_claim = (
+        token_version_claim if isinstance(token_version_claim, int) else 0
+    )
+    cached_context = _get_cached_user_context(user_id, token_version_from_claim)
+    if cached_context is not None:
+        return cached_context
+
+    with _user_context_cache_lock:
+        generation = _user_context_cache_generation
+    user = await get_user_by_id_async(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
 
@@ -1097,10 +2690,6 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
             status_code=403, detail=get_blocked_user_message(user_status)
         )
 
-    token_version_claim = payload.get("sv")
-    token_version_from_claim = (
-        token_version_claim if isinstance(token_version_claim, int) else 0
-    )
     user_token_version = user.get("token_version")
     current_token_version = (
         user_token_version if isinstance(user_token_version, int) else 0
@@ -1110,7 +2699,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
             status_code=401, detail="세션이 만료되었습니다. 다시 로그인해 주세요"
         )
 
-    return {
+    context: UserContext = {
         "id": str(user["id"]),
         "email": user["email"],
         "nickname": user["nickname"],
@@ -1119,6 +2708,8 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         "avatar_url": user.get("avatar_url"),
         "bio": user.get("bio"),
     }
+    _set_cached_user_context(user_id, current_token_version, context.copy(), generation)
+    return context
 
 
 async def require_admin(current_user: UserContext = Depends(get_current_user)):
@@ -1133,6 +2724,47 @@ async def require_super_admin(current_user: UserContext = Depends(get_current_us
     return current_user
 
 
+def _normalize_like_project_id(project_id: str) -> str:
+    try:
+        return str(uuid.UUID(project_id))
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+
+@app.post(
+    "/api/projects/{project_id}/like",
+    dependencies=[Depends(rate_limit("project_like"))],
+)
+def like_project_endpoint(
+    project_id: str, current_user: UserContext = Depends(get_current_user)
+):
+    """프로젝트 좋아요 (사용자당 1회)"""
+    project_id = _normalize_like_project_id(project_id)
+    inserted = add_project_like(project_id, current_user["id"])
+    if inserted is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    like_count = _buffer_project_like(project_id, 1 if inserted else 0)
+    if inserted:
+        _patch_cached_project_like_count(project_id, like_count)
+    return {"like_count": like_count, "liked": True}
+
+
+@app.delete(
+    "/api/projects/{project_id}/like",
+    dependencies=[Depends(rate_limit("project_like"))],
+)
+def unlike_project_endpoint(
+    project_id: str, current_user: UserContext = Depends(get_current_user)
+):
+    """프로젝트 좋아요 취소"""
+    project_id = _normalize_like_project_id(project_id)
+    deleted = remove_project_like(project_id, current_user["id"])
+    like_count = _buffer_project_like(project_id, -1 if deleted else 0)
+    if deleted:
+        _patch_cached_project_like_count(project_id, like_count)
+    return {"like_count": like_count, "liked": False}
+
+
 @app.patch("/api/projects/{project_id}")
 def update_project_endpoint(
     project_id: str,
@@ -1160,17 +2792,20 @@ def update_project_endpoint(
         ]
     )
     settings = get_effective_moderation_settings()
-    blocked_keywords = cast(list[str], settings["blocked_keywords"])
-    if text_contains_blocked_keyword(content_for_check, blocked_keywords):
+    blocked_match = find_blocked_keyword(content_for_check, settings)
+    if blocked_match:
         raise HTTPException(
-            status_code=400, detail="금칙어가 포함된 내용은 수정할 수 없습니다"
+            status_code=400,
+            detail=blocked_keyword_detail(
+                "금칙어가 포함된 내용은 수정할 수 없습니다", blocked_match
+            ),
         )
 
     updated = update_project_owner_fields(project_id, updates)
     if not updated:
         raise HTTPException(status_code=500, detail="프로젝트 수정에 실패했습니다")
 
-    _invalidate_projects_cache()
+    _apply_project_cache_change(updated)
     updated["id"] = str(updated["id"])
     updated["author_id"] = str(updated["author_id"])
     return updated
@@ -1200,7 +2835,32 @@ def list_reports(
 @app.get("/api/admin/perf/projects")
 def get_projects_perf(current_user: UserContext = Depends(require_admin)):
     _ = current_user
-    return _project_perf_snapshot()
+    return {
+        **_project_perf_snapshot(),
+        "like_buffer": _project_like_buffer_snapshot(),
+        "cache_bus": _cache_bus.stats(),
+    }
+
+
+@app.get("/api/admin/perf/db")
+def get_db_perf(current_user: UserContext = Depends(require_admin)):
+    _ = current_user
+    return get_db_pool_stats()
+
+
+@app.get("/api/admin/perf/auth")
+def get_auth_perf(current_user: UserContext = Depends(require_admin)):
+    _ = current_user
+    return {
+        "password_hash": password_hash_pool.stats(),
+        "google_jwks": google_jwks_cache.stats(),
+    }
+
+
+@app.get("/api/admin/perf/maintenance")
+def get_maintenance_perf(current_user: UserContext = Depends(require_admin)):
+    _ = current_user
+    return _maintenance_snapshot()
 
 
 @app.get("/api/admin/integrations/oauth")
@@ -1289,6 +2949,16 @@ def list_admin_action_logs(
     return {"items": logs, "next_cursor": None}
 
 
+@app.get("/api/admin/action-logs/retention")
+def get_admin_action_log_retention(current_user: UserContext = Depends(require_admin)):
+    """관리자 로그 보관 기간 정리 진행 상황 (실행 중이면 마지막 배치 기준)"""
+    _ = current_user
+    stats = _maintenance_last_run_stats()
+    if stats is None:
+        return {"retention": None}
+    return {"retention": stats.get("admin_log_retention")}
+
+
 @app.get("/api/admin/users")
 def list_admin_users(
     limit: int = 200, current_user: UserContext = Depends(require_admin)
@@ -1333,7 +3003,7 @@ def update_admin_project(
     updated = update_project_admin(project_id, updates)
     if not updated:
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
-    _invalidate_projects_cache()
+    _apply_project_cache_change(updated)
 
     write_admin_action_log(
         admin_id=current_user["id"],
@@ -1358,7 +3028,7 @@ def hide_admin_project(
     updated = set_project_status(project_id=project_id, status="hidden")
     if not updated:
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
-    _invalidate_projects_cache()
+    _apply_project_cache_change(updated)
 
     write_admin_action_log(
         admin_id=current_user["id"],
@@ -1383,7 +3053,7 @@ def restore_admin_project(
     updated = set_project_status(project_id=project_id, status="published")
     if not updated:
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
-    _invalidate_projects_cache()
+    _apply_project_cache_change(updated)
 
     write_admin_action_log(
         admin_id=current_user["id"],
@@ -1408,7 +3078,7 @@ def delete_admin_project(
     updated = set_project_status(project_id=project_id, status="deleted")
     if not updated:
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
-    _invalidate_projects_cache()
+    _apply_project_cache_change(updated)
 
     write_admin_action_log(
         admin_id=current_user["id"],
@@ -1439,6 +3109,7 @@ def limit_user_endpoint(
         raise HTTPException(
             status_code=404, detail="사용자를 찾을 수 없거나 제한할 수 없습니다"
         )
+    _invalidate_user_context(user_id)
 
     write_admin_action_log(
         admin_id=current_user["id"],
@@ -1462,6 +3133,7 @@ def unlimit_user_endpoint(
         raise HTTPException(
             status_code=404, detail="사용자를 찾을 수 없거나 해제할 수 없습니다"
         )
+    _invalidate_user_context(user_id)
 
     write_admin_action_log(
         admin_id=current_user["id"],
@@ -1490,6 +3162,7 @@ def suspend_user_endpoint(
         raise HTTPException(
             status_code=404, detail="사용자를 찾을 수 없거나 정지할 수 없습니다"
         )
+    _invalidate_user_context(user_id)
 
     write_admin_action_log(
         admin_id=current_user["id"],
@@ -1516,6 +3189,7 @@ def unsuspend_user_endpoint(
         raise HTTPException(
             status_code=404, detail="사용자를 찾을 수 없거나 정지 해제할 수 없습니다"
         )
+    _invalidate_user_context(user_id)
 
     write_admin_action_log(
         admin_id=current_user["id"],
@@ -1542,6 +3216,7 @@ def revoke_user_tokens_endpoint(
     updated_user = revoke_user_tokens(user_id=user_id)
     if not updated_user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
+    _invalidate_user_context(user_id)
 
     write_admin_action_log(
         admin_id=current_user["id"],
@@ -1579,6 +3254,7 @@ def schedule_user_delete_endpoint(
             status_code=404,
             detail="사용자를 찾을 수 없거나 삭제 예약할 수 없습니다",
         )
+    _invalidate_user_context(user_id)
 
     write_admin_action_log(
         admin_id=current_user["id"],
@@ -1606,6 +3282,7 @@ def cancel_user_delete_schedule_endpoint(
             status_code=404,
             detail="삭제 예약 상태 사용자를 찾을 수 없거나 예약 취소할 수 없습니다",
         )
+    _invalidate_user_context(user_id)
 
     write_admin_action_log(
         admin_id=current_user["id"],
@@ -1636,6 +3313,7 @@ def delete_user_now_endpoint(
         raise HTTPException(
             status_code=404, detail="사용자를 찾을 수 없거나 삭제할 수 없습니다"
         )
+    _invalidate_user_context(user_id)
 
     write_admin_action_log(
         admin_id=current_user["id"],
@@ -1661,6 +3339,7 @@ def approve_user_endpoint(
     approved_user = approve_user(user_id=user_id)
     if not approved_user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
+    _invalidate_user_context(user_id)
 
     write_admin_action_log(
         admin_id=current_user["id"],
@@ -1684,6 +3363,7 @@ def reject_user_endpoint(
     rejected_user = reject_user(user_id=user_id)
     if not rejected_user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
+    _invalidate_user_context(user_id)
 
     write_admin_action_log(
         admin_id=current_user["id"],
@@ -1760,6 +3440,7 @@ def update_admin_policies(
     )
     if not updated:
         raise HTTPException(status_code=500, detail="정책 저장에 실패했습니다")
+    invalidate_moderation_settings_cache()
 
     write_admin_action_log(
         admin_id=current_user["id"],
@@ -1775,9 +3456,72 @@ def update_admin_policies(
         ),
     )
 
+    # 저장 직후 최신 설정과 변경자 정보로 캐시를 다시 채운다
+    invalidate_moderation_settings_cache()
+    previous_keywords = set(cast(list[str], current_settings["blocked_keywords"]))
+    added_keywords = [
+        keyword for keyword in effective_keywords if keyword not in previous_keywords
+    ]
+    if added_keywords:
+        # 기존 글은 이미 이전 금칙어로 점검했으므로 새로 추가된 금칙어만 훑는다
+        _ = start_moderation_sweep(
+            requested_by=current_user["id"], keywords=added_keywords
+        )
     return get_effective_moderation_settings()
 
 
+@app.get("/api/admin/moderation/sweep")
+def get_moderation_sweep_status(current_user: UserContext = Depends(require_admin)):
+    _ = current_user
+    sweep = get_latest_moderation_sweep()
+    if not sweep:
+        return {"sweep": None}
+    return {"sweep": serialize_moderation_sweep(sweep)}
+
+
+@app.post("/api/admin/moderation/sweep")
+def start_moderation_sweep_endpoint(
+    current_user: UserContext = Depends(require_admin),
+):
+    sweep = start_moderation_sweep(requested_by=current_user["id"])
+    write_admin_action_log(
+        admin_id=current_user["id"],
+        action_type="moderation_sweep_started",
+        target_type="moderation_sweep",
+        target_id=str(sweep["id"]),
+        reason="금칙어 소급 점검 수동 실행",
+    )
+    return {"sweep": sweep}
+
+
+@app.post("/api/admin/moderation/sweep/{sweep_id}/revert")
+def revert_moderation_sweep_endpoint(
+    sweep_id: str,
+    payload: AdminActionReasonRequest,
+    current_user: UserContext = Depends(require_admin),
+):
+    reason = require_action_reason(payload.reason)
+    restored = revert_moderation_sweep(sweep_id)
+    if restored is None:
+        raise HTTPException(
+            status_code=404, detail="되돌릴 금칙어 점검 작업을 찾을 수 없습니다"
+        )
+    if restored["projects_restored"]:
+        _invalidate_projects_cache()
+
+    write_admin_action_log(
+        admin_id=current_user["id"],
+        action_type="moderation_sweep_reverted",
+        target_type="moderation_sweep",
+        target_id=sweep_id,
+        reason=(
+            f"{reason} (projects={restored['projects_restored']}, "
+            f"comments={restored['comments_restored']})"
+        ),
+    )
+    return restored
+
+
 @app.patch("/api/admin/content/about")
 def update_about_content_endpoint(
     payload: AboutContentUpdateRequest,
@@ -1855,45 +3599,33 @@ def google_auth_start():
 
 
 @app.get("/api/auth/google/callback")
-def google_auth_callback(code: str, state: str):
-    oauth_settings = ensure_google_oauth_available()
+async def google_auth_callback(code: str, state: str):
+    # Google 호출은 이벤트 루프에서 기다리고, DB 작업만 스레드 풀로 보낸다
+    oauth_settings = await run_in_threadpool(ensure_google_oauth_available)
 
     decoded_state = decode_token(state)
     if not decoded_state or decoded_state.get("type") != "google_oauth_state":
         raise HTTPException(status_code=400, detail="유효하지 않은 OAuth state입니다")
-    if not consume_oauth_state_token(state):
+    if not await run_in_threadpool(consume_oauth_state_token, state):
         raise HTTPException(
             status_code=400,
             detail="만료되었거나 이미 사용된 OAuth state입니다",
         )
-    cleanup_oauth_state_tokens()
-
-    token_request_body = urlencode(
-        {
-            "code": code,
-            "client_id": GOOGLE_CLIENT_ID,
-            "client_secret": GOOGLE_CLIENT_SECRET,
-            "redirect_uri": oauth_settings["google_redirect_uri"],
-            "grant_type": "authorization_code",
-        }
-    ).encode("utf-8")
+    await run_in_threadpool(cleanup_oauth_state_tokens)
 
-    token_payload: dict[str, object] = {}
     try:
-        token_request = Request(
+        token_payload = await request_json(
+            "POST",
             "https://oauth2.googleapis.com/token",
-            data=token_request_body,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            method="POST",
+            data={
+                "code": code,
+                "client_id": GOOGLE_CLIENT_ID,
+                "client_secret": GOOGLE_CLIENT_SECRET,
+                "redirect_uri": str(oauth_settings["google_redirect_uri"]),
+                "grant_type": "authorization_code",
+            },
         )
-        with cast(_ReadableResponse, urlopen(token_request, timeout=10)) as response:
-            token_json = cast(object, json.loads(response.read().decode("utf-8")))
-            if not isinstance(token_json, dict):
-                raise HTTPException(
-                    status_code=502, detail="Google 토큰 응답이 유효하지 않습니다"
-                )
-            token_payload = cast(dict[str, object], token_json)
-    except Exception as error:
+    except OutboundHTTPError as error:
         raise HTTPException(
             status_code=502, detail="Google 토큰 교환에 실패했습니다"
         ) from error
@@ -1902,22 +3634,21 @@ def google_auth_callback(code: str, state: str):
     if not isinstance(raw_id_token, str) or not raw_id_token:
         raise HTTPException(status_code=400, detail="Google id_token이 누락되었습니다")
     id_token = raw_id_token
+    raw_access_token = token_payload.get("access_token")
+    google_access_token = (
+        raw_access_token if isinstance(raw_access_token, str) else None
+    )
 
-    profile_payload: dict[str, object] = {}
+    # tokeninfo 왕복 대신 캐시된 Google 서명 키로 직접 검증한다
     try:
-        profile_request = Request(
-            f"https://oauth2.googleapis.com/tokeninfo?id_token={quote(id_token)}",
-            method="GET",
+        profile_payload = await verify_google_id_token(
+            id_token, GOOGLE_CLIENT_ID, access_token=google_access_token
         )
-        with cast(_ReadableResponse, urlopen(profile_request, timeout=10)) as response:
-            profile_json = cast(object, json.loads(response.read().decode("utf-8")))
-            if not isinstance(profile_json, dict):
-                raise HTTPException(
-                    status_code=502,
-                    detail="Google 프로필 응답이 유효하지 않습니다",
-                )
-            profile_payload = cast(dict[str, object], profile_json)
-    except Exception as error:
+    except InvalidGoogleIdToken as error:
+        raise HTTPException(
+            status_code=400, detail="유효하지 않은 Google id_token입니다"
+        ) from error
+    except OutboundHTTPError as error:
         raise HTTPException(
             status_code=502, detail="Google 프로필 검증에 실패했습니다"
         ) from error
@@ -1932,15 +3663,18 @@ def google_auth_callback(code: str, state: str):
             status_code=400, detail="Google 계정 정보가 올바르지 않습니다"
         )
 
-    existing_google_user = get_user_by_provider("google", provider_user_id)
+    existing_google_user = await run_in_threadpool(
+        get_user_by_provider, "google", provider_user_id
+    )
     if existing_google_user:
         nickname_for_upsert = existing_google_user["nickname"]
     else:
-        nickname_for_upsert = ensure_unique_nickname(
-            build_google_nickname(profile_payload)
+        nickname_for_upsert = await run_in_threadpool(
+            ensure_unique_nickname, build_google_nickname(profile_payload)
         )
 
-    user = create_or_update_google_user(
+    user = await run_in_threadpool(
+        create_or_update_google_user,
         email=email,
         nickname=nickname_for_upsert,
         provider_user_id=provider_user_id,
@@ -1950,6 +3684,7 @@ def google_auth_callback(code: str, state: str):
         raise HTTPException(
             status_code=500, detail="Google 로그인 계정 생성에 실패했습니다"
         )
+    _invalidate_user_context(user["id"])
 
     frontend_base = str(oauth_settings["google_frontend_redirect_uri"]).rstrip("/")
     user_status = user.get("status") or "active"
@@ -1974,7 +3709,11 @@ def google_auth_callback(code: str, state: str):
     )
 
 
-@app.post("/api/auth/register", response_model=TokenResponse)
+@app.post(
+    "/api/auth/register",
+    response_model=TokenResponse,
+    dependencies=[Depends(rate_limit("auth_register"))],
+)
 def register(request: RegisterRequest):
     """회원가입"""
     # 이메일 중복 확인
@@ -2013,7 +3752,11 @@ def register(request: RegisterRequest):
     )
 
 
-@app.post("/api/auth/login", response_model=TokenResponse)
+@app.post(
+    "/api/auth/login",
+    response_model=TokenResponse,
+    dependencies=[Depends(rate_limit("auth_login"))],
+)
 def login(request: LoginRequest):
     """로그인"""
     user = get_user_by_email(request.email)
@@ -2084,10 +3827,13 @@ def create_project_endpoint(
             project.description or "",
         ]
     )
-    blocked_keywords = cast(list[str], settings["blocked_keywords"])
-    if text_contains_blocked_keyword(content_for_check, blocked_keywords):
+    blocked_match = find_blocked_keyword(content_for_check, settings)
+    if blocked_match:
         raise HTTPException(
-            status_code=400, detail="금칙어가 포함된 내용은 등록할 수 없습니다"
+            status_code=400,
+            detail=blocked_keyword_detail(
+                "금칙어가 포함된 내용은 등록할 수 없습니다", blocked_match
+            ),
         )
 
     payload = project.model_dump()
@@ -2095,7 +3841,9 @@ def create_project_endpoint(
     new_project = create_project(payload)
     if not new_project:
         raise HTTPException(status_code=500, detail="프로젝트 생성에 실패했습니다")
-    _invalidate_projects_cache()
+    _apply_project_cache_change(
+        {**new_project, "author_nickname": current_user["nickname"]}
+    )
     new_project["id"] = str(new_project["id"])
     new_project["author_id"] = str(new_project["author_id"])
     return new_project
@@ -2126,7 +3874,7 @@ async def update_me(
                 status_code=400,
                 detail=f"닉네임은 {PROFILE_NICKNAME_MAX_LEN}자를 초과할 수 없습니다",
             )
-        existing = get_user_by_nickname(nickname)
+        existing = await get_user_by_nickname_async(nickname)
         if existing and str(existing["id"]) != current_user["id"]:
             raise HTTPException(status_code=400, detail="이미 사용 중인 닉네임입니다")
         updates["nickname"] = nickname
@@ -2153,9 +3901,10 @@ async def update_me(
         else:
             updates["avatar_url"] = None
 
-    updated_user = update_user_profile(current_user["id"], updates)
+    updated_user = await update_user_profile_async(current_user["id"], updates)
     if not updated_user:
         raise HTTPException(status_code=500, detail="프로필 수정에 실패했습니다")
+    _invalidate_user_context(current_user["id"])
 
     return {
         "id": str(updated_user["id"]),
@@ -2168,17 +3917,23 @@ async def update_me(
     }
 
 
-@app.post("/api/projects/{project_id}/comments")
+@app.post(
+    "/api/projects/{project_id}/comments",
+    dependencies=[Depends(rate_limit("comment_create"))],
+)
 def create_comment_endpoint(
     project_id: str,
     comment: CommentCreate,
     current_user: UserContext = Depends(get_current_user),
 ):
     settings = get_effective_moderation_settings()
-    blocked_keywords = cast(list[str], settings["blocked_keywords"])
-    if text_contains_blocked_keyword(comment.content, blocked_keywords):
+    blocked_match = find_blocked_keyword(comment.content, settings)
+    if blocked_match:
         raise HTTPException(
-            status_code=400, detail="금칙어가 포함된 댓글은 작성할 수 없습니다"
+            status_code=400,
+            detail=blocked_keyword_detail(
+                "금칙어가 포함된 댓글은 작성할 수 없습니다", blocked_match
+            ),
         )
 
     new_comment = create_comment(
@@ -2194,6 +3949,82 @@ def create_comment_endpoint(
     return new_comment
 
 
+def submit_report(
+    target_type: str, target_id: str, report: ReportCreate, reporter_id: str
+):
+    """신고 등록, 누적 신고가 임계치에 닿아 대상이 숨겨졌으면 시스템 로그를 남긴다
+
+    같은 사용자는 대상마다 한 번만 신고할 수 있으므로 임계치는 서로 다른 신고자 수다.
+    """
+    not_found_detail = (
+        "프로젝트를 찾을 수 없습니다"
+        if target_type == "project"
+        else "댓글을 찾을 수 없습니다"
+    )
+    try:
+        target_id = str(uuid.UUID(target_id))
+    except ValueError:
+        raise HTTPException(status_code=404, detail=not_found_detail)
+
+    settings = get_effective_moderation_settings()
+    created = create_report(
+        target_type=target_type,
+        target_id=target_id,
+        reason=report.reason,
+        reporter_id=reporter_id,
+        memo=report.memo,
+        auto_hide_threshold=cast(int, settings["auto_hide_report_threshold"]),
+    )
+    if created is None:
+        raise HTTPException(status_code=404, detail=not_found_detail)
+    new_report, hidden_target = created
+    if new_report is None:
+        raise HTTPException(status_code=409, detail="이미 신고한 대상입니다")
+
+    if hidden_target:
+        if target_type == "project":
+            _apply_project_cache_change(hidden_target)
+        write_admin_action_log(
+            admin_id=SYSTEM_ADMIN_USER_ID,
+            action_type=f"{target_type}_auto_hidden",
+            target_type=target_type,
+            target_id=target_id,
+            reason=f"신고자 {settings['auto_hide_report_threshold']}명 이상으로 자동 숨김",
+        )
+
+    new_report["id"] = str(new_report["id"])
+    new_report["target_id"] = str(new_report["target_id"])
+    new_report["reporter_id"] = str(new_report["reporter_id"])
+    new_report["target_auto_hidden"] = hidden_target is not None
+    return new_report
+
+
+@app.post(
+    "/api/comments/{comment_id}/report",
+    dependencies=[Depends(rate_limit("report_create"))],
+)
+def report_comment_endpoint(
+    comment_id: str,
+    report: ReportCreate,
+    current_user: UserContext = Depends(get_current_user),
+):
+    """댓글 신고"""
+    return submit_report("comment", comment_id, report, current_user["id"])
+
+
+@app.post(
+    "/api/projects/{project_id}/report",
+    dependencies=[Depends(rate_limit("report_create"))],
+)
+def report_project_endpoint(
+    project_id: str,
+    report: ReportCreate,
+    current_user: UserContext = Depends(get_current_user),
+):
+    """프로젝트 신고"""
+    return submit_report("project", project_id, report, current_user["id"])
+
+
 @app.get("/api/me/projects")
 def get_my_projects(current_user: UserContext = Depends(get_current_user)):
     """내 프로젝트 목록"""
@@ -2202,3 +4033,23 @@ def get_my_projects(current_user: UserContext = Depends(get_current_user)):
         p["id"] = str(p["id"])
         p["author_id"] = str(p["author_id"])
     return {"items": projects, "next_cursor": None}
+
+
+@app.get("/api/me/likes")
+def get_my_like_status(
+    project_ids: list[str] = Query(default=[]),
+    current_user: UserContext = Depends(get_current_user),
+):
+    """프로젝트 목록의 좋아요 여부 일괄 조회"""
+    if len(project_ids) > PROJECT_LIST_MAX_LIMIT:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {PROJECT_LIST_MAX_LIMIT}개까지 조회할 수 있습니다",
+        )
+    try:
+        normalized_ids = list(dict.fromkeys(str(uuid.UUID(pid)) for pid in project_ids))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="유효하지 않은 프로젝트 ID입니다")
+
+    liked_ids = get_liked_project_ids(current_user["id"], normalized_ids)
+    return {"liked": {pid: pid in liked_ids for pid in normalized_ids}}
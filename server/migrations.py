@@ -0,0 +1,700 @@
+# pyright: reportDeprecated=false
+
+import re
+from typing import NamedTuple, Optional, Sequence
+
+from psycopg2 import errors
+from psycopg2.extensions import connection as PgConnection
+from psycopg2.extensions import cursor as PgCursor
+
+from db import get_db_connection
+
+# 여러 워커가 동시에 떠도 마이그레이션은 한 곳에서만 실행되도록 잡는 advisory lock 키
+MIGRATION_ADVISORY_LOCK_KEY = 7_214_530_019
+_CONCURRENT_INDEX_NAME = re.compile(
+    r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+IF\s+NOT\s+EXISTS\s+(\w+)",
+    re.IGNORECASE,
+)
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    statements: Sequence[str]
+    # True면 트랜잭션 밖(autocommit)에서 문장별로 실행 - CREATE INDEX CONCURRENTLY용
+    concurrent: bool = False
+
+
+# 기존 init_db가 매 부팅마다 실행하던 DDL. 이미 초기화된 DB에도 그대로 적용되도록
+# IF NOT EXISTS / ON CONFLICT 형태를 유지한다.
+_BASELINE_SCHEMA = (
+    """
+        CREATE TABLE IF NOT EXISTS users (
+            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            email VARCHAR(255) UNIQUE,
+            nickname VARCHAR(100) UNIQUE NOT NULL,
+            bio TEXT,
+            avatar_url VARCHAR(500),
+            role VARCHAR(20) DEFAULT 'user',
+            status VARCHAR(20) DEFAULT 'active',
+            provider VARCHAR(20) DEFAULT 'local',
+            provider_user_id VARCHAR(255),
+            email_verified BOOLEAN DEFAULT FALSE,
+            suspended_reason TEXT,
+            suspended_at TIMESTAMP,
+            suspended_by UUID REFERENCES users(id),
+            delete_scheduled_at TIMESTAMP,
+            deleted_at TIMESTAMP,
+            deleted_by UUID REFERENCES users(id),
+            token_version INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT NOW(),
+            updated_at TIMESTAMP DEFAULT NOW()
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS projects (
+            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            author_id UUID REFERENCES users(id),
+            title VARCHAR(255) NOT NULL,
+            summary VARCHAR(500) NOT NULL,
+            description TEXT,
+            thumbnail_url VARCHAR(500),
+            demo_url VARCHAR(500),
+            repo_url VARCHAR(500),
+            platform VARCHAR(50) DEFAULT 'web',
+            status VARCHAR(20) DEFAULT 'published',
+            like_count INTEGER DEFAULT 0,
+            comment_count INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT NOW(),
+            updated_at TIMESTAMP DEFAULT NOW()
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS comments (
+            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            project_id UUID REFERENCES projects(id) ON DELETE CASCADE,
+            author_id UUID REFERENCES users(id),
+            parent_id UUID REFERENCES comments(id),
+            content TEXT NOT NULL,
+            status VARCHAR(20) DEFAULT 'visible',
+            like_count INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT NOW(),
+            updated_at TIMESTAMP DEFAULT NOW()
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS project_likes (
+            project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+            user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            created_at TIMESTAMP DEFAULT NOW(),
+            PRIMARY KEY (project_id, user_id)
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS reports (
+            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            target_type VARCHAR(20) NOT NULL,
+            target_id UUID NOT NULL,
+            reporter_id UUID REFERENCES users(id),
+            reason VARCHAR(50) NOT NULL,
+            memo TEXT,
+            status VARCHAR(20) DEFAULT 'open',
+            created_at TIMESTAMP DEFAULT NOW(),
+            resolved_at TIMESTAMP
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS report_counters (
+            target_type VARCHAR(20) NOT NULL,
+            target_id UUID NOT NULL,
+            open_count INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT NOW(),
+            PRIMARY KEY (target_type, target_id)
+        )
+    """,
+    """
+        INSERT INTO report_counters (target_type, target_id, open_count)
+        SELECT target_type, target_id, COUNT(*)
+        FROM reports
+        WHERE status = 'open'
+          AND NOT EXISTS (SELECT 1 FROM report_counters)
+        GROUP BY target_type, target_id
+    """,
+    """
+        CREATE UNLOGGED TABLE IF NOT EXISTS rate_limit_buckets (
+            bucket_key TEXT PRIMARY KEY,
+            tokens DOUBLE PRECISION NOT NULL,
+            allowed BOOLEAN NOT NULL,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp(),
+            idle_until TIMESTAMPTZ NOT NULL
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS admin_action_logs (
+            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            admin_id UUID REFERENCES users(id),
+            action_type VARCHAR(50) NOT NULL,
+            target_type VARCHAR(20) NOT NULL,
+            target_id UUID NOT NULL,
+            reason TEXT,
+            created_at TIMESTAMP DEFAULT NOW()
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS moderation_settings (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            blocked_keywords TEXT[] DEFAULT '{}',
+            auto_hide_report_threshold INTEGER DEFAULT 3,
+            home_filter_tabs JSONB DEFAULT '[]'::jsonb,
+            explore_filter_tabs JSONB DEFAULT '[]'::jsonb,
+            admin_log_retention_days INTEGER DEFAULT 365,
+            admin_log_view_window_days INTEGER DEFAULT 30,
+            admin_log_mask_reasons BOOLEAN DEFAULT TRUE,
+            updated_at TIMESTAMP DEFAULT NOW()
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS moderation_sweeps (
+            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            status VARCHAR(20) NOT NULL DEFAULT 'running',
+            phase VARCHAR(20) NOT NULL DEFAULT 'projects',
+            last_id UUID,
+            scanned_count INTEGER NOT NULL DEFAULT 0,
+            hidden_count INTEGER NOT NULL DEFAULT 0,
+            batch_count INTEGER NOT NULL DEFAULT 0,
+            requested_by UUID REFERENCES users(id),
+            error TEXT,
+            started_at TIMESTAMP DEFAULT NOW(),
+            updated_at TIMESTAMP DEFAULT NOW(),
+            finished_at TIMESTAMP
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS site_contents (
+            content_key VARCHAR(100) PRIMARY KEY,
+            content_json JSONB NOT NULL,
+            updated_at TIMESTAMP DEFAULT NOW()
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS oauth_runtime_settings (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            google_oauth_enabled BOOLEAN DEFAULT FALSE,
+            google_redirect_uri TEXT,
+            google_frontend_redirect_uri TEXT,
+            updated_at TIMESTAMP DEFAULT NOW()
+        )
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS oauth_state_tokens (
+            state_hash VARCHAR(64) PRIMARY KEY,
+            expires_at TIMESTAMP NOT NULL,
+            consumed_at TIMESTAMP,
+            created_at TIMESTAMP DEFAULT NOW()
+        )
+    """,
+    """
+        INSERT INTO users (id, nickname, role)
+        VALUES ('11111111-1111-1111-1111-111111111111', 'devkim', 'admin')
+        ON CONFLICT DO NOTHING
+    """,
+    """
+        ALTER TABLE users ADD COLUMN IF NOT EXISTS password_hash VARCHAR(255)
+    """,
+    """
+        ALTER TABLE users ADD COLUMN IF NOT EXISTS limited_until TIMESTAMP
+    """,
+    """
+        ALTER TABLE users ADD COLUMN IF NOT EXISTS limited_reason TEXT
+    """,
+    """
+        ALTER TABLE users ADD COLUMN IF NOT EXISTS status VARCHAR(20) DEFAULT 'active'
+    """,
+    """
+        ALTER TABLE users ADD COLUMN IF NOT EXISTS provider VARCHAR(20) DEFAULT 'local'
+    """,
+    """
+        ALTER TABLE users ADD COLUMN IF NOT EXISTS provider_user_id VARCHAR(255)
+    """,
+    """
+        ALTER TABLE users ADD COLUMN IF NOT EXISTS email_verified BOOLEAN DEFAULT FALSE
+    """,
+    """
+        ALTER TABLE users ADD COLUMN IF NOT EXISTS suspended_reason TEXT
+    """,
+    """
+        ALTER TABLE users ADD COLUMN IF NOT EXISTS suspended_at TIMESTAMP
+    """,
+    """
+        ALTER TABLE users ADD COLUMN IF NOT EXISTS suspended_by UUID REFERENCES users(id)
+    """,
+    """
+        ALTER TABLE users ADD COLUMN IF NOT EXISTS delete_scheduled_at TIMESTAMP
+    """,
+    """
+        ALTER TABLE users ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP
+    """,
+    """
+        ALTER TABLE users ADD COLUMN IF NOT EXISTS deleted_by UUID REFERENCES users(id)
+    """,
+    """
+        ALTER TABLE users ADD COLUMN IF NOT EXISTS token_version INTEGER DEFAULT 0
+    """,
+    """
+        UPDATE users SET status = 'active' WHERE status IS NULL
+    """,
+    """
+        UPDATE users SET token_version = 0 WHERE token_version IS NULL
+    """,
+    """
+        UPDATE users SET provider = 'local' WHERE provider IS NULL
+    """,
+    """
+        INSERT INTO moderation_settings (id, blocked_keywords, auto_hide_report_threshold)
+        VALUES (1, '{}', 3)
+        ON CONFLICT (id) DO NOTHING
+    """,
+    """
+        ALTER TABLE moderation_settings
+        ADD COLUMN IF NOT EXISTS home_filter_tabs JSONB DEFAULT '[]'::jsonb
+    """,
+    """
+        ALTER TABLE moderation_settings
+        ADD COLUMN IF NOT EXISTS explore_filter_tabs JSONB DEFAULT '[]'::jsonb
+    """,
+    """
+        ALTER TABLE moderation_settings
+        ADD COLUMN IF NOT EXISTS admin_log_retention_days INTEGER DEFAULT 365
+    """,
+    """
+        ALTER TABLE moderation_settings
+        ADD COLUMN IF NOT EXISTS admin_log_view_window_days INTEGER DEFAULT 30
+    """,
+    """
+        ALTER TABLE moderation_settings
+        ADD COLUMN IF NOT EXISTS admin_log_mask_reasons BOOLEAN DEFAULT TRUE
+    """,
+    """
+        INSERT INTO oauth_runtime_settings (id, google_oauth_enabled)
+        VALUES (1, FALSE)
+        ON CONFLICT (id) DO NOTHING
+    """,
+    """
+        ALTER TABLE projects ADD COLUMN IF NOT EXISTS tags TEXT[] DEFAULT '{}'
+    """,
+)
+
+_BASELINE_INDEXES = (
+    """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_projects_status_created_at
+        ON projects (status, created_at DESC)
+    """,
+    """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_projects_status_like_count
+        ON projects (status, like_count DESC)
+    """,
+    """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_projects_status_platform_created_at
+        ON projects (status, platform, created_at DESC)
+    """,
+    """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_projects_tags_gin
+        ON projects USING GIN (tags)
+    """,
+    """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_comments_project_status_created_at
+        ON comments (project_id, status, created_at DESC)
+    """,
+    """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_comments_parent_created_at
+        ON comments (parent_id, created_at)
+        WHERE parent_id IS NOT NULL
+    """,
+    """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_project_likes_user_project
+        ON project_likes (user_id, project_id)
+    """,
+    """
+        CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_users_provider_provider_user_id
+        ON users (provider, provider_user_id)
+        WHERE provider_user_id IS NOT NULL
+    """,
+    """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_oauth_state_tokens_expires_at
+        ON oauth_state_tokens (expires_at)
+    """,
+    """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_oauth_state_tokens_consumed_at
+        ON oauth_state_tokens (consumed_at)
+    """,
+    """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_admin_action_logs_created_at
+        ON admin_action_logs (created_at DESC)
+    """,
+    """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_admin_action_logs_target
+        ON admin_action_logs (target_type, target_id)
+    """,
+    """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_admin_action_logs_action_type
+        ON admin_action_logs (action_type)
+    """,
+)
+
+_MAINTENANCE_LEASES = (
+    """
+        CREATE TABLE IF NOT EXISTS maintenance_leases (
+            name VARCHAR(50) PRIMARY KEY,
+            holder VARCHAR(120),
+            acquired_at TIMESTAMP,
+            expires_at TIMESTAMP NOT NULL DEFAULT NOW(),
+            last_run_holder VARCHAR(120),
+            last_run_started_at TIMESTAMP,
+            last_run_finished_at TIMESTAMP,
+            last_run_stats JSONB,
+            last_run_error TEXT
+        )
+    """,
+)
+
+# 월별 파티션을 만들어 붙이는 함수. default 파티션이 남아 있으면(마이그레이션 7 이전)
+# 같은 달 행을 옮기는 동안 default 쓰기를 막아야 ATTACH가 새로 들어온 행에 걸려 실패하지 않는다.
+_ENSURE_ADMIN_ACTION_LOG_PARTITION = """
+        CREATE OR REPLACE FUNCTION ensure_admin_action_log_partition(month_start TIMESTAMP)
+        RETURNS TEXT
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            range_start TIMESTAMP := date_trunc('month', month_start);
+            range_end TIMESTAMP := date_trunc('month', month_start) + INTERVAL '1 month';
+            partition_name TEXT := 'admin_action_logs_p' || to_char(range_start, 'YYYYMM');
+        BEGIN
+            IF to_regclass(partition_name) IS NOT NULL THEN
+                RETURN NULL;
+            END IF;
+            BEGIN
+                EXECUTE format(
+                    'CREATE TABLE %I (LIKE admin_action_logs INCLUDING DEFAULTS)',
+                    partition_name
+                );
+            EXCEPTION WHEN duplicate_table OR unique_violation THEN
+                -- 다른 세션이 같은 달 파티션을 먼저 만들었다
+                RETURN NULL;
+            END;
+            IF to_regclass('admin_action_logs_default') IS NOT NULL THEN
+                LOCK TABLE admin_action_logs_default IN ACCESS EXCLUSIVE MODE;
+                EXECUTE format(
+                    'WITH moved AS (
+                        DELETE FROM admin_action_logs_default
+                        WHERE created_at >= %L AND created_at < %L
+                        RETURNING *
+                    ) INSERT INTO %I SELECT * FROM moved',
+                    range_start, range_end, partition_name
+                );
+            END IF;
+            EXECUTE format(
+                'ALTER TABLE admin_action_logs ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                partition_name, range_start, range_end
+            );
+            RETURN partition_name;
+        END;
+        $$
+"""
+
+# admin_action_logs를 created_at 기준 월별 범위 파티션 테이블로 전환한다.
+# - 파티션 이름은 admin_action_logs_pYYYYMM, 보관 기간 정리는 지난 파티션을 통째로 지운다.
+# - 범위에 맞는 파티션이 없는 행은 default 파티션으로 들어가므로 INSERT가 실패하지 않고,
+#   나중에 그 달 파티션을 만들 때 옮겨진다. (default 파티션은 마이그레이션 7에서 없앤다)
+# - 기존 행은 한 트랜잭션 안에서 복사하므로 전환하는 동안 로그 테이블이 잠긴다.
+_PARTITION_ADMIN_ACTION_LOGS = (
+    """
+        ALTER TABLE admin_action_logs RENAME TO admin_action_logs_legacy
+    """,
+    """
+        ALTER INDEX admin_action_logs_pkey RENAME TO admin_action_logs_legacy_pkey
+    """,
+    """
+        DROP INDEX IF EXISTS
+            idx_admin_action_logs_created_at,
+            idx_admin_action_logs_target,
+            idx_admin_action_logs_action_type
+    """,
+    """
+        CREATE TABLE admin_action_logs (
+            id UUID NOT NULL DEFAULT gen_random_uuid(),
+            admin_id UUID REFERENCES users(id),
+            action_type VARCHAR(50) NOT NULL,
+            target_type VARCHAR(20) NOT NULL,
+            target_id UUID NOT NULL,
+            reason TEXT,
+            created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """,
+    """
+        CREATE TABLE admin_action_logs_default
+        PARTITION OF admin_action_logs DEFAULT
+    """,
+    """
+        CREATE INDEX idx_admin_action_logs_created_at
+        ON admin_action_logs (created_at DESC)
+    """,
+    """
+        CREATE INDEX idx_admin_action_logs_target
+        ON admin_action_logs (target_type, target_id)
+    """,
+    """
+        CREATE INDEX idx_admin_action_logs_action_type
+        ON admin_action_logs (action_type)
+    """,
+    _ENSURE_ADMIN_ACTION_LOG_PARTITION,
+    """
+        DO $$
+        DECLARE
+            month_start TIMESTAMP := date_trunc(
+                'month',
+                COALESCE((SELECT MIN(created_at) FROM admin_action_logs_legacy), NOW())
+            );
+        BEGIN
+            WHILE month_start <= date_trunc('month', NOW()) + INTERVAL '2 months' LOOP
+                PERFORM ensure_admin_action_log_partition(month_start);
+                month_start := month_start + INTERVAL '1 month';
+            END LOOP;
+        END;
+        $$
+    """,
+    """
+        INSERT INTO admin_action_logs
+            (id, admin_id, action_type, target_type, target_id, reason, created_at)
+        SELECT id, admin_id, action_type, target_type, target_id, reason,
+               COALESCE(created_at, NOW())
+        FROM admin_action_logs_legacy
+    """,
+    """
+        DROP TABLE admin_action_logs_legacy
+    """,
+)
+
+# 금칙어 소급 점검: 점검할 금칙어(NULL이면 전체)와 숨긴 대상을 기록해 되돌릴 수 있게 한다
+_MODERATION_SWEEP_ITEMS = (
+    """
+        ALTER TABLE moderation_sweeps ADD COLUMN IF NOT EXISTS keywords TEXT[]
+    """,
+    """
+        CREATE TABLE IF NOT EXISTS moderation_sweep_hidden_items (
+            sweep_id UUID NOT NULL REFERENCES moderation_sweeps(id) ON DELETE CASCADE,
+            target_type VARCHAR(20) NOT NULL,
+            target_id UUID NOT NULL,
+            hidden_at TIMESTAMP NOT NULL DEFAULT NOW(),
+            restored_at TIMESTAMP,
+            PRIMARY KEY (sweep_id, target_type, target_id)
+        )
+    """,
+)
+
+# 신고는 (대상, 신고자)마다 하나만 - 자동 숨김 임계치를 서로 다른 로그인 사용자 수로 센다.
+# 예전 신고(시스템 계정 id로 저장된 익명 신고, 같은 사용자의 중복 신고)는 그대로 두고,
+# 유일성은 적용 시각 이후의 신고에만 건다. 신고 수는 시스템 계정을 뺀 서로 다른 신고자 수다.
+_UNIQUE_NEW_REPORTERS = (
+    """
+        DO $$
+        BEGIN
+            IF to_regclass('reports_target_reporter_new_key') IS NULL THEN
+                EXECUTE format(
+                    'CREATE UNIQUE INDEX reports_target_reporter_new_key
+                     ON reports (target_type, target_id, reporter_id)
+                     WHERE created_at >= %L::timestamp',
+                    LOCALTIMESTAMP
+                );
+            END IF;
+        END
+        $$
+    """,
+    """
+        DELETE FROM report_counters
+    """,
+    """
+        INSERT INTO report_counters (target_type, target_id, open_count)
+        SELECT target_type, target_id, COUNT(DISTINCT reporter_id)
+        FROM reports
+        WHERE status = 'open'
+          AND reporter_id <> '11111111-1111-1111-1111-111111111111'
+        GROUP BY target_type, target_id
+    """,
+)
+
+# 0006의 예전 버전은 중복/익명 신고의 reporter_id를 지우고 전체 UNIQUE 제약을 걸었다.
+# 그 버전이 적용된 DB도 새 신고에만 유일성을 거는 형태로 맞춘다.
+_UNIQUE_NEW_REPORTERS_ONLY = (
+    """
+        ALTER TABLE reports DROP CONSTRAINT IF EXISTS reports_target_reporter_key
+    """,
+    *_UNIQUE_NEW_REPORTERS,
+)
+
+# create_report의 기존 신고 확인과 update_report의 신고 수 재계산용
+_REPORTS_TARGET_REPORTER_INDEX = (
+    """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_reports_target_reporter
+        ON reports (target_type, target_id, reporter_id)
+    """,
+)
+
+# 지난 파티션을 DETACH PARTITION ... CONCURRENTLY로 떼어 내려면 default 파티션이 없어야 한다.
+# default에 들어간 행은 그 달 파티션으로 옮기고 default를 없앤다. 이후 파티션이 없는 달의
+# 로그는 create_admin_action_log가 파티션을 만든 뒤 다시 기록한다.
+_DROP_ADMIN_LOG_DEFAULT_PARTITION = (
+    _ENSURE_ADMIN_ACTION_LOG_PARTITION,
+    """
+        DO $$
+        DECLARE
+            month_start TIMESTAMP;
+        BEGIN
+            IF to_regclass('admin_action_logs_default') IS NULL THEN
+                RETURN;
+            END IF;
+            -- 부모부터 잠가 로그 기록과 교착되지 않게 한다 (파티션도 함께 잠긴다)
+            LOCK TABLE admin_action_logs IN ACCESS EXCLUSIVE MODE;
+            FOR month_start IN
+                SELECT DISTINCT date_trunc('month', created_at)
+                FROM admin_action_logs_default
+            LOOP
+                PERFORM ensure_admin_action_log_partition(month_start);
+            END LOOP;
+            ALTER TABLE admin_action_logs DETACH PARTITION admin_action_logs_default;
+            DROP TABLE admin_action_logs_default;
+        END;
+        $$
+    """,
+)
+
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(1, "baseline_schema", _BASELINE_SCHEMA),
+    Migration(2, "baseline_indexes", _BASELINE_INDEXES, concurrent=True),
+    Migration(3, "maintenance_leases", _MAINTENANCE_LEASES),
+    Migration(4, "partition_admin_action_logs", _PARTITION_ADMIN_ACTION_LOGS),
+    Migration(5, "moderation_sweep_items", _MODERATION_SWEEP_ITEMS),
+    Migration(6, "unique_reporters", _UNIQUE_NEW_REPORTERS),
+    Migration(
+        7, "drop_admin_action_logs_default_partition", _DROP_ADMIN_LOG_DEFAULT_PARTITION
+    ),
+    Migration(8, "unique_new_reporters_only", _UNIQUE_NEW_REPORTERS_ONLY),
+    Migration(
+        9,
+        "reports_target_reporter_index",
+        _REPORTS_TARGET_REPORTER_INDEX,
+        concurrent=True,
+    ),
+)
+LATEST_MIGRATION_VERSION = max(migration.version for migration in MIGRATIONS)
+
+
+def _current_version() -> Optional[int]:
+    """적용된 최신 버전 (schema_migrations가 아직 없으면 None)"""
+    with get_db_connection() as conn:
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT MAX(version) FROM schema_migrations")
+                row = cur.fetchone()
+        except errors.UndefinedTable:
+            conn.rollback()
+            return None
+        conn.rollback()
+        return int(row[0]) if row and row[0] is not None else 0
+
+
+def _drop_invalid_index(cur: PgCursor, statement: str) -> None:
+    # 중단된 CONCURRENTLY 빌드는 INVALID 인덱스를 남기고, IF NOT EXISTS는 이를 건너뛴다
+    match = _CONCURRENT_INDEX_NAME.search(statement)
+    if not match:
+        return
+    cur.execute(
+        """
+        SELECT 1
+        FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE c.relname = %s AND NOT i.indisvalid
+        """,
+        (match.group(1),),
+    )
+    if cur.fetchone():
+        cur.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {match.group(1)}")
+
+
+def _apply(conn: PgConnection, migration: Migration) -> None:
+    if migration.concurrent:
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cur:
+                for statement in migration.statements:
+                    _drop_invalid_index(cur, statement)
+                    cur.execute(statement)
+                cur.execute(
+                    "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                    (migration.version, migration.name),
+                )
+        finally:
+            conn.autocommit = False
+        return
+
+    with conn.cursor() as cur:
+        for statement in migration.statements:
+            cur.execute(statement)
+        cur.execute(
+            "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+            (migration.version, migration.name),
+        )
+    conn.commit()
+
+
+def run_migrations(migrations: Sequence[Migration] = MIGRATIONS) -> list[int]:
+    """아직 적용되지 않은 마이그레이션만 순서대로 적용하고 적용한 버전 목록 반환
+
+    이미 최신이면 조회 한 번으로 끝난다. 적용이 필요하면 advisory lock을 잡아
+    다른 워커는 끝날 때까지 기다렸다가 다시 확인만 하고 지나간다.
+    """
+    latest = max(migration.version for migration in migrations)
+    current = _current_version()
+    if current is not None and current >= latest:
+        return []
+
+    applied_now: list[int] = []
+    with get_db_connection() as conn:
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT pg_advisory_lock(%s)", (MIGRATION_ADVISORY_LOCK_KEY,)
+                )
+                cur.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS schema_migrations (
+                        version INTEGER PRIMARY KEY,
+                        name VARCHAR(100) NOT NULL,
+                        applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+                    )
+                    """
+                )
+                cur.execute("SELECT version FROM schema_migrations")
+                applied = {int(row[0]) for row in cur.fetchall()}
+            conn.autocommit = False
+
+            for migration in sorted(migrations, key=lambda item: item.version):
+                if migration.version in applied:
+                    continue
+                try:
+                    _apply(conn, migration)
+                except Exception:
+                    conn.rollback()
+                    raise
+                applied_now.append(migration.version)
+                print(f"[migrations] applied {migration.version:04d}_{migration.name}")
+        finally:
+            conn.rollback()
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT pg_advisory_unlock(%s)", (MIGRATION_ADVISORY_LOCK_KEY,)
+                )
+            conn.autocommit = False
+    return applied_now
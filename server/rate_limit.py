@@ -0,0 +1,198 @@
+# pyright: reportDeprecated=false
+
+import time
+import zlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, NamedTuple, Optional, Protocol
+
+
+class RateLimitPolicy(NamedTuple):
+    # 순간적으로 허용할 요청 수(버킷 크기)
+    capacity: int
+    # 초당 다시 채워지는 토큰 수
+    refill_per_second: float
+    # True면 로그인 사용자 기준, False면 클라이언트 IP 기준
+    per_user: bool = False
+
+    @property
+    def idle_seconds(self) -> float:
+        """빈 버킷이 다시 가득 차는 시간 - 이만큼 쉬면 버킷을 지워도 결과가 같다"""
+        return self.capacity / self.refill_per_second
+
+
+class RateLimiter(Protocol):
+    def acquire(self, key: str, policy: RateLimitPolicy) -> float:
+        """토큰 하나를 쓰고 0을, 부족하면 다시 시도할 때까지의 초를 반환"""
+        ...
+
+
+class _Bucket:
+    __slots__: tuple[str, ...] = ("tokens", "updated_at", "idle_seconds")
+
+    def __init__(self, tokens: float, updated_at: float, idle_seconds: float) -> None:
+        self.tokens: float = tokens
+        self.updated_at: float = updated_at
+        self.idle_seconds: float = idle_seconds
+
+
+class _Shard:
+    __slots__: tuple[str, ...] = ("lock", "buckets")
+
+    def __init__(self) -> None:
+        self.lock: Lock = Lock()
+        # 마지막 사용 순서 (앞쪽이 가장 오래 쉰 버킷)
+        self.buckets: OrderedDict[str, _Bucket] = OrderedDict()
+
+
+class InMemoryRateLimiter:
+    """프로세스 내 토큰 버킷 - 키 해시로 샤드를 나눠 락 경합을 줄인다
+
+    요청마다 샤드 하나만 잠그고, 오래 쉰 버킷은 샤드 앞쪽에서부터
+    몇 개씩 지워 호출당 비용을 O(1)로 유지한다.
+    """
+
+    def __init__(
+        self,
+        shards: int = 16,
+        max_buckets_per_shard: int = 4096,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._shards: list[_Shard] = [_Shard() for _ in range(shards)]
+        self._max_buckets_per_shard: int = max_buckets_per_shard
+        self._clock: Callable[[], float] = clock
+        self._stats_lock: Lock = Lock()
+        self._allowed_total: int = 0
+        self._limited_total: int = 0
+        self._evicted_total: int = 0
+
+    def _shard_for(self, key: str) -> _Shard:
+        return self._shards[zlib.crc32(key.encode("utf-8")) % len(self._shards)]
+
+    def acquire(self, key: str, policy: RateLimitPolicy) -> float:
+        now = self._clock()
+        shard = self._shard_for(key)
+        with shard.lock:
+            bucket = shard.buckets.get(key)
+            if bucket is None:
+                bucket = _Bucket(float(policy.capacity), now, policy.idle_seconds)
+                shard.buckets[key] = bucket
+            else:
+                elapsed = max(0.0, now - bucket.updated_at)
+                bucket.tokens = min(
+                    float(policy.capacity),
+                    bucket.tokens + elapsed * policy.refill_per_second,
+                )
+                bucket.updated_at = now
+                shard.buckets.move_to_end(key)
+
+            if bucket.tokens >= 1.0:
+                bucket.tokens -= 1.0
+                retry_after = 0.0
+            else:
+                retry_after = (1.0 - bucket.tokens) / policy.refill_per_second
+            evicted = self._evict_idle(shard, now)
+
+        with self._stats_lock:
+            if retry_after:
+                self._limited_total += 1
+            else:
+                self._allowed_total += 1
+            self._evicted_total += evicted
+        return retry_after
+
+    def _evict_idle(self, shard: _Shard, now: float, max_checks: int = 2) -> int:
+        evicted = 0
+        while shard.buckets and len(shard.buckets) > self._max_buckets_per_shard:
+            _ = shard.buckets.popitem(last=False)
+            evicted += 1
+        for _ in range(max_checks):
+            if not shard.buckets:
+                break
+            key, bucket = next(iter(shard.buckets.items()))
+            if now - bucket.updated_at < bucket.idle_seconds:
+                break
+            del shard.buckets[key]
+            evicted += 1
+        return evicted
+
+    def reset(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.buckets.clear()
+
+    def stats(self) -> dict[str, int]:
+        bucket_count = 0
+        for shard in self._shards:
+            with shard.lock:
+                bucket_count += len(shard.buckets)
+        with self._stats_lock:
+            return {
+                "buckets": bucket_count,
+                "allowed_total": self._allowed_total,
+                "limited_total": self._limited_total,
+                "evicted_total": self._evicted_total,
+            }
+
+
+class SharedRateLimiter:
+    """여러 워커가 같은 버킷을 보도록 공유 저장소(Postgres 등)에 위임
+
+    consume은 (키, 정책)을 받아 원자적으로 토큰을 쓰고 (허용 여부, 남은 토큰)을
+    돌려주는 함수다. 저장소가 응답하지 않으면 프로세스 내 버킷으로 대신 판단한다.
+    저장소 장애 로그는 요청마다 찍지 않고 log_interval_seconds에 한 번만 남긴다.
+    """
+
+    def __init__(
+        self,
+        consume: Callable[[str, int, float], tuple[bool, float]],
+        fallback: Optional[InMemoryRateLimiter] = None,
+        log_interval_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._consume: Callable[[str, int, float], tuple[bool, float]] = consume
+        self._fallback: InMemoryRateLimiter = fallback or InMemoryRateLimiter()
+        self._log_interval_seconds: float = log_interval_seconds
+        self._clock: Callable[[], float] = clock
+        self._log_lock: Lock = Lock()
+        self._last_logged_at: Optional[float] = None
+        self._unlogged_errors: int = 0
+        self._fallback_total: int = 0
+
+    def _log_backend_error(self, error: Exception) -> None:
+        now = self._clock()
+        with self._log_lock:
+            if (
+                self._last_logged_at is not None
+                and now - self._last_logged_at < self._log_interval_seconds
+            ):
+                self._unlogged_errors += 1
+                return
+            suppressed = self._unlogged_errors
+            self._last_logged_at = now
+            self._unlogged_errors = 0
+        suffix = f" ({suppressed} more since last log)" if suppressed else ""
+        print(
+            f"[rate-limit] shared backend error, using local buckets: {error}{suffix}"
+        )
+
+    def acquire(self, key: str, policy: RateLimitPolicy) -> float:
+        try:
+            allowed, tokens = self._consume(
+                key, policy.capacity, policy.refill_per_second
+            )
+        except Exception as error:
+            self._fallback_total += 1
+            self._log_backend_error(error)
+            return self._fallback.acquire(key, policy)
+        if allowed:
+            return 0.0
+        return (1.0 - tokens) / policy.refill_per_second
+
+    def reset(self) -> None:
+        self._fallback.reset()
+
+    def stats(self) -> dict[str, int]:
+        stats = self._fallback.stats()
+        stats["fallback_total"] = self._fallback_total
+        return stats
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import os
+import sys
+import uuid
+from pathlib import Path
+from typing import Any, Iterator
+
+import psycopg2
+import pytest
+from psycopg2 import sql
+from psycopg2.extensions import make_dsn
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import db
+
+# 실제 Postgres가 필요한 테스트(*_pg.py)는 이 값이 있을 때만 실행한다
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+@pytest.fixture
+def pg_database(monkeypatch: Any) -> Iterator[None]:
+    """테스트마다 빈 데이터베이스를 만들어 db 풀을 그쪽으로 돌린다"""
+    assert TEST_DATABASE_URL is not None
+    name = f"test_pg_{uuid.uuid4().hex[:12]}"
+    admin = psycopg2.connect(TEST_DATABASE_URL)
+    admin.autocommit = True
+    with admin.cursor() as cur:
+        cur.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(name)))
+    monkeypatch.setattr(db, "DATABASE_URL", make_dsn(TEST_DATABASE_URL, dbname=name))
+    monkeypatch.setattr(db, "_db_pool", None)
+    try:
+        yield
+    finally:
+        if db._db_pool is not None:
+            db._db_pool.closeall()
+        with admin.cursor() as cur:
+            cur.execute(
+                sql.SQL("DROP DATABASE {} WITH (FORCE)").format(sql.Identifier(name))
+            )
+        admin.close()
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import sys
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from psycopg2 import sql
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import db
+import migrations
+from conftest import TEST_DATABASE_URL
+
+# 파티션 DDL은 흉내 낼 수 없으므로 실제 Postgres(14+)가 있을 때만 실행한다
+pytestmark = [
+    pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set"),
+    pytest.mark.usefixtures("pg_database"),
+]
+
+
+def _fetch(
+    query: str | sql.Composable, params: tuple[Any, ...] = ()
+) -> list[tuple[Any, ...]]:
+    with db.get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(query, params)
+            rows = cur.fetchall() if cur.description else []
+        conn.commit()
+    return rows
+
+
+def _insert_log(created_at: str) -> None:
+    _ = _fetch(
+        """
+        INSERT INTO admin_action_logs (action_type, target_type, target_id, created_at)
+        VALUES ('test', 'project', gen_random_uuid(), %s)
+        """,
+        (created_at,),
+    )
+
+
+def _partitions() -> list[str]:
+    return [
+        row[0]
+        for row in _fetch(
+            """
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'admin_action_logs'::regclass
+            ORDER BY c.relname
+            """
+        )
+    ]
+
+
+def test_default_partition_rows_move_to_monthly_partitions() -> None:
+    assert migrations.run_migrations(migrations.MIGRATIONS[:6]) == [1, 2, 3, 4, 5, 6]
+    assert "admin_action_logs_default" in _partitions()
+    # 파티션이 없는 먼 달의 로그는 default로 들어간다
+    _insert_log("2099-01-15 12:00:00")
+
+    assert migrations.run_migrations() == [7, 8, 9]
+
+    assert "admin_action_logs_default" not in _partitions()
+    assert "admin_action_logs_p209901" in _partitions()
+    assert _fetch("SELECT COUNT(*) FROM admin_action_logs_p209901") == [(1,)]
+    assert migrations.run_migrations() == []
+
+
+def test_log_insert_creates_missing_month_partition() -> None:
+    _ = migrations.run_migrations()
+    name = _fetch("SELECT 'admin_action_logs_p' || to_char(LOCALTIMESTAMP, 'YYYYMM')")[
+        0
+    ][0]
+    _ = _fetch(
+        sql.SQL(
+            "ALTER TABLE admin_action_logs DETACH PARTITION {0}; DROP TABLE {0}"
+        ).format(sql.Identifier(name))
+    )
+
+    row = db.create_admin_action_log(
+        "11111111-1111-1111-1111-111111111111",
+        "test",
+        "project",
+        str(uuid.uuid4()),
+        "partition missing",
+    )
+
+    assert row is not None
+    assert name in _partitions()
+
+
+def test_expired_partitions_are_detached_and_dropped() -> None:
+    _ = migrations.run_migrations()
+    for month in ("2020-01-01", "2020-02-01"):
+        _ = _fetch("SELECT ensure_admin_action_log_partition(%s::timestamp)", (month,))
+    _insert_log("2020-01-10 00:00:00")
+    _insert_log("2020-02-10 00:00:00")
+
+    dropped = db.drop_expired_admin_action_log_partitions(datetime(2020, 2, 1))
+
+    assert dropped == ["admin_action_logs_p202001"]
+    assert _fetch("SELECT to_regclass('admin_action_logs_p202001')") == [(None,)]
+    assert "admin_action_logs_p202002" in _partitions()
+    assert _fetch("SELECT COUNT(*) FROM admin_action_logs_p202002") == [(1,)]
+
+    # 떼어 낸 뒤 지우지 못하고 남은 파티션도 다음 실행에서 지운다
+    _ = _fetch(
+        "ALTER TABLE admin_action_logs DETACH PARTITION admin_action_logs_p202002"
+    )
+    dropped = db.drop_expired_admin_action_log_partitions(datetime(2020, 3, 1))
+
+    assert dropped == ["admin_action_logs_p202002"]
+    assert _fetch("SELECT to_regclass('admin_action_logs_p202002')") == [(None,)]
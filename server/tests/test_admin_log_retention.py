@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import main
+
+
+@pytest.fixture
+def expired_logs(monkeypatch: Any) -> dict[str, Any]:
+    store: dict[str, Any] = {"remaining": 12, "batches": [], "partitions": []}
+
+    def _delete_batch(cutoff: datetime, batch_size: int) -> int:
+        assert cutoff == datetime(2025, 1, 1)
+        deleted = min(store["remaining"], batch_size)
+        store["remaining"] -= deleted
+        store["batches"].append(deleted)
+        return deleted
+
+    monkeypatch.setattr(
+        main, "get_admin_action_log_retention_cutoff", lambda _: datetime(2025, 1, 1)
+    )
+    monkeypatch.setattr(main, "delete_admin_action_logs_batch", _delete_batch)
+    monkeypatch.setattr(
+        main, "drop_expired_admin_action_log_partitions", lambda _: store["partitions"]
+    )
+    monkeypatch.setattr(main, "ADMIN_LOG_RETENTION_BATCH_SIZE", 5)
+    monkeypatch.setattr(main, "ADMIN_LOG_RETENTION_BATCH_PAUSE_SECONDS", 0.0)
+    main._maintenance_stop.clear()
+    yield store
+    main._maintenance_stop.clear()
+
+
+def test_retention_deletes_in_bounded_batches(expired_logs: dict[str, Any]) -> None:
+    reports: list[dict[str, object]] = []
+
+    result = main.cleanup_admin_action_logs_in_batches(365, on_progress=reports.append)
+
+    assert expired_logs["batches"] == [5, 5, 2]
+    assert result["status"] == "completed"
+    assert result["deleted_count"] == 12
+    assert result["batch_count"] == 3
+    assert result["cutoff"] == "2025-01-01T00:00:00"
+    assert "rows_per_second" in result
+    assert [report["deleted_count"] for report in reports] == [5, 10]
+    assert all(report["status"] == "running" for report in reports)
+
+
+def test_retention_drops_whole_partitions_before_row_deletes(
+    expired_logs: dict[str, Any],
+) -> None:
+    expired_logs["partitions"] = [
+        "admin_action_logs_p202411",
+        "admin_action_logs_p202412",
+    ]
+    expired_logs["remaining"] = 3
+
+    result = main.cleanup_admin_action_logs_in_batches(365)
+
+    assert result["dropped_partitions"] == [
+        "admin_action_logs_p202411",
+        "admin_action_logs_p202412",
+    ]
+    assert expired_logs["batches"] == [3]
+    assert result["deleted_count"] == 3
+
+
+def test_retention_stops_between_batches_on_shutdown(
+    expired_logs: dict[str, Any],
+) -> None:
+    def _stop_after_first(progress: dict[str, object]) -> None:
+        _ = progress
+        main._maintenance_stop.set()
+
+    result = main.cleanup_admin_action_logs_in_batches(
+        365, on_progress=_stop_after_first
+    )
+
+    assert expired_logs["batches"] == [5]
+    assert expired_logs["remaining"] == 7
+    assert result["status"] == "stopped"
+    assert result["deleted_count"] == 5
+
+
+def test_maintenance_skips_later_steps_once_stopped(
+    expired_logs: dict[str, Any], monkeypatch: Any
+) -> None:
+    calls: list[str] = []
+
+    def _stop_after_first(progress: dict[str, object]) -> None:
+        _ = progress
+        main._maintenance_stop.set()
+
+    monkeypatch.setattr(
+        main,
+        "get_effective_moderation_settings",
+        lambda: {"admin_log_retention_days": 365},
+    )
+    monkeypatch.setattr(main, "ensure_admin_action_log_partitions", lambda months: 0)
+    monkeypatch.setattr(main, "_report_admin_log_retention_progress", _stop_after_first)
+    monkeypatch.setattr(
+        main, "perform_due_user_deletion_cleanup", lambda: calls.append("users") or 0
+    )
+    monkeypatch.setattr(
+        main, "cleanup_rate_limit_buckets", lambda: calls.append("buckets") or 0
+    )
+    monkeypatch.setattr(
+        main,
+        "reconcile_drifted_project_like_counts",
+        lambda: calls.append("likes") or {},
+    )
+    monkeypatch.setattr(main, "RATE_LIMIT_BACKEND", "postgres")
+
+    stats = main.run_admin_maintenance()
+
+    assert stats["stopped"] is True
+    assert expired_logs["batches"] == [5]
+    assert calls == []
+
+
+def test_retention_endpoint_reads_progress_from_lease(monkeypatch: Any) -> None:
+    progress = {"status": "running", "deleted_count": 10, "rows_per_second": 50.0}
+    monkeypatch.setattr(
+        main,
+        "get_maintenance_lease",
+        lambda _: {
+            "last_run_started_at": datetime(2026, 1, 1),
+            "last_run_stats": {"admin_log_retention": progress},
+        },
+    )
+    main.app.dependency_overrides[main.require_admin] = lambda: {"id": "admin-1"}
+    try:
+        response = TestClient(main.app).get("/api/admin/action-logs/retention")
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json() == {"retention": progress}
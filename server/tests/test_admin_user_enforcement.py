@@ -29,9 +29,11 @@ def _admin_context(user_id: str = "admin-1", role: str = "admin") -> main.UserCo
 
 @pytest.fixture
 def client() -> TestClient:
+    main._invalidate_user_context()
     test_client = TestClient(main.app)
     yield test_client
     main.app.dependency_overrides.clear()
+    main._invalidate_user_context()
 
 
 def test_schedule_delete_rejects_self_target(client: TestClient) -> None:
@@ -107,10 +109,9 @@ def test_revoked_token_version_blocks_me_endpoint(
             "sv": 1,
         }
     )
-    monkeypatch.setattr(
-        main,
-        "get_user_by_id",
-        lambda _user_id: {
+
+    async def _get_user_by_id(_user_id: str) -> dict[str, Any]:
+        return {
             "id": "user-1",
             "email": "user@example.com",
             "nickname": "user",
@@ -119,8 +120,9 @@ def test_revoked_token_version_blocks_me_endpoint(
             "token_version": 2,
             "avatar_url": None,
             "bio": None,
-        },
-    )
+        }
+
+    monkeypatch.setattr(main, "get_user_by_id_async", _get_user_by_id)
 
     response = client.get(
         "/api/me",
@@ -181,3 +183,93 @@ def test_due_deletion_cleanup_logs_deleted_users(monkeypatch: Any) -> None:
     assert count == 1
     assert captured[0]["action_type"] == "user_deleted"
     assert captured[0]["target_id"] == "target-1"
+
+
+def _active_user_row(token_version: int = 0) -> dict[str, Any]:
+    return {
+        "id": "user-1",
+        "email": "user@example.com",
+        "nickname": "user",
+        "role": "user",
+        "status": "active",
+        "token_version": token_version,
+        "avatar_url": None,
+        "bio": None,
+    }
+
+
+def test_user_context_is_cached_between_requests(
+    client: TestClient, monkeypatch: Any
+) -> None:
+    lookups: list[str] = []
+
+    async def _get_user_by_id(user_id: str) -> dict[str, Any]:
+        lookups.append(user_id)
+        return _active_user_row()
+
+    monkeypatch.setattr(main, "get_user_by_id_async", _get_user_by_id)
+    token = create_access_token({"sub": "user-1", "email": "user@example.com"})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = client.get("/api/me", headers=headers)
+    second = client.get("/api/me", headers=headers)
+
+    assert first.status_code == 200
+    assert second.json() == first.json()
+    assert lookups == ["user-1"]
+
+
+def test_suspend_invalidates_cached_user_context(
+    client: TestClient, monkeypatch: Any
+) -> None:
+    user_row = _active_user_row()
+
+    async def _get_user_by_id(_user_id: str) -> dict[str, Any]:
+        return dict(user_row)
+
+    def _suspend_user(**_: Any) -> dict[str, Any]:
+        user_row["status"] = "suspended"
+        return {"id": "user-1", "status": "suspended", "suspended_by": "admin-1"}
+
+    monkeypatch.setattr(main, "get_user_by_id_async", _get_user_by_id)
+    monkeypatch.setattr(main, "get_user_by_id", lambda _user_id: {"role": "user"})
+    monkeypatch.setattr(main, "suspend_user", _suspend_user)
+    monkeypatch.setattr(main, "write_admin_action_log", lambda **_: None)
+    main.app.dependency_overrides[main.require_admin] = lambda: _admin_context()
+    token = create_access_token({"sub": "user-1", "email": "user@example.com"})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    before = client.get("/api/me", headers=headers)
+    suspended = client.post("/api/admin/users/user-1/suspend", json={"reason": "abuse"})
+    after = client.get("/api/me", headers=headers)
+
+    assert before.status_code == 200
+    assert suspended.status_code == 200
+    assert after.status_code == 403
+
+
+def test_cached_user_context_rechecks_other_token_version(
+    client: TestClient, monkeypatch: Any
+) -> None:
+    token_version = {"value": 0}
+
+    async def _get_user_by_id(_user_id: str) -> dict[str, Any]:
+        return _active_user_row(token_version["value"])
+
+    monkeypatch.setattr(main, "get_user_by_id_async", _get_user_by_id)
+    old_token = create_access_token({"sub": "user-1", "sv": 0})
+    assert (
+        client.get(
+            "/api/me", headers={"Authorization": f"Bearer {old_token}"}
+        ).status_code
+        == 200
+    )
+
+    # 다른 워커에서 세션이 무효화되어 새 토큰이 발급된 상황
+    token_version["value"] = 1
+    new_token = create_access_token({"sub": "user-1", "sv": 1})
+    response = client.get("/api/me", headers={"Authorization": f"Bearer {new_token}"})
+    stale = client.get("/api/me", headers={"Authorization": f"Bearer {old_token}"})
+
+    assert response.status_code == 200
+    assert stale.status_code == 401
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import cache_bus
+import main
+from cache_bus import CacheInvalidationBus
+
+
+def _payload(origin: str, seq: int, kind: str, **fields: Any) -> str:
+    return json.dumps({"o": origin, "s": seq, "k": kind, **fields})
+
+
+def _bus() -> tuple[CacheInvalidationBus, list[dict[str, object]], list[str]]:
+    applied: list[dict[str, object]] = []
+    flushed: list[str] = []
+    bus = CacheInvalidationBus(
+        dsn="", apply=applied.append, flush_all=lambda: flushed.append("flush")
+    )
+    return bus, applied, flushed
+
+
+def test_messages_from_other_workers_are_applied_in_order() -> None:
+    bus, applied, flushed = _bus()
+
+    bus.handle(_payload("worker-b", 1, "user", id="u1"))
+    bus.handle(_payload("worker-b", 2, "projects"))
+    bus.handle(_payload(bus.origin, 1, "projects"))
+
+    assert [message["k"] for message in applied] == ["user", "projects"]
+    assert flushed == []
+
+
+def test_sequence_gap_triggers_full_flush() -> None:
+    bus, applied, flushed = _bus()
+
+    bus.handle(_payload("worker-b", 1, "user", id="u1"))
+    bus.handle(_payload("worker-b", 4, "user", id="u2"))
+    bus.handle(_payload("worker-b", 5, "user", id="u3"))
+
+    assert [message["id"] for message in applied] == ["u1", "u3"]
+    assert flushed == ["flush"]
+    assert bus.stats()["gap_flush_total"] == 1
+
+
+def test_publish_is_noop_until_started_and_queues_compact_payload() -> None:
+    bus, _, _ = _bus()
+    bus.publish("user", id="u1")
+    assert bus.stats()["pending"] == 0
+
+    async def _publish_from_loop() -> list[str]:
+        bus._loop = asyncio.get_running_loop()
+        bus._outbox = asyncio.Queue()
+        bus.publish("project_like", id="p1", like_count=3)
+        await asyncio.sleep(0)
+        return [bus._outbox.get_nowait()]
+
+    [payload] = asyncio.run(_publish_from_loop())
+    assert json.loads(payload) == {
+        "o": bus.origin,
+        "s": 1,
+        "k": "project_like",
+        "id": "p1",
+        "like_count": 3,
+    }
+    assert " " not in payload
+
+
+def test_concurrent_publishes_are_queued_in_sequence_order(monkeypatch: Any) -> None:
+    bus, _, _ = _bus()
+
+    def _slow_dumps(*args: Any, **kwargs: Any) -> str:
+        # 순번을 받은 뒤 큐에 넣기 전에 다른 스레드가 끼어들 틈을 넓힌다
+        time.sleep(0.0001)
+        return json.dumps(*args, **kwargs)
+
+    monkeypatch.setattr(
+        cache_bus, "json", SimpleNamespace(dumps=_slow_dumps, loads=json.loads)
+    )
+
+    async def _publish_from_threads() -> list[int]:
+        bus._loop = asyncio.get_running_loop()
+        bus._outbox = asyncio.Queue()
+
+        def _publish_many(worker: int) -> None:
+            for index in range(50):
+                bus.publish("user", id=f"{worker}-{index}")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            _ = await asyncio.gather(
+                *(
+                    asyncio.get_running_loop().run_in_executor(
+                        pool, _publish_many, worker
+                    )
+                    for worker in range(8)
+                )
+            )
+        await asyncio.sleep(0)
+        return [
+            json.loads(bus._outbox.get_nowait())["s"]
+            for _ in range(bus._outbox.qsize())
+        ]
+
+    seqs = asyncio.run(_publish_from_threads())
+
+    assert seqs == list(range(1, 8 * 50 + 1))
+
+    # 받는 쪽에서도 순번 차이로 전체 비우기를 하지 않는다
+    receiver, applied, flushed = _bus()
+    for seq in seqs:
+        receiver.handle(_payload(bus.origin, seq, "user"))
+    assert len(applied) == len(seqs)
+    assert flushed == []
+
+
+def test_remote_project_change_drops_only_affected_cache_keys(
+    monkeypatch: Any,
+) -> None:
+    published: list[tuple[str, dict[str, object]]] = []
+    monkeypatch.setattr(
+        main._cache_bus,
+        "publish",
+        lambda kind, **fields: published.append((kind, fields)),
+    )
+    main._invalidate_projects_cache(broadcast=False)
+    row = {"id": "p1", "status": "published", "platform": "web", "tags": ["game"]}
+    for platform in ("web", "app"):
+        main._set_cached_projects(
+            sort="latest",
+            platform=platform,
+            tag=None,
+            limit=24,
+            items=[row] if platform == "web" else [],
+            next_cursor=None,
+        )
+
+    main._apply_cache_invalidation(
+        {"k": "project", "id": "p1", "status": "hidden", "platform": "web", "tags": []}
+    )
+
+    keys = {key[1] for key in main._project_list_cache}
+    assert keys == {"app"}
+    # 원격 메시지를 반영할 때는 다시 방송하지 않는다
+    assert published == []
+
+
+def test_local_invalidation_is_published(monkeypatch: Any) -> None:
+    published: list[tuple[str, dict[str, object]]] = []
+    monkeypatch.setattr(
+        main._cache_bus,
+        "publish",
+        lambda kind, **fields: published.append((kind, fields)),
+    )
+
+    main._invalidate_user_context("u1")
+    main.invalidate_moderation_settings_cache()
+
+    assert published == [("user", {"id": "u1"}), ("moderation_settings", {})]
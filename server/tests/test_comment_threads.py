@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import main
+
+PROJECT_ID = "00000000-0000-0000-0000-000000000001"
+AUTHOR_ID = "00000000-0000-0000-0000-0000000000aa"
+
+
+def _comment_id(index: int) -> str:
+    return f"00000000-0000-0000-0000-{index:012d}"
+
+
+def _row(
+    index: int,
+    root: int,
+    root_rank: int,
+    depth: int,
+    reply_count: int,
+    parent: int | None = None,
+) -> dict[str, Any]:
+    return {
+        "id": _comment_id(index),
+        "project_id": PROJECT_ID,
+        "author_id": AUTHOR_ID,
+        "author_nickname": "tester",
+        "parent_id": _comment_id(parent) if parent else None,
+        "content": f"comment {index}",
+        "status": "visible",
+        "like_count": 0,
+        "created_at": datetime(2026, 1, 1) + timedelta(minutes=index),
+        "root_id": _comment_id(root),
+        "root_rank": root_rank,
+        "depth": depth,
+        "reply_rank": 1,
+        "reply_count": reply_count,
+    }
+
+
+def test_comments_are_returned_as_threads(monkeypatch: Any) -> None:
+    calls: list[dict[str, Any]] = []
+
+    def _get_comment_threads(project_id: str, **kwargs: Any) -> list[dict[str, Any]]:
+        calls.append({"project_id": project_id, **kwargs})
+        return [
+            _row(1, root=1, root_rank=1, depth=0, reply_count=3),
+            _row(11, root=1, root_rank=1, depth=1, reply_count=3, parent=1),
+            _row(12, root=1, root_rank=1, depth=1, reply_count=3, parent=1),
+            # replies_limit + 1 번째 답글은 더 있는지 확인용
+            _row(13, root=1, root_rank=1, depth=1, reply_count=3, parent=1),
+            _row(2, root=2, root_rank=2, depth=0, reply_count=0),
+            # limit + 1 번째 스레드는 다음 페이지 존재 여부 확인용
+            _row(3, root=3, root_rank=3, depth=0, reply_count=0),
+        ]
+
+    monkeypatch.setattr(main, "get_comment_threads", _get_comment_threads)
+    client = TestClient(main.app)
+
+    response = client.get(
+        f"/api/projects/{PROJECT_ID}/comments",
+        params={"limit": 2, "replies_limit": 2},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert calls[0]["limit"] == 3
+    assert calls[0]["replies_limit"] == 2
+    assert [item["id"] for item in body["items"]] == [_comment_id(1), _comment_id(2)]
+
+    first = body["items"][0]
+    assert [reply["id"] for reply in first["replies"]] == [
+        _comment_id(11),
+        _comment_id(12),
+    ]
+    assert first["replies"][1]["parent_id"] == _comment_id(1)
+    assert first["reply_count"] == 3
+    assert first["has_more_replies"] is True
+    assert main._decode_comment_cursor("replies", first["replies_next_cursor"]) == (
+        datetime(2026, 1, 1) + timedelta(minutes=12),
+        _comment_id(12),
+    )
+    assert "root_rank" not in first
+
+    second = body["items"][1]
+    assert second["replies"] == []
+    assert second["has_more_replies"] is False
+    assert second["replies_next_cursor"] is None
+
+    assert main._decode_comment_cursor("latest", body["next_cursor"]) == (
+        datetime(2026, 1, 1) + timedelta(minutes=2),
+        _comment_id(2),
+    )
+
+
+def test_thread_without_extra_reply_has_no_more_replies(monkeypatch: Any) -> None:
+    monkeypatch.setattr(
+        main,
+        "get_comment_threads",
+        lambda project_id, **kwargs: [
+            _row(1, root=1, root_rank=1, depth=0, reply_count=2),
+            _row(11, root=1, root_rank=1, depth=1, reply_count=2, parent=1),
+            _row(12, root=1, root_rank=1, depth=1, reply_count=2, parent=1),
+        ],
+    )
+    client = TestClient(main.app)
+
+    response = client.get(
+        f"/api/projects/{PROJECT_ID}/comments", params={"replies_limit": 2}
+    )
+
+    [thread] = response.json()["items"]
+    assert len(thread["replies"]) == 2
+    assert thread["has_more_replies"] is False
+    assert thread["replies_next_cursor"] is None
+
+
+def test_last_comment_page_has_no_cursor(monkeypatch: Any) -> None:
+    monkeypatch.setattr(
+        main,
+        "get_comment_threads",
+        lambda project_id, **kwargs: [
+            _row(1, root=1, root_rank=1, depth=0, reply_count=0)
+        ],
+    )
+    client = TestClient(main.app)
+
+    response = client.get(f"/api/projects/{PROJECT_ID}/comments")
+
+    assert response.json()["next_cursor"] is None
+
+
+def test_replies_are_paged_with_cursor(monkeypatch: Any) -> None:
+    calls: list[dict[str, Any]] = []
+
+    def _get_comment_replies(comment_id: str, **kwargs: Any) -> list[dict[str, Any]]:
+        calls.append({"comment_id": comment_id, **kwargs})
+        return [
+            _row(13, root=1, root_rank=1, depth=1, reply_count=0, parent=1),
+            _row(14, root=1, root_rank=1, depth=1, reply_count=0, parent=1),
+        ]
+
+    monkeypatch.setattr(main, "get_comment_replies", _get_comment_replies)
+    cursor = main._encode_comment_cursor(
+        "replies", _row(12, root=1, root_rank=1, depth=2, reply_count=0)
+    )
+    client = TestClient(main.app)
+
+    response = client.get(
+        f"/api/comments/{_comment_id(1)}/replies",
+        params={"limit": 1, "cursor": cursor},
+    )
+
+    body = response.json()
+    assert calls[0]["cursor"] == (
+        datetime(2026, 1, 1) + timedelta(minutes=12),
+        _comment_id(12),
+    )
+    assert [reply["id"] for reply in body["items"]] == [_comment_id(13)]
+    assert body["next_cursor"] is not None
+
+
+def test_comment_cursor_must_match_sort(monkeypatch: Any) -> None:
+    monkeypatch.setattr(main, "get_comment_threads", lambda project_id, **kwargs: [])
+    cursor = main._encode_comment_cursor(
+        "latest", _row(1, root=1, root_rank=1, depth=0, reply_count=0)
+    )
+    client = TestClient(main.app)
+
+    response = client.get(
+        f"/api/projects/{PROJECT_ID}/comments",
+        params={"sort": "popular", "cursor": cursor},
+    )
+
+    assert response.status_code == 400
+
+
+def test_project_list_cursor_is_rejected_for_comments(monkeypatch: Any) -> None:
+    monkeypatch.setattr(main, "get_comment_threads", lambda project_id, **kwargs: [])
+    cursor = main._encode_project_cursor(
+        "latest", _row(1, root=1, root_rank=1, depth=0, reply_count=0)
+    )
+    client = TestClient(main.app)
+
+    response = client.get(
+        f"/api/projects/{PROJECT_ID}/comments",
+        params={"sort": "latest", "cursor": cursor},
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import db
+import main
+
+
+class _FakeConnection:
+    closed = 0
+
+
+class _FakeThreadedPool:
+    def __init__(self, minconn: int, maxconn: int, **kwargs: Any) -> None:
+        _ = minconn, kwargs
+        self.maxconn = maxconn
+        self.used: list[_FakeConnection] = []
+
+    def getconn(self) -> _FakeConnection:
+        if len(self.used) >= self.maxconn:
+            raise db.PoolError("connection pool exhausted")
+        conn = _FakeConnection()
+        self.used.append(conn)
+        return conn
+
+    def putconn(self, conn: _FakeConnection, close: bool = False) -> None:
+        _ = close
+        self.used.remove(conn)
+
+    def closeall(self) -> None:
+        self.used.clear()
+
+
+@pytest.fixture
+def fake_pool(monkeypatch: Any) -> None:
+    monkeypatch.setattr(db, "ThreadedConnectionPool", _FakeThreadedPool)
+
+
+def test_pool_waits_for_released_connection_instead_of_failing(
+    fake_pool: None,
+) -> None:
+    pool = db.BlockingConnectionPool(minconn=1, maxconn=1, timeout=2)
+    first = pool.getconn()
+    acquired: list[Any] = []
+
+    waiter = threading.Thread(target=lambda: acquired.append(pool.getconn()))
+    waiter.start()
+    time.sleep(0.05)
+    assert pool.stats()["waiting"] == 1
+    pool.putconn(first)
+    waiter.join(timeout=2)
+
+    assert len(acquired) == 1
+    stats = pool.stats()
+    assert stats["checkout_total"] == 2
+    assert stats["waited_total"] == 1
+    assert stats["in_use"] == 1
+    assert stats["waiting"] == 0
+    assert float(stats["wait_ms_max"]) >= 40
+
+
+def test_pool_raises_timeout_when_no_connection_is_released(fake_pool: None) -> None:
+    pool = db.BlockingConnectionPool(minconn=1, maxconn=1, timeout=0.05)
+    _ = pool.getconn()
+
+    with pytest.raises(db.DatabasePoolTimeout):
+        _ = pool.getconn()
+
+    assert pool.stats()["timeout_total"] == 1
+
+
+def test_pool_timeout_is_returned_as_503(monkeypatch: Any) -> None:
+    def _timeout(*args: Any, **kwargs: Any) -> Any:
+        raise db.DatabasePoolTimeout("connection pool timeout after 10.0s")
+
+    monkeypatch.setattr(main, "get_site_content", _timeout)
+    client = TestClient(main.app)
+
+    response = client.get("/api/content/about")
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+
+def test_project_list_pool_timeout_is_not_swallowed(monkeypatch: Any) -> None:
+    def _timeout(*args: Any, **kwargs: Any) -> Any:
+        raise db.DatabasePoolTimeout("connection pool timeout after 10.0s")
+
+    monkeypatch.setattr(main, "get_projects", _timeout)
+    main._project_list_cache.clear()
+    client = TestClient(main.app)
+
+    response = client.get("/api/projects", params={"sort": "popular"})
+
+    assert response.status_code == 503
+
+
+def test_project_like_pool_timeout_is_returned_as_503(monkeypatch: Any) -> None:
+    def _timeout(*args: Any, **kwargs: Any) -> Any:
+        raise db.DatabasePoolTimeout("connection pool timeout after 10.0s")
+
+    monkeypatch.setattr(main, "add_project_like", _timeout)
+    main.app.dependency_overrides[main.get_current_user] = lambda: {
+        "id": "user-a",
+        "email": "user-a@example.com",
+        "nickname": "user-a",
+        "role": "user",
+        "status": "active",
+        "avatar_url": None,
+        "bio": None,
+    }
+    try:
+        response = TestClient(main.app).post(
+            "/api/projects/00000000-0000-0000-0000-000000000001/like"
+        )
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert response.status_code == 503
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+import rsa
+from jose import jwk, jwt
+from jose.utils import calculate_at_hash
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import http_client
+from google_id_token import (
+    GoogleJWKSCache,
+    InvalidGoogleIdToken,
+    parse_cache_max_age,
+    verify_google_id_token,
+)
+
+CLIENT_ID = "google-client-id"
+_PUBLIC_KEY, _PRIVATE_KEY = rsa.newkeys(1024)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _jwks(kid: str = "key-1") -> dict[str, Any]:
+    public_jwk = jwk.construct(
+        _PUBLIC_KEY.save_pkcs1().decode("utf-8"), "RS256"
+    ).to_dict()
+    public_jwk["kid"] = kid
+    return {"keys": [public_jwk]}
+
+
+def _id_token(kid: str = "key-1", **overrides: Any) -> str:
+    now = int(time.time())
+    claims = {
+        "iss": "accounts.google.com",
+        "aud": CLIENT_ID,
+        "sub": "google-user-id",
+        "email": "user@example.com",
+        "iat": now,
+        "exp": now + 300,
+        **overrides,
+    }
+    return jwt.encode(
+        claims,
+        _PRIVATE_KEY.save_pkcs1().decode("utf-8"),
+        algorithm="RS256",
+        headers={"kid": kid},
+    )
+
+
+def _serve_jwks(monkeypatch: Any, jwks: dict[str, Any], max_age: int) -> list[str]:
+    fetched: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        fetched.append(str(request.url))
+        return httpx.Response(
+            200,
+            json=jwks,
+            headers={"Cache-Control": f"public, max-age={max_age}, must-revalidate"},
+        )
+
+    monkeypatch.setattr(
+        http_client,
+        "_http_client",
+        httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+    )
+    return fetched
+
+
+def test_valid_token_is_verified_with_injected_keys() -> None:
+    cache = GoogleJWKSCache()
+    cache.set_keys(_jwks())
+
+    claims = asyncio.run(verify_google_id_token(_id_token(), CLIENT_ID, cache))
+
+    assert claims["sub"] == "google-user-id"
+    assert claims["email"] == "user@example.com"
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"aud": "other-client-id"},
+        {"iss": "https://evil.example.com"},
+        {"exp": int(time.time()) - 3600},
+    ],
+)
+def test_invalid_claims_are_rejected(overrides: dict[str, Any]) -> None:
+    cache = GoogleJWKSCache()
+    cache.set_keys(_jwks())
+
+    with pytest.raises(InvalidGoogleIdToken):
+        _ = asyncio.run(
+            verify_google_id_token(_id_token(**overrides), CLIENT_ID, cache)
+        )
+
+
+def test_at_hash_is_checked_against_access_token() -> None:
+    cache = GoogleJWKSCache()
+    cache.set_keys(_jwks())
+    token = _id_token(at_hash=calculate_at_hash("ya29.access", hashlib.sha256))
+
+    claims = asyncio.run(
+        verify_google_id_token(token, CLIENT_ID, cache, access_token="ya29.access")
+    )
+
+    assert claims["sub"] == "google-user-id"
+    with pytest.raises(InvalidGoogleIdToken):
+        _ = asyncio.run(
+            verify_google_id_token(token, CLIENT_ID, cache, access_token="other")
+        )
+
+
+def test_keys_are_fetched_once_within_max_age(monkeypatch: Any) -> None:
+    fetched = _serve_jwks(monkeypatch, _jwks(), max_age=120)
+    clock = _Clock()
+    cache = GoogleJWKSCache(clock=clock)
+
+    for _ in range(3):
+        _ = asyncio.run(verify_google_id_token(_id_token(), CLIENT_ID, cache))
+    assert len(fetched) == 1
+
+    clock.now += 121
+    _ = asyncio.run(verify_google_id_token(_id_token(), CLIENT_ID, cache))
+    assert len(fetched) == 2
+
+
+def test_unknown_key_id_refetches_at_most_once_per_interval(monkeypatch: Any) -> None:
+    fetched = _serve_jwks(monkeypatch, _jwks("key-1"), max_age=3600)
+    clock = _Clock()
+    cache = GoogleJWKSCache(clock=clock)
+    cache.set_keys(_jwks("old-key"))
+
+    for _ in range(2):
+        with pytest.raises(InvalidGoogleIdToken):
+            _ = asyncio.run(
+                verify_google_id_token(_id_token("missing-key"), CLIENT_ID, cache)
+            )
+    assert len(fetched) == 0
+
+    clock.now += 61
+    claims = asyncio.run(verify_google_id_token(_id_token("key-1"), CLIENT_ID, cache))
+    assert claims["sub"] == "google-user-id"
+    assert len(fetched) == 1
+
+
+def test_parse_cache_max_age() -> None:
+    assert parse_cache_max_age("public, max-age=23589, must-revalidate") == 23589
+    assert parse_cache_max_age("no-cache") is None
+    assert parse_cache_max_age(None) is None
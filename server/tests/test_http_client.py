@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import http_client
+
+
+def _use_transport(monkeypatch: Any, responses: list[Any]) -> list[httpx.Request]:
+    seen: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        result = responses.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(
+        http_client,
+        "_http_client",
+        httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+    )
+    monkeypatch.setattr(http_client, "_retry_delay", lambda attempt: 0.0)
+    return seen
+
+
+def test_get_is_retried_on_server_error(monkeypatch: Any) -> None:
+    seen = _use_transport(
+        monkeypatch,
+        [httpx.Response(503), httpx.Response(200, json={"sub": "google-user-id"})],
+    )
+
+    payload = asyncio.run(
+        http_client.request_json(
+            "GET", "https://example.com/tokeninfo", params={"id_token": "t"}
+        )
+    )
+
+    assert payload == {"sub": "google-user-id"}
+    assert len(seen) == 2
+    assert seen[0].url.params["id_token"] == "t"
+
+
+def test_post_is_not_resent_after_server_error(monkeypatch: Any) -> None:
+    seen = _use_transport(monkeypatch, [httpx.Response(503), httpx.Response(200)])
+
+    with pytest.raises(http_client.OutboundHTTPError):
+        _ = asyncio.run(
+            http_client.request_json(
+                "POST", "https://example.com/token", data={"code": "c"}
+            )
+        )
+
+    assert len(seen) == 1
+
+
+def test_post_is_retried_when_connection_fails(monkeypatch: Any) -> None:
+    seen = _use_transport(
+        monkeypatch,
+        [
+            httpx.ConnectError("connection refused"),
+            httpx.Response(200, json={"id_token": "fake-id-token"}),
+        ],
+    )
+
+    payload = asyncio.run(
+        http_client.request_json(
+            "POST", "https://example.com/token", data={"code": "c"}
+        )
+    )
+
+    assert payload == {"id_token": "fake-id-token"}
+    assert len(seen) == 2
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import main
+from keyword_matcher import HangulKeywordMatcher, KeywordMatch, KeywordMatcher
+
+
+def test_matcher_finds_overlapping_keywords() -> None:
+    matcher = KeywordMatcher([("he", "a"), ("she", "b"), ("his", "c"), ("hers", "d")])
+
+    assert matcher.find_all("ushers") == [
+        KeywordMatch("she", "b", 1, 4),
+        KeywordMatch("he", "a", 2, 4),
+        KeywordMatch("hers", "d", 2, 6),
+    ]
+    assert matcher.find_first("ushers") == KeywordMatch("she", "b", 1, 4)
+    assert matcher.find_first("hi there") == KeywordMatch("he", "a", 4, 6)
+    assert matcher.find_first("nothing") is None
+
+
+def test_matcher_keeps_first_category_for_duplicate_keyword() -> None:
+    matcher = KeywordMatcher([("광고", "스팸"), ("광고", "사용자 지정")])
+
+    assert len(matcher) == 1
+    assert matcher.find_first("무료광고") == KeywordMatch("광고", "스팸", 2, 4)
+
+
+def _settings(keywords: list[str], version: datetime) -> dict[str, object]:
+    return {
+        "blocked_keywords": keywords,
+        "baseline_keyword_categories": {"스팸": ["광고"]},
+        "updated_at": version,
+    }
+
+
+def test_matcher_is_compiled_once_per_settings_version() -> None:
+    first = main.get_blocked_keyword_matcher(_settings(["광고"], datetime(2026, 1, 1)))
+    same = main.get_blocked_keyword_matcher(_settings(["광고"], datetime(2026, 1, 1)))
+    updated = main.get_blocked_keyword_matcher(
+        _settings(["광고", "도박"], datetime(2026, 1, 2))
+    )
+
+    assert same is first
+    assert updated is not first
+    assert main.find_blocked_keyword(
+        "도 박 사이트", _settings([], datetime(2026, 1, 2))
+    ) == (KeywordMatch("도박", main.CUSTOM_KEYWORD_CATEGORY, 0, 2))
+
+
+def test_blocked_comment_reports_keyword_and_category(monkeypatch: Any) -> None:
+    monkeypatch.setattr(
+        main,
+        "get_effective_moderation_settings",
+        lambda: _settings(["광고"], datetime(2026, 3, 1)),
+    )
+    main.app.dependency_overrides[main.get_current_user] = lambda: {
+        "id": "user-1",
+        "email": "user@example.com",
+        "nickname": "user",
+        "role": "user",
+        "status": "active",
+        "avatar_url": None,
+        "bio": None,
+    }
+    client = TestClient(main.app)
+
+    try:
+        response = client.post(
+            "/api/projects/00000000-0000-0000-0000-000000000001/comments",
+            json={"content": "광 고 문의 주세요"},
+        )
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == (
+        "금칙어가 포함된 댓글은 작성할 수 없습니다 (스팸: 광고)"
+    )
+
+
+def _hangul_matcher(*keywords: tuple[str, str]) -> HangulKeywordMatcher:
+    return HangulKeywordMatcher(
+        [
+            (main.normalize_text_for_filter(keyword), category)
+            for keyword, category in keywords
+        ]
+    )
+
+
+def _find(matcher: HangulKeywordMatcher, text: str) -> KeywordMatch | None:
+    return matcher.find_first(main.normalize_text_for_filter(text))
+
+
+def test_hangul_matcher_catches_syllable_split_variants() -> None:
+    matcher = _hangul_matcher(("도박", "범죄"))
+
+    for text in ["도박", "도 박", "ㄷㅗ박", "돕악"]:
+        match = _find(matcher, text)
+        assert match is not None, text
+        assert (match.keyword, match.category) == ("도박", "범죄")
+    assert _find(matcher, "도로 박물관") is None
+
+
+def test_hangul_matcher_matches_choseong_pattern_to_typed_consonants() -> None:
+    matcher = _hangul_matcher(("ㅆㄹㄱ", "욕설"))
+
+    typed = _find(matcher, "이건 ㅆ ㄹ ㄱ")
+
+    assert typed is not None
+    assert (typed.category, typed.start, typed.end) == ("욕설", 2, 5)
+    assert _find(matcher, "ㅆㄹ기") is None
+    assert _find(matcher, "쓰기 연습") is None
+
+
+def test_choseong_pattern_ignores_initials_of_full_syllables() -> None:
+    settings = {
+        "blocked_keywords": [],
+        "baseline_keyword_categories": main._normalized_baseline_keywords()[1],
+        "updated_at": datetime(2026, 4, 1),
+    }
+
+    for text in [
+        "서버 배포 방법",
+        "개발 서버 세팅",
+        "시범 서비스",
+        "수박 먹고 싶다",
+        "소비자",
+        "새벽에 만들었습니다",
+        "신분 확인",
+        "사본을 만들었어요",
+        "쓰레기 분리수거",
+    ]:
+        assert main.find_blocked_keyword(text, settings) is None, text
+    for text in ["ㅅㅂ", "ㅅ ㅂ", "ㄲㅈ", "ㅆㄹㄱ같네"]:
+        assert main.find_blocked_keyword(text, settings) is not None, text
+
+
+def _baseline_settings() -> dict[str, object]:
+    return {
+        "blocked_keywords": [],
+        "baseline_keyword_categories": main._normalized_baseline_keywords()[1],
+        "updated_at": datetime(2026, 4, 1),
+    }
+
+
+def test_full_pattern_does_not_cross_syllable_boundaries() -> None:
+    settings = _baseline_settings()
+
+    # 대만 = 대마+ㄴ, 대망 = 대마+ㅇ, 도바기 = 도박이 '기'에 걸친다
+    for text in ["대만 여행 앱", "대망의 출시", "도바기"]:
+        assert main.find_blocked_keyword(text, settings) is None, text
+    assert main.find_blocked_keyword("대마 판매", settings) is not None
+
+
+def test_choseong_keyword_matches_allow_listed_spellings() -> None:
+    settings = _baseline_settings()
+
+    for text in ["시발", "아 씨발 진짜", "ㅅㅣ발"]:
+        match = main.find_blocked_keyword(text, settings)
+        assert match is not None, text
+        assert match.keyword == main.normalize_text_for_filter("ㅅㅂ")
+        assert match.category == "욕설/변형욕설"
+    assert main.find_blocked_keyword("시범 발표", settings) is None
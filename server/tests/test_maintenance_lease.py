@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import main
+
+
+class FakeLeaseStore:
+    """maintenance_leases 행 하나를 흉내 내는 저장소 (now는 테스트가 직접 움직인다)"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.row: Optional[dict[str, Any]] = None
+        self.resumed: list[str] = []
+
+    def acquire(
+        self, name: str, holder: str, ttl_seconds: float, run_interval_seconds: float
+    ) -> Optional[dict[str, Any]]:
+        _ = name
+        row = self.row
+        if row is None:
+            row = self.row = {
+                "holder": None,
+                "acquired_at": None,
+                "expires_at": 0.0,
+                "last_run_holder": None,
+                "last_run_started_at": None,
+                "last_run_finished_at": None,
+                "last_run_stats": None,
+                "last_run_error": None,
+            }
+        if not (
+            row["holder"] == holder
+            or row["holder"] is None
+            or row["expires_at"] <= self.now
+        ):
+            return None
+        if row["holder"] != holder:
+            row["acquired_at"] = self.now
+        row["holder"] = holder
+        row["expires_at"] = self.now + ttl_seconds
+        finished = row["last_run_finished_at"]
+        return {
+            **row,
+            "due": finished is None or finished <= self.now - run_interval_seconds,
+        }
+
+    def release(self, name: str, holder: str) -> bool:
+        _ = name
+        if self.row is None or self.row["holder"] != holder:
+            return False
+        self.row["holder"] = None
+        self.row["expires_at"] = self.now
+        return True
+
+    def started(self, name: str, holder: str) -> bool:
+        _ = name
+        if self.row is None or self.row["holder"] != holder:
+            return False
+        self.row["last_run_holder"] = holder
+        self.row["last_run_started_at"] = self.now
+        self.row["last_run_error"] = None
+        return True
+
+    def finished(
+        self, name: str, holder: str, stats: dict[str, object], error: Optional[str]
+    ) -> bool:
+        _ = name
+        if self.row is None or self.row["last_run_holder"] != holder:
+            return False
+        self.row["last_run_finished_at"] = self.now
+        self.row["last_run_stats"] = dict(stats)
+        self.row["last_run_error"] = error
+        return True
+
+    def get(self, name: str) -> Optional[dict[str, Any]]:
+        _ = name
+        if self.row is None:
+            return None
+        active = self.row["holder"] is not None and self.row["expires_at"] > self.now
+        return {**self.row, "active": active}
+
+
+@pytest.fixture
+def lease_store(monkeypatch: Any) -> Iterator[FakeLeaseStore]:
+    store = FakeLeaseStore()
+    monkeypatch.setattr(main, "acquire_maintenance_lease", store.acquire)
+    monkeypatch.setattr(main, "release_maintenance_lease", store.release)
+    monkeypatch.setattr(main, "record_maintenance_run_started", store.started)
+    monkeypatch.setattr(main, "record_maintenance_run_finished", store.finished)
+    monkeypatch.setattr(main, "get_maintenance_lease", store.get)
+    monkeypatch.setattr(main, "_maintenance_is_leader", False)
+    monkeypatch.setattr(main, "_maintenance_leader_since", None)
+    monkeypatch.setattr(main, "_maintenance_runs_total", 0)
+    monkeypatch.setattr(main, "_maintenance_shutting_down", False)
+    monkeypatch.setattr(main, "_maintenance_run_task", None)
+    monkeypatch.setattr(main, "_admin_log_cleanup_task", None)
+    monkeypatch.setattr(
+        main,
+        "resume_moderation_sweep",
+        lambda: store.resumed.append(main.MAINTENANCE_WORKER_ID) or False,
+    )
+    main._maintenance_stop.clear()
+    yield store
+    main._maintenance_stop.clear()
+
+
+@pytest.fixture
+def maintenance_runs(monkeypatch: Any) -> list[str]:
+    runs: list[str] = []
+
+    def _run() -> dict[str, object]:
+        runs.append(main.MAINTENANCE_WORKER_ID)
+        return {"admin_logs_deleted": 3, "users_deleted": 1}
+
+    monkeypatch.setattr(main, "run_admin_maintenance", _run)
+    return runs
+
+
+def _tick_as(monkeypatch: Any, worker_id: str) -> bool:
+    monkeypatch.setattr(main, "MAINTENANCE_WORKER_ID", worker_id)
+    return asyncio.run(main.run_admin_maintenance_tick())
+
+
+def test_only_lease_holder_runs_maintenance(
+    lease_store: FakeLeaseStore, maintenance_runs: list[str], monkeypatch: Any
+) -> None:
+    assert _tick_as(monkeypatch, "worker-a") is True
+    assert _tick_as(monkeypatch, "worker-b") is False
+    assert _tick_as(monkeypatch, "worker-c") is False
+
+    assert maintenance_runs == ["worker-a"]
+    # 멈춘 금칙어 점검 작업도 리더만 이어받는다
+    assert lease_store.resumed == ["worker-a"]
+    assert lease_store.row is not None
+    assert lease_store.row["holder"] == "worker-a"
+    assert lease_store.row["last_run_stats"] == {
+        "admin_logs_deleted": 3,
+        "users_deleted": 1,
+    }
+
+
+def test_leader_waits_for_interval_before_running_again(
+    lease_store: FakeLeaseStore, maintenance_runs: list[str], monkeypatch: Any
+) -> None:
+    assert _tick_as(monkeypatch, "worker-a") is True
+
+    lease_store.now += main.MAINTENANCE_LEASE_RENEW_SECONDS
+    assert _tick_as(monkeypatch, "worker-a") is False
+
+    lease_store.now = main.ADMIN_LOG_CLEANUP_INTERVAL_SECONDS
+    assert _tick_as(monkeypatch, "worker-a") is True
+    assert maintenance_runs == ["worker-a", "worker-a"]
+
+
+def test_lease_fails_over_after_leader_stops_renewing(
+    lease_store: FakeLeaseStore, maintenance_runs: list[str], monkeypatch: Any
+) -> None:
+    assert _tick_as(monkeypatch, "worker-a") is True
+
+    # worker-a가 죽어 연장이 멈춤 - 만료 전에는 넘겨받지 못한다
+    lease_store.now += main.MAINTENANCE_LEASE_TTL_SECONDS - 1
+    assert _tick_as(monkeypatch, "worker-b") is False
+    assert lease_store.row is not None
+    assert lease_store.row["holder"] == "worker-a"
+
+    # 만료 후 worker-b가 임대를 잡지만 실행 주기는 마지막 실행 기준으로 지킨다
+    lease_store.now += 1
+    assert _tick_as(monkeypatch, "worker-b") is False
+    assert lease_store.row["holder"] == "worker-b"
+    assert main._maintenance_is_leader is True
+
+    lease_store.now = main.ADMIN_LOG_CLEANUP_INTERVAL_SECONDS
+    assert _tick_as(monkeypatch, "worker-b") is True
+    assert maintenance_runs == ["worker-a", "worker-b"]
+
+
+def test_released_lease_is_taken_over_immediately(
+    lease_store: FakeLeaseStore, maintenance_runs: list[str], monkeypatch: Any
+) -> None:
+    assert _tick_as(monkeypatch, "worker-a") is True
+    asyncio.run(main._release_maintenance_lease())
+
+    assert main._maintenance_is_leader is False
+    assert _tick_as(monkeypatch, "worker-b") is False
+    assert lease_store.row is not None
+    assert lease_store.row["holder"] == "worker-b"
+    assert maintenance_runs == ["worker-a"]
+
+
+def test_failed_run_records_error(
+    lease_store: FakeLeaseStore, monkeypatch: Any
+) -> None:
+    def _boom() -> dict[str, object]:
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(main, "run_admin_maintenance", _boom)
+
+    assert _tick_as(monkeypatch, "worker-a") is True
+    assert lease_store.row is not None
+    assert lease_store.row["last_run_error"] == "db down"
+
+
+def test_maintenance_snapshot_reports_leader_and_last_run(
+    lease_store: FakeLeaseStore, maintenance_runs: list[str], monkeypatch: Any
+) -> None:
+    _ = maintenance_runs
+    assert _tick_as(monkeypatch, "worker-a") is True
+
+    snapshot = main._maintenance_snapshot()
+
+    assert snapshot["worker_id"] == "worker-a"
+    assert snapshot["is_leader"] is True
+    assert snapshot["runs_total"] == 1
+    assert snapshot["leader"] == {
+        "worker_id": "worker-a",
+        "acquired_at": 0.0,
+        "expires_at": main.MAINTENANCE_LEASE_TTL_SECONDS,
+    }
+    last_run = snapshot["last_run"]
+    assert isinstance(last_run, dict)
+    assert last_run["worker_id"] == "worker-a"
+    assert last_run["stats"] == {"admin_logs_deleted": 3, "users_deleted": 1}
+
+
+def test_run_stops_when_lease_is_lost_mid_run(
+    lease_store: FakeLeaseStore, monkeypatch: Any
+) -> None:
+    monkeypatch.setattr(main, "MAINTENANCE_LEASE_RENEW_SECONDS", 0.01)
+
+    def _run() -> dict[str, object]:
+        assert lease_store.row is not None
+        # 연장이 늦어 임대가 만료됐고 worker-b가 넘겨받았다
+        lease_store.row["holder"] = "worker-b"
+        lease_store.row["expires_at"] = lease_store.now + 1000
+        stopped = main._maintenance_stop.wait(5)
+        return {"stopped": stopped}
+
+    monkeypatch.setattr(main, "run_admin_maintenance", _run)
+
+    assert _tick_as(monkeypatch, "worker-a") is True
+    assert main._maintenance_is_leader is False
+    assert not main._maintenance_stop.is_set()
+    assert lease_store.row is not None
+    assert lease_store.row["holder"] == "worker-b"
+    assert lease_store.row["last_run_stats"] == {"stopped": True}
+    assert lease_store.row["last_run_error"] == "maintenance lease lost"
+
+
+def test_shutdown_waits_for_run_before_releasing_lease(
+    lease_store: FakeLeaseStore, monkeypatch: Any
+) -> None:
+    events: list[str] = []
+    release = lease_store.release
+
+    def _run() -> dict[str, object]:
+        events.append("run-started")
+        _ = main._maintenance_stop.wait(5)
+        events.append("run-finished")
+        return {}
+
+    def _release(name: str, holder: str) -> bool:
+        events.append("released")
+        return release(name, holder)
+
+    monkeypatch.setattr(main, "run_admin_maintenance", _run)
+    monkeypatch.setattr(main, "release_maintenance_lease", _release)
+    monkeypatch.setattr(main, "MAINTENANCE_WORKER_ID", "worker-a")
+
+    async def _scenario() -> None:
+        main._admin_log_cleanup_task = asyncio.create_task(
+            main.run_admin_log_cleanup_loop()
+        )
+        while main._maintenance_run_task is None:
+            await asyncio.sleep(0.01)
+        await main._stop_admin_maintenance()
+
+    asyncio.run(_scenario())
+
+    assert events == ["run-started", "run-finished", "released"]
+    assert lease_store.row is not None
+    assert lease_store.row["holder"] is None
+    assert lease_store.row["last_run_finished_at"] is not None
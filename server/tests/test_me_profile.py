@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import main
+from auth import create_access_token
+
+
+def _user_row(**overrides: Any) -> dict[str, Any]:
+    return {
+        "id": "user-1",
+        "email": "user@example.com",
+        "nickname": "user",
+        "role": "user",
+        "status": "active",
+        "token_version": 0,
+        "avatar_url": None,
+        "bio": None,
+        **overrides,
+    }
+
+
+@pytest.fixture
+def auth_headers(monkeypatch: Any) -> dict[str, str]:
+    async def _get_user_by_id(_user_id: str) -> dict[str, Any]:
+        return _user_row()
+
+    def _blocking_lookup(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("blocking db call on the event loop")
+
+    main._invalidate_user_context()
+    monkeypatch.setattr(main, "get_user_by_id_async", _get_user_by_id)
+    monkeypatch.setattr(main, "get_user_by_id", _blocking_lookup)
+    monkeypatch.setattr(main, "get_user_by_nickname", _blocking_lookup)
+    token = create_access_token({"sub": "user-1", "email": "user@example.com"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_get_me_uses_async_user_lookup(auth_headers: dict[str, str]) -> None:
+    client = TestClient(main.app)
+
+    response = client.get("/api/me", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json()["nickname"] == "user"
+
+
+def test_update_me_rejects_taken_nickname(
+    auth_headers: dict[str, str], monkeypatch: Any
+) -> None:
+    async def _get_user_by_nickname(_nickname: str) -> dict[str, Any]:
+        return _user_row(id="user-2", nickname="taken")
+
+    monkeypatch.setattr(main, "get_user_by_nickname_async", _get_user_by_nickname)
+    client = TestClient(main.app)
+
+    response = client.patch("/api/me", json={"nickname": "taken"}, headers=auth_headers)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "이미 사용 중인 닉네임입니다"
+
+
+def test_update_me_writes_through_async_layer(
+    auth_headers: dict[str, str], monkeypatch: Any
+) -> None:
+    updates_seen: list[dict[str, object]] = []
+
+    async def _get_user_by_nickname(_nickname: str) -> None:
+        return None
+
+    async def _update_user_profile(
+        _user_id: str, updates: dict[str, object]
+    ) -> dict[str, Any]:
+        updates_seen.append(updates)
+        return _user_row(**updates)
+
+    monkeypatch.setattr(main, "get_user_by_nickname_async", _get_user_by_nickname)
+    monkeypatch.setattr(main, "update_user_profile_async", _update_user_profile)
+    client = TestClient(main.app)
+
+    response = client.patch(
+        "/api/me",
+        json={"nickname": " newname ", "bio": "hello"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json()["nickname"] == "newname"
+    assert updates_seen == [{"nickname": "newname", "bio": "hello"}]
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+from psycopg2 import errors
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import migrations
+from migrations import Migration
+
+
+class _FakeDatabase:
+    def __init__(self, applied: set[int] | None = None) -> None:
+        self.applied = applied
+        self.executed: list[tuple[str, bool]] = []
+        self.connections = 0
+
+
+class _FakeCursor:
+    def __init__(self, conn: _FakeConnection) -> None:
+        self.conn = conn
+        self.db = conn.db
+        self.rows: list[tuple[Any, ...]] = []
+
+    def __enter__(self) -> _FakeCursor:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        return None
+
+    def execute(self, query: str, params: tuple[Any, ...] | None = None) -> None:
+        sql = " ".join(query.split())
+        self.db.executed.append((sql, self.conn.autocommit))
+        if sql.startswith("SELECT MAX(version)"):
+            if self.db.applied is None:
+                raise errors.UndefinedTable("schema_migrations does not exist")
+            self.rows = [(max(self.db.applied, default=None),)]
+        elif sql.startswith("CREATE TABLE IF NOT EXISTS schema_migrations"):
+            if self.db.applied is None:
+                self.db.applied = set()
+        elif sql.startswith("SELECT version FROM schema_migrations"):
+            self.rows = [(version,) for version in sorted(self.db.applied or set())]
+        elif sql.startswith("INSERT INTO schema_migrations"):
+            assert params is not None
+            assert self.db.applied is not None
+            self.db.applied.add(params[0])
+        elif "FAIL" in sql:
+            raise RuntimeError("migration failed")
+        else:
+            self.rows = []
+
+    def fetchone(self) -> tuple[Any, ...] | None:
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self) -> list[tuple[Any, ...]]:
+        return self.rows
+
+
+class _FakeConnection:
+    def __init__(self, db: _FakeDatabase) -> None:
+        self.db = db
+        self.autocommit = False
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    def commit(self) -> None:
+        return None
+
+    def rollback(self) -> None:
+        return None
+
+
+@pytest.fixture
+def fake_db(monkeypatch: Any) -> _FakeDatabase:
+    db = _FakeDatabase()
+
+    @contextmanager
+    def _get_db_connection() -> Iterator[_FakeConnection]:
+        db.connections += 1
+        yield _FakeConnection(db)
+
+    monkeypatch.setattr(migrations, "get_db_connection", _get_db_connection)
+    return db
+
+
+TEST_MIGRATIONS = (
+    Migration(1, "create_items", ["CREATE TABLE IF NOT EXISTS items (id INT)"]),
+    Migration(
+        2,
+        "index_items",
+        ["CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_items_id ON items (id)"],
+        concurrent=True,
+    ),
+)
+
+
+def test_fresh_database_applies_all_under_advisory_lock(fake_db: _FakeDatabase) -> None:
+    applied = migrations.run_migrations(TEST_MIGRATIONS)
+
+    assert applied == [1, 2]
+    assert fake_db.applied == {1, 2}
+    statements = [sql for sql, _ in fake_db.executed]
+    lock_index = next(
+        i for i, sql in enumerate(statements) if "pg_advisory_lock" in sql
+    )
+    create_index = statements.index("CREATE TABLE IF NOT EXISTS items (id INT)")
+    assert lock_index < create_index
+    assert "pg_advisory_unlock" in statements[-1]
+    # 트랜잭션 안에서 스키마를, autocommit으로 CONCURRENTLY 인덱스를 만든다
+    autocommit_by_sql = dict(fake_db.executed)
+    assert autocommit_by_sql["CREATE TABLE IF NOT EXISTS items (id INT)"] is False
+    assert (
+        autocommit_by_sql[
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_items_id ON items (id)"
+        ]
+        is True
+    )
+
+
+def test_warm_start_costs_one_query(fake_db: _FakeDatabase) -> None:
+    fake_db.applied = {1, 2}
+
+    applied = migrations.run_migrations(TEST_MIGRATIONS)
+
+    assert applied == []
+    assert [sql for sql, _ in fake_db.executed] == [
+        "SELECT MAX(version) FROM schema_migrations"
+    ]
+
+
+def test_only_pending_migrations_are_applied(fake_db: _FakeDatabase) -> None:
+    fake_db.applied = {1}
+
+    applied = migrations.run_migrations(TEST_MIGRATIONS)
+
+    assert applied == [2]
+    statements = [sql for sql, _ in fake_db.executed]
+    assert "CREATE TABLE IF NOT EXISTS items (id INT)" not in statements
+
+
+def test_failed_migration_is_not_recorded_and_lock_is_released(
+    fake_db: _FakeDatabase,
+) -> None:
+    failing = (
+        *TEST_MIGRATIONS[:1],
+        Migration(3, "broken", ["SELECT FAIL"]),
+    )
+
+    with pytest.raises(RuntimeError):
+        _ = migrations.run_migrations(failing)
+
+    assert fake_db.applied == {1}
+    assert "pg_advisory_unlock" in fake_db.executed[-1][0]
+
+
+def test_baseline_indexes_are_built_concurrently() -> None:
+    index_migrations = [m for m in migrations.MIGRATIONS if m.concurrent]
+
+    assert index_migrations
+    for migration in index_migrations:
+        for statement in migration.statements:
+            assert "CONCURRENTLY" in statement
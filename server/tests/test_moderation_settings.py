@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import main
+
+
+@pytest.fixture
+def settings_store(monkeypatch: Any) -> dict[str, Any]:
+    store: dict[str, Any] = {
+        "row": {
+            "id": 1,
+            "blocked_keywords": ["스팸"],
+            "auto_hide_report_threshold": 5,
+            "home_filter_tabs": [],
+            "explore_filter_tabs": [],
+            "admin_log_retention_days": 365,
+            "admin_log_view_window_days": 30,
+            "admin_log_mask_reasons": True,
+            "updated_at": datetime(2026, 1, 1),
+        },
+        "loads": 0,
+        "version_checks": 0,
+    }
+
+    def _get_moderation_settings() -> dict[str, Any]:
+        store["loads"] += 1
+        return dict(store["row"])
+
+    def _get_updated_at() -> datetime:
+        store["version_checks"] += 1
+        return store["row"]["updated_at"]
+
+    monkeypatch.setattr(main, "get_moderation_settings", _get_moderation_settings)
+    monkeypatch.setattr(main, "get_moderation_settings_updated_at", _get_updated_at)
+    monkeypatch.setattr(main, "get_latest_policy_update_action", lambda: None)
+    main.invalidate_moderation_settings_cache()
+    yield store
+    main.invalidate_moderation_settings_cache()
+
+
+def test_settings_are_served_from_cache(settings_store: dict[str, Any]) -> None:
+    first = main.get_effective_moderation_settings()
+    second = main.get_effective_moderation_settings()
+
+    assert second == first
+    assert settings_store["loads"] == 1
+    assert settings_store["version_checks"] == 0
+
+
+def test_unchanged_version_only_checks_updated_at(
+    settings_store: dict[str, Any], monkeypatch: Any
+) -> None:
+    monkeypatch.setattr(main, "MODERATION_SETTINGS_CHECK_INTERVAL_SECONDS", 0.0)
+
+    _ = main.get_effective_moderation_settings()
+    _ = main.get_effective_moderation_settings()
+
+    assert settings_store["loads"] == 1
+    assert settings_store["version_checks"] == 1
+
+
+def test_changed_version_reloads_settings(
+    settings_store: dict[str, Any], monkeypatch: Any
+) -> None:
+    monkeypatch.setattr(main, "MODERATION_SETTINGS_CHECK_INTERVAL_SECONDS", 0.0)
+    _ = main.get_effective_moderation_settings()
+
+    settings_store["row"]["auto_hide_report_threshold"] = 9
+    settings_store["row"]["updated_at"] = datetime(2026, 1, 2)
+    reloaded = main.get_effective_moderation_settings()
+
+    assert settings_store["loads"] == 2
+    assert reloaded["auto_hide_report_threshold"] == 9
+    assert reloaded["updated_at"] == datetime(2026, 1, 2)
+
+
+def test_invalidate_forces_reload(settings_store: dict[str, Any]) -> None:
+    _ = main.get_effective_moderation_settings()
+
+    main.invalidate_moderation_settings_cache()
+    _ = main.get_effective_moderation_settings()
+
+    assert settings_store["loads"] == 2
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import main
+
+
+def _row_id(index: int) -> str:
+    return f"00000000-0000-0000-0000-{index:012d}"
+
+
+@pytest.fixture
+def sweep_store(monkeypatch: Any) -> dict[str, Any]:
+    store: dict[str, Any] = {
+        "rows": {
+            "projects": [
+                {"id": _row_id(1), "content": "새 프로젝트 소개"},
+                {"id": _row_id(2), "content": "불법 토 토 홍보"},
+                {"id": _row_id(3), "content": "게임 만들기"},
+            ],
+            "comments": [
+                {"id": _row_id(4), "content": "좋아요"},
+                {"id": _row_id(5), "content": "ㄷㅗ박 사이트 링크"},
+            ],
+        },
+        "batches": [],
+        "phases": [],
+        "finished": [],
+        "logs": [],
+        "running": True,
+        "checkpoint": None,
+    }
+
+    def _iter_batches(
+        phase: str, after_id: str | None, batch_size: int
+    ) -> Iterator[list[dict[str, Any]]]:
+        rows = [
+            row
+            for row in store["rows"][phase]
+            if after_id is None or row["id"] > after_id
+        ]
+        for start in range(0, len(rows), batch_size):
+            yield rows[start : start + batch_size]
+
+    def _apply_batch(**kwargs: Any) -> list[str] | None:
+        if not store["running"]:
+            return None
+        if kwargs["previous_last_id"] != store["checkpoint"]:
+            return None
+        store["checkpoint"] = kwargs["last_id"]
+        store["batches"].append(kwargs)
+        return list(kwargs["hide_ids"])
+
+    monkeypatch.setattr(main, "MODERATION_SWEEP_BATCH_SIZE", 2)
+    monkeypatch.setattr(main, "iter_moderation_sweep_batches", _iter_batches)
+    monkeypatch.setattr(main, "apply_moderation_sweep_batch", _apply_batch)
+    monkeypatch.setattr(
+        main,
+        "advance_moderation_sweep_phase",
+        lambda sweep_id, phase: (
+            store["phases"].append(phase) or store.update(checkpoint=None) or True
+        ),
+    )
+    monkeypatch.setattr(
+        main,
+        "finish_moderation_sweep",
+        lambda sweep_id, status, error=None: store["finished"].append(status),
+    )
+    monkeypatch.setattr(
+        main, "write_admin_action_log", lambda **kwargs: store["logs"].append(kwargs)
+    )
+    monkeypatch.setattr(
+        main,
+        "get_effective_moderation_settings",
+        lambda: {
+            "blocked_keywords": ["불법토토", "도박"],
+            "baseline_keyword_categories": {},
+            "updated_at": datetime(2026, 4, 1),
+        },
+    )
+    return store
+
+
+def test_sweep_hides_matches_in_batches_across_phases(
+    sweep_store: dict[str, Any],
+) -> None:
+    main.run_moderation_sweep("sweep-1", "projects", None, "admin-1")
+
+    assert [batch["hide_ids"] for batch in sweep_store["batches"]] == [
+        [_row_id(2)],
+        [],
+        [_row_id(5)],
+    ]
+    assert [batch["last_id"] for batch in sweep_store["batches"]] == [
+        _row_id(2),
+        _row_id(3),
+        _row_id(5),
+    ]
+    assert [batch["previous_last_id"] for batch in sweep_store["batches"]] == [
+        None,
+        _row_id(2),
+        None,
+    ]
+    assert sweep_store["phases"] == ["comments"]
+    assert sweep_store["finished"] == ["completed"]
+    assert [log["reason"].split(",")[0] for log in sweep_store["logs"]] == [
+        "phase=projects",
+        "phase=comments",
+    ]
+
+
+def test_sweep_resumes_after_checkpoint(sweep_store: dict[str, Any]) -> None:
+    sweep_store["checkpoint"] = _row_id(4)
+    main.run_moderation_sweep("sweep-1", "comments", _row_id(4), None)
+
+    assert [batch["hide_ids"] for batch in sweep_store["batches"]] == [[_row_id(5)]]
+    assert sweep_store["phases"] == []
+    assert sweep_store["logs"][0]["admin_id"] == main.SYSTEM_ADMIN_USER_ID
+
+
+def test_superseded_sweep_stops_without_finishing(
+    sweep_store: dict[str, Any],
+) -> None:
+    sweep_store["running"] = False
+
+    main.run_moderation_sweep("sweep-1", "projects", None, "admin-1")
+
+    assert sweep_store["finished"] == []
+    assert sweep_store["logs"] == []
+
+
+def test_sweep_stops_when_another_runner_moved_checkpoint(
+    sweep_store: dict[str, Any],
+) -> None:
+    # 다른 실행기가 이미 첫 배치를 반영한 상태
+    sweep_store["checkpoint"] = _row_id(2)
+
+    main.run_moderation_sweep("sweep-1", "projects", None, "admin-1")
+
+    assert sweep_store["batches"] == []
+    assert sweep_store["checkpoint"] == _row_id(2)
+    assert sweep_store["finished"] == []
+
+
+def test_sweep_with_added_keywords_only_checks_those(
+    sweep_store: dict[str, Any],
+) -> None:
+    main.run_moderation_sweep(
+        "sweep-1",
+        "projects",
+        None,
+        "admin-1",
+        keywords=[main.normalize_text_for_filter("도박")],
+    )
+
+    assert [batch["hide_ids"] for batch in sweep_store["batches"]] == [
+        [],
+        [],
+        [_row_id(5)],
+    ]
+    assert "ids=" not in sweep_store["logs"][0]["reason"]
+
+
+def test_revert_endpoint_restores_sweep_items(monkeypatch: Any) -> None:
+    reverted: list[str] = []
+    logs: list[dict[str, Any]] = []
+
+    def _revert(sweep_id: str) -> dict[str, int] | None:
+        reverted.append(sweep_id)
+        return {"projects_restored": 1, "comments_restored": 2}
+
+    monkeypatch.setattr(main, "revert_moderation_sweep", _revert)
+    monkeypatch.setattr(
+        main, "write_admin_action_log", lambda **kwargs: logs.append(kwargs)
+    )
+    main.app.dependency_overrides[main.require_admin] = lambda: {"id": "admin-1"}
+    try:
+        response = TestClient(main.app).post(
+            f"/api/admin/moderation/sweep/{_row_id(9)}/revert",
+            json={"reason": "오탐 복구"},
+        )
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json() == {"projects_restored": 1, "comments_restored": 2}
+    assert reverted == [_row_id(9)]
+    assert logs[0]["action_type"] == "moderation_sweep_reverted"
+
+
+def test_sweep_status_reports_throughput() -> None:
+    payload = main.serialize_moderation_sweep(
+        {
+            "id": _row_id(9),
+            "status": "running",
+            "phase": "comments",
+            "last_id": _row_id(5),
+            "scanned_count": 1000,
+            "hidden_count": 3,
+            "requested_by": None,
+            "started_at": datetime(2026, 4, 1, 0, 0, 0),
+            "updated_at": datetime(2026, 4, 1, 0, 0, 4),
+            "finished_at": None,
+        }
+    )
+
+    assert payload["rows_per_second"] == 250.0
+    assert payload["last_id"] == _row_id(5)
@@ -1,51 +1,77 @@
 from __future__ import annotations
 
-import json
+import hashlib
 import sys
+import time
 from pathlib import Path
 from typing import Any
 from urllib.parse import parse_qs, unquote, urlparse
 
+import httpx
+import rsa
 from fastapi.testclient import TestClient
+from jose import jwk, jwt
+from jose.utils import calculate_at_hash
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+import http_client
 import main
 from auth import decode_token
+from google_id_token import google_jwks_cache
+
+_GOOGLE_PUBLIC_KEY, _GOOGLE_PRIVATE_KEY = rsa.newkeys(1024)
+_GOOGLE_KEY_ID = "test-google-key"
+_GOOGLE_ACCESS_TOKEN = "ya29.test-access-token"
+
+
+def _google_jwks() -> dict[str, Any]:
+    public_jwk = jwk.construct(
+        _GOOGLE_PUBLIC_KEY.save_pkcs1().decode("utf-8"), "RS256"
+    ).to_dict()
+    public_jwk["kid"] = _GOOGLE_KEY_ID
+    return {"keys": [public_jwk]}
+
+
+def _sign_google_id_token(claims: dict[str, Any]) -> str:
+    now = int(time.time())
+    payload = {
+        "iss": "https://accounts.google.com",
+        "aud": "google-client-id",
+        "iat": now,
+        "exp": now + 300,
+        # 인가 코드 교환으로 받은 실제 id_token처럼 at_hash를 넣는다
+        "at_hash": calculate_at_hash(_GOOGLE_ACCESS_TOKEN, hashlib.sha256),
+        **claims,
+    }
+    return jwt.encode(
+        payload,
+        _GOOGLE_PRIVATE_KEY.save_pkcs1().decode("utf-8"),
+        algorithm="RS256",
+        headers={"kid": _GOOGLE_KEY_ID},
+    )
 
 
-class _FakeResponse:
-    def __init__(self, payload: dict[str, Any]):
-        self._payload = payload
-
-    def read(self) -> bytes:
-        return json.dumps(self._payload).encode("utf-8")
-
-    def __enter__(self) -> "_FakeResponse":
-        return self
-
-    def __exit__(self, exc_type: object, exc: object, tb: object) -> bool:
-        return False
-
-
-def _mock_google_urlopen(
-    token_payload: dict[str, Any], profile_payload: dict[str, Any]
-):
-    def _urlopen(request: Any, timeout: int = 10) -> _FakeResponse:
-        _ = timeout
-        request_url = getattr(request, "full_url", str(request))
-        if "oauth2.googleapis.com/tokeninfo" in request_url:
-            return _FakeResponse(profile_payload)
+def _mock_google_http(profile_payload: dict[str, Any]) -> httpx.AsyncClient:
+    def _handler(request: httpx.Request) -> httpx.Response:
+        request_url = str(request.url)
         if "oauth2.googleapis.com/token" in request_url:
-            return _FakeResponse(token_payload)
+            return httpx.Response(
+                200,
+                json={
+                    "access_token": _GOOGLE_ACCESS_TOKEN,
+                    "id_token": _sign_google_id_token(profile_payload),
+                },
+            )
         raise AssertionError(f"Unexpected URL opened in test: {request_url}")
 
-    return _urlopen
+    return httpx.AsyncClient(transport=httpx.MockTransport(_handler))
 
 
 def _enable_google_oauth(monkeypatch: Any) -> None:
     monkeypatch.setattr(main, "GOOGLE_CLIENT_ID", "google-client-id")
     monkeypatch.setattr(main, "GOOGLE_CLIENT_SECRET", "google-client-secret")
+    google_jwks_cache.set_keys(_google_jwks())
     monkeypatch.setattr(
         main,
         "get_effective_oauth_settings",
@@ -98,10 +124,9 @@ def test_google_callback_redirects_with_oauth_status_for_pending_user(
     monkeypatch.setattr(main, "cleanup_oauth_state_tokens", lambda: None)
     monkeypatch.setattr(main, "decode_token", lambda _: {"type": "google_oauth_state"})
     monkeypatch.setattr(
-        main,
-        "urlopen",
-        _mock_google_urlopen(
-            token_payload={"id_token": "fake-id-token"},
+        http_client,
+        "_http_client",
+        _mock_google_http(
             profile_payload={
                 "email": "pending@example.com",
                 "sub": "google-user-id",
@@ -144,10 +169,9 @@ def test_google_callback_redirects_with_oauth_token_for_active_user(
     monkeypatch.setattr(main, "cleanup_oauth_state_tokens", lambda: None)
     monkeypatch.setattr(main, "decode_token", lambda _: {"type": "google_oauth_state"})
     monkeypatch.setattr(
-        main,
-        "urlopen",
-        _mock_google_urlopen(
-            token_payload={"id_token": "fake-id-token"},
+        http_client,
+        "_http_client",
+        _mock_google_http(
             profile_payload={
                 "email": "active@example.com",
                 "sub": "google-user-id",
@@ -197,10 +221,9 @@ def test_google_callback_rejects_replayed_state(monkeypatch: Any) -> None:
     monkeypatch.setattr(main, "cleanup_oauth_state_tokens", lambda: None)
     monkeypatch.setattr(main, "decode_token", lambda _: {"type": "google_oauth_state"})
     monkeypatch.setattr(
-        main,
-        "urlopen",
-        _mock_google_urlopen(
-            token_payload={"id_token": "fake-id-token"},
+        http_client,
+        "_http_client",
+        _mock_google_http(
             profile_payload={
                 "email": "active@example.com",
                 "sub": "google-user-id",
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import auth
+import main
+
+
+def test_hash_and_verify_run_on_pool() -> None:
+    pool = auth.PasswordHashPool(workers=1, max_pending=2, timeout=5)
+    hashed = pool.run(auth._hashpw, "secret-password")
+
+    assert pool.run(auth._checkpw, "secret-password", hashed) is True
+    assert pool.run(auth._checkpw, "other-password", hashed) is False
+    stats = pool.stats()
+    assert stats["completed_total"] == 3
+    assert stats["pending"] == 0
+    assert float(stats["hash_ms_p95"]) > 0
+    pool.shutdown()
+
+
+def test_full_queue_is_rejected_without_waiting() -> None:
+    pool = auth.PasswordHashPool(workers=1, max_pending=1, timeout=5)
+    started = threading.Event()
+    release = threading.Event()
+
+    def _slow() -> bool:
+        started.set()
+        return release.wait(timeout=5)
+
+    worker = threading.Thread(target=lambda: pool.run(_slow))
+    worker.start()
+    assert started.wait(timeout=5)
+
+    with pytest.raises(auth.PasswordHasherBusy):
+        _ = pool.run(auth._hashpw, "secret-password")
+
+    release.set()
+    worker.join(timeout=5)
+    stats = pool.stats()
+    assert stats["rejected_total"] == 1
+    assert stats["pending"] == 0
+    pool.shutdown()
+
+
+def test_busy_hasher_returns_503(monkeypatch: Any) -> None:
+    def _busy(plain_password: str, hashed_password: str) -> bool:
+        raise auth.PasswordHasherBusy("password hash queue is full")
+
+    monkeypatch.setattr(main, "_rate_limiter", main.InMemoryRateLimiter())
+    monkeypatch.setattr(
+        main,
+        "get_user_by_email",
+        lambda email: {"id": "u1", "email": email, "password_hash": "hash"},
+    )
+    monkeypatch.setattr(main, "verify_password", _busy)
+    client = TestClient(main.app)
+
+    response = client.post(
+        "/api/auth/login",
+        json={"email": "user@example.com", "password": "secret-password"},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
@@ -0,0 +1,610 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import main
+
+
+def _project_row(index: int) -> dict[str, Any]:
+    return {
+        "id": f"00000000-0000-0000-0000-{index:012d}",
+        "author_id": "11111111-1111-1111-1111-111111111111",
+        "title": f"project-{index}",
+        "like_count": 100 - index,
+        "created_at": datetime(2026, 1, 1) - timedelta(hours=index),
+        "platform": "web",
+        "tags": [],
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_project_cache() -> None:
+    main._invalidate_projects_cache()
+    yield
+    main._invalidate_projects_cache()
+
+
+def _fake_get_projects(rows: list[dict[str, Any]], calls: list[dict[str, Any]]):
+    def _get_projects(**kwargs: Any) -> list[dict[str, Any]]:
+        calls.append(kwargs)
+        cursor = kwargs.get("cursor")
+        sort = kwargs.get("sort")
+        matched = rows
+        if cursor is not None:
+            sort_value, row_id = cursor
+            key = "like_count" if sort == "popular" else "created_at"
+            matched = [
+                row for row in rows if (row[key], row["id"]) < (sort_value, row_id)
+            ]
+        return [dict(row) for row in matched[: kwargs["limit"]]]
+
+    return _get_projects
+
+
+def _list_first_page() -> dict[str, Any]:
+    response = main.list_projects(accept_encoding=None)
+    return json.loads(response.body)
+
+
+def test_project_cursor_roundtrip() -> None:
+    row = _project_row(3)
+
+    latest_cursor = main._encode_project_cursor("latest", row)
+    popular_cursor = main._encode_project_cursor("popular", row)
+
+    assert main._decode_project_cursor("latest", latest_cursor) == (
+        row["created_at"],
+        row["id"],
+    )
+    assert main._decode_project_cursor("popular", popular_cursor) == (
+        row["like_count"],
+        row["id"],
+    )
+
+
+def test_list_projects_rejects_cursor_from_other_sort() -> None:
+    cursor = main._encode_project_cursor("latest", _project_row(1))
+    client = TestClient(main.app)
+
+    response = client.get("/api/projects", params={"sort": "popular", "cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "유효하지 않은 커서입니다"
+
+
+def test_list_projects_walks_pages_with_next_cursor(monkeypatch: Any) -> None:
+    rows = [_project_row(index) for index in range(5)]
+    calls: list[dict[str, Any]] = []
+    monkeypatch.setattr(main, "get_projects", _fake_get_projects(rows, calls))
+    client = TestClient(main.app)
+
+    first = client.get("/api/projects", params={"limit": 2}).json()
+    second = client.get(
+        "/api/projects", params={"limit": 2, "cursor": first["next_cursor"]}
+    ).json()
+    third = client.get(
+        "/api/projects", params={"limit": 2, "cursor": second["next_cursor"]}
+    ).json()
+
+    assert [item["title"] for item in first["items"]] == ["project-0", "project-1"]
+    assert [item["title"] for item in second["items"]] == ["project-2", "project-3"]
+    assert [item["title"] for item in third["items"]] == ["project-4"]
+    assert third["next_cursor"] is None
+    assert all(call["limit"] == 3 for call in calls)
+
+
+def test_concurrent_cache_misses_share_one_query(monkeypatch: Any) -> None:
+    rows = [_project_row(index) for index in range(3)]
+    calls: list[dict[str, Any]] = []
+    release = threading.Event()
+    fetch_projects = _fake_get_projects(rows, calls)
+
+    def _slow_get_projects(**kwargs: Any) -> list[dict[str, Any]]:
+        assert release.wait(timeout=5)
+        return fetch_projects(**kwargs)
+
+    monkeypatch.setattr(main, "get_projects", _slow_get_projects)
+    before = cast(int, main._project_perf_snapshot()["coalesced_total"])
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(_list_first_page) for _ in range(4)]
+        while len(main._project_list_inflight) == 0:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        release.set()
+        results = [future.result(timeout=5) for future in futures]
+
+    assert len(calls) == 1
+    assert all(len(result["items"]) == 3 for result in results)
+    snapshot = main._project_perf_snapshot()
+    assert cast(int, snapshot["coalesced_total"]) - before == 3
+
+
+def test_stale_entry_is_served_while_refreshing_once(monkeypatch: Any) -> None:
+    calls: list[dict[str, Any]] = []
+    release = threading.Event()
+    fetch_projects = _fake_get_projects([_project_row(9)], calls)
+
+    def _slow_get_projects(**kwargs: Any) -> list[dict[str, Any]]:
+        assert release.wait(timeout=5)
+        return fetch_projects(**kwargs)
+
+    monkeypatch.setattr(main, "get_projects", _slow_get_projects)
+    main._set_cached_projects(
+        sort="latest",
+        platform=None,
+        tag=None,
+        limit=main.PROJECT_LIST_DEFAULT_LIMIT,
+        items=[_project_row(1)],
+        next_cursor=None,
+    )
+    key = main._project_cache_key("latest", None, None, main.PROJECT_LIST_DEFAULT_LIMIT)
+    _, stale_until, items, next_cursor, encoded = main._project_list_cache[key]
+    main._project_list_cache[key] = (
+        time.perf_counter() - 1,
+        stale_until,
+        items,
+        next_cursor,
+        encoded,
+    )
+
+    stale_first = _list_first_page()
+    stale_second = _list_first_page()
+    release.set()
+    deadline = time.perf_counter() + 5
+    while main._project_list_refreshing and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    refreshed = _list_first_page()
+
+    assert [item["title"] for item in stale_first["items"]] == ["project-1"]
+    assert [item["title"] for item in stale_second["items"]] == ["project-1"]
+    assert [item["title"] for item in refreshed["items"]] == ["project-9"]
+    assert len(calls) == 1
+
+
+def _seed_cache(
+    sort: str, rows: list[dict[str, Any]], limit: int, next_cursor: str | None
+) -> main.ProjectCacheKey:
+    main._set_cached_projects(
+        sort=sort,
+        platform=None,
+        tag=None,
+        limit=limit,
+        items=rows,
+        next_cursor=next_cursor,
+    )
+    return main._project_cache_key(sort, None, None, limit)
+
+
+def test_like_reorders_popular_page_without_touching_latest() -> None:
+    rows = [_project_row(index) for index in range(3)]
+    popular_key = _seed_cache("popular", rows, 3, None)
+    latest_key = _seed_cache("latest", rows, 3, None)
+
+    main._patch_cached_project_like_count(rows[2]["id"], 500)
+
+    popular_items = main._project_list_cache[popular_key][2]
+    latest_items = main._project_list_cache[latest_key][2]
+    assert [item["title"] for item in popular_items] == [
+        "project-2",
+        "project-0",
+        "project-1",
+    ]
+    assert [item["title"] for item in latest_items] == [
+        "project-0",
+        "project-1",
+        "project-2",
+    ]
+    assert latest_items[2]["like_count"] == 500
+
+
+def test_like_outside_full_popular_page_drops_only_that_key() -> None:
+    rows = [_project_row(index) for index in range(2)]
+    cursor = main._encode_project_cursor("popular", rows[-1])
+    popular_key = _seed_cache("popular", rows, 2, cursor)
+    latest_key = _seed_cache("latest", rows, 2, cursor)
+
+    main._patch_cached_project_like_count(_project_row(7)["id"], 1000)
+
+    assert popular_key not in main._project_list_cache
+    assert latest_key in main._project_list_cache
+
+
+def test_hidden_project_is_removed_from_cached_pages() -> None:
+    rows = [_project_row(index) for index in range(3)]
+    key = _seed_cache("latest", rows, 5, None)
+
+    main._apply_project_cache_change({**rows[1], "status": "hidden"})
+
+    assert [item["title"] for item in main._project_list_cache[key][2]] == [
+        "project-0",
+        "project-2",
+    ]
+
+
+def test_created_project_only_touches_matching_platform_keys() -> None:
+    rows = [_project_row(index) for index in range(2)]
+    main._set_cached_projects(
+        sort="latest",
+        platform="game",
+        tag=None,
+        limit=5,
+        items=[],
+        next_cursor=None,
+    )
+    web_key = _seed_cache("latest", rows, 5, None)
+    game_key = main._project_cache_key("latest", "game", None, 5)
+    created = {
+        **_project_row(0),
+        "id": "00000000-0000-0000-0000-00000000ffff",
+        "title": "new-project",
+        "created_at": datetime(2026, 2, 1),
+        "status": "published",
+        "author_nickname": "devkim",
+    }
+
+    main._apply_project_cache_change(created)
+
+    assert [item["title"] for item in main._project_list_cache[web_key][2]] == [
+        "new-project",
+        "project-0",
+        "project-1",
+    ]
+    assert main._project_list_cache[game_key][2] == []
+
+
+def test_cache_hit_returns_pre_encoded_gzip_body(monkeypatch: Any) -> None:
+    rows = [{**_project_row(index), "summary": "x" * 200} for index in range(10)]
+    calls: list[dict[str, Any]] = []
+    monkeypatch.setattr(main, "get_projects", _fake_get_projects(rows, calls))
+
+    miss = main.list_projects(accept_encoding="gzip")
+    hit = main.list_projects(accept_encoding="gzip, deflate")
+
+    assert len(calls) == 1
+    assert hit.headers["content-encoding"] == "gzip"
+    assert json.loads(gzip.decompress(hit.body)) == json.loads(
+        gzip.decompress(miss.body)
+    )
+    identity = main.list_projects(accept_encoding=None)
+    assert json.loads(identity.body)["items"][0]["id"] == str(rows[0]["id"])
+    assert "content-encoding" not in identity.headers
+    assert hit.headers["vary"] == identity.headers["vary"] == "Accept-Encoding"
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip", True),
+        ("GZIP;q=0.5, br", True),
+        ("br, *", True),
+        ("gzip;q=0", False),
+        ("gzip;q=0.0, identity", False),
+        ("*;q=1, gzip;q=0", False),
+        ("br;q=1", False),
+        ("", False),
+        (None, False),
+    ],
+)
+def test_gzip_acceptance_honours_q_values(
+    accept_encoding: str | None, expected: bool
+) -> None:
+    assert main._accepts_gzip(accept_encoding) is expected
+
+
+@pytest.fixture
+def like_store(monkeypatch: Any) -> dict[str, Any]:
+    project_id = _project_row(1)["id"]
+    store: dict[str, Any] = {
+        "counts": {project_id: 5},
+        "flushes": [],
+        "reconciles": [],
+        "likes": {(project_id, f"liker-{index}") for index in range(5)},
+    }
+
+    def _get_project_like_count(project_id: str) -> int | None:
+        return store["counts"].get(project_id)
+
+    def _apply_project_like_deltas(deltas: Any) -> dict[str, int]:
+        ids = sorted(deltas)
+        store["flushes"].append(ids)
+        for project_id in ids:
+            store["counts"][project_id] = max(
+                0, store["counts"][project_id] + deltas[project_id]
+            )
+        return {project_id: store["counts"][project_id] for project_id in ids}
+
+    def _reconcile_project_like_counts(project_ids: Any) -> dict[str, int]:
+        ids = sorted(project_ids)
+        store["reconciles"].append(ids)
+        for project_id in ids:
+            store["counts"][project_id] = sum(
+                1 for liked_id, _ in store["likes"] if liked_id == project_id
+            )
+        return {project_id: store["counts"][project_id] for project_id in ids}
+
+    monkeypatch.setattr(main, "get_project_like_count", _get_project_like_count)
+
+    def _add_project_like(project_id: str, user_id: str) -> bool | None:
+        if project_id not in store["counts"]:
+            return None
+        if (project_id, user_id) in store["likes"]:
+            return False
+        store["likes"].add((project_id, user_id))
+        return True
+
+    def _remove_project_like(project_id: str, user_id: str) -> bool:
+        if (project_id, user_id) not in store["likes"]:
+            return False
+        store["likes"].remove((project_id, user_id))
+        return True
+
+    monkeypatch.setattr(main, "apply_project_like_deltas", _apply_project_like_deltas)
+    monkeypatch.setattr(
+        main, "reconcile_project_like_counts", _reconcile_project_like_counts
+    )
+    monkeypatch.setattr(main, "add_project_like", _add_project_like)
+    monkeypatch.setattr(main, "remove_project_like", _remove_project_like)
+    monkeypatch.setattr(
+        main,
+        "get_liked_project_ids",
+        lambda user_id, project_ids: {
+            project_id
+            for project_id, liker_id in store["likes"]
+            if liker_id == user_id and project_id in project_ids
+        },
+    )
+    main._project_like_buffer.clear()
+    main._project_like_reconcile_ids.clear()
+    main._project_like_pending_events = 0
+    yield store
+    main._project_like_buffer.clear()
+    main._project_like_reconcile_ids.clear()
+    main._project_like_pending_events = 0
+    main.app.dependency_overrides.clear()
+
+
+def _login_as(user_id: str) -> None:
+    main.app.dependency_overrides[main.get_current_user] = lambda: {
+        "id": user_id,
+        "email": f"{user_id}@example.com",
+        "nickname": user_id,
+        "role": "user",
+        "status": "active",
+        "avatar_url": None,
+        "bio": None,
+    }
+
+
+def test_likes_are_buffered_and_flushed_in_one_update(
+    like_store: dict[str, Any],
+) -> None:
+    project_id = _project_row(1)["id"]
+    client = TestClient(main.app)
+
+    counts = []
+    for user_id in ("user-a", "user-b", "user-c"):
+        _login_as(user_id)
+        counts.append(
+            client.post(f"/api/projects/{project_id}/like").json()["like_count"]
+        )
+    unliked = client.delete(f"/api/projects/{project_id}/like").json()
+
+    assert counts == [6, 7, 8]
+    assert unliked["like_count"] == 7
+    assert like_store["flushes"] == []
+
+    assert main.flush_project_like_buffer() == 1
+    assert like_store["flushes"] == [[project_id]]
+    assert like_store["reconciles"] == []
+    assert like_store["counts"][project_id] == 7
+    assert main.flush_project_like_buffer() == 0
+
+
+def test_full_like_buffer_wakes_flush_loop_instead_of_flushing_inline(
+    like_store: dict[str, Any], monkeypatch: Any
+) -> None:
+    project_id = _project_row(1)["id"]
+    monkeypatch.setattr(main, "PROJECT_LIKE_FLUSH_MAX_EVENTS", 3)
+    monkeypatch.setattr(main, "PROJECT_LIKE_FLUSH_INTERVAL_SECONDS", 60.0)
+    main._project_like_flush_requested.clear()
+
+    for index in range(2):
+        like_store["likes"].add((project_id, f"user-{index}"))
+        _ = main._buffer_project_like(project_id, 1)
+    assert not main._project_like_flush_requested.is_set()
+
+    like_store["likes"].add((project_id, "user-2"))
+    _ = main._buffer_project_like(project_id, 1)
+    assert main._project_like_flush_requested.is_set()
+    assert like_store["flushes"] == []
+
+    async def _run_loop_once() -> None:
+        task = asyncio.create_task(main.run_project_like_flush_loop())
+        for _ in range(100):
+            if like_store["flushes"]:
+                break
+            await asyncio.sleep(0.01)
+        _ = task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+        # 대기 중인 스레드를 깨워 이벤트 루프가 바로 닫히게 한다
+        main._project_like_flush_requested.set()
+
+    asyncio.run(_run_loop_once())
+    main._project_like_flush_requested.clear()
+
+    assert like_store["flushes"] == [[project_id]]
+    assert like_store["counts"][project_id] == 8
+    assert main._project_like_buffer == {}
+
+
+def test_failed_like_flush_is_reconciled_on_next_flush(
+    like_store: dict[str, Any], monkeypatch: Any
+) -> None:
+    project_id = _project_row(1)["id"]
+    like_store["likes"].add((project_id, "user-a"))
+    _ = main._buffer_project_like(project_id, 1)
+
+    def _committed_then_broken(deltas: Any) -> dict[str, int]:
+        # UPDATE는 커밋됐지만 응답을 받기 전에 연결이 끊긴 경우
+        like_store["counts"][project_id] += deltas[project_id]
+        raise RuntimeError("connection lost")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(main, "apply_project_like_deltas", _committed_then_broken)
+        with pytest.raises(RuntimeError):
+            _ = main.flush_project_like_buffer()
+
+    assert main._project_like_buffer[project_id] == (5, 6)
+    assert main._project_like_reconcile_ids == {project_id}
+
+    like_store["likes"].add((project_id, "user-b"))
+    _ = main._buffer_project_like(project_id, 1)
+    assert main.flush_project_like_buffer() == 1
+
+    # 증감을 다시 더하지 않고 행 수로 맞춘다
+    assert like_store["flushes"] == [[]]
+    assert like_store["reconciles"] == [[project_id]]
+    assert like_store["counts"][project_id] == 7
+    assert main._project_like_reconcile_ids == set()
+
+
+def test_maintenance_reconciles_counter_lost_with_the_buffer(
+    like_store: dict[str, Any], monkeypatch: Any
+) -> None:
+    project_id = _project_row(1)["id"]
+    client = TestClient(main.app)
+    _login_as("user-a")
+
+    _ = client.post(f"/api/projects/{project_id}/like")
+    # 좋아요 행은 커밋됐지만 flush 전에 버퍼가 유실된 경우
+    main._project_like_buffer.clear()
+    main._project_like_pending_events = 0
+    _login_as("user-b")
+    _ = client.post(f"/api/projects/{project_id}/like")
+    _ = main.flush_project_like_buffer()
+
+    assert like_store["counts"][project_id] == 6
+
+    patched: list[tuple[str, int]] = []
+    monkeypatch.setattr(
+        main,
+        "reconcile_drifted_project_like_counts",
+        lambda: main.reconcile_project_like_counts(like_store["counts"]),
+    )
+    monkeypatch.setattr(
+        main,
+        "_patch_cached_project_like_count",
+        lambda project_id, like_count: patched.append((project_id, like_count)),
+    )
+    monkeypatch.setattr(
+        main,
+        "get_effective_moderation_settings",
+        lambda: {"admin_log_retention_days": 30},
+    )
+    monkeypatch.setattr(main, "ensure_admin_action_log_partitions", lambda months: 0)
+    monkeypatch.setattr(
+        main,
+        "cleanup_admin_action_logs_in_batches",
+        lambda days, on_progress: {"deleted_count": 0},
+    )
+    monkeypatch.setattr(main, "perform_due_user_deletion_cleanup", lambda: 0)
+    monkeypatch.setattr(main, "RATE_LIMIT_BACKEND", "memory")
+
+    stats = main.run_admin_maintenance()
+
+    assert stats["project_like_counts_reconciled"] == 1
+    assert like_store["counts"][project_id] == 7
+    assert patched == [(project_id, 7)]
+
+
+@pytest.mark.parametrize("project_id", [_project_row(42)["id"], "not-a-uuid"])
+def test_like_unknown_project_returns_404(
+    like_store: dict[str, Any], project_id: str
+) -> None:
+    client = TestClient(main.app)
+    _login_as("user-a")
+
+    response = client.post(f"/api/projects/{project_id}/like")
+
+    assert response.status_code == 404
+    assert main._project_like_buffer == {}
+
+
+def test_like_database_error_is_not_reported_as_404(
+    like_store: dict[str, Any], monkeypatch: Any
+) -> None:
+    def _broken_add(project_id: str, user_id: str) -> bool:
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(main, "add_project_like", _broken_add)
+    client = TestClient(main.app, raise_server_exceptions=False)
+    _login_as("user-a")
+
+    response = client.post(f"/api/projects/{_project_row(1)['id']}/like")
+
+    assert response.status_code == 500
+
+
+def test_repeated_like_and_unlike_are_idempotent_per_user(
+    like_store: dict[str, Any],
+) -> None:
+    project_id = _project_row(1)["id"]
+    client = TestClient(main.app)
+    _login_as("user-a")
+
+    likes = [client.post(f"/api/projects/{project_id}/like").json() for _ in range(3)]
+    unlikes = [
+        client.delete(f"/api/projects/{project_id}/like").json() for _ in range(2)
+    ]
+    _ = main.flush_project_like_buffer()
+
+    assert [like["like_count"] for like in likes] == [6, 6, 6]
+    assert all(like["liked"] for like in likes)
+    assert [unlike["like_count"] for unlike in unlikes] == [5, 5]
+    assert like_store["flushes"] == []
+    assert main._project_like_pending_events == 0
+
+
+def test_like_requires_login() -> None:
+    client = TestClient(main.app)
+
+    response = client.post(f"/api/projects/{_project_row(1)['id']}/like")
+
+    assert response.status_code == 401
+
+
+def test_like_status_batch_returns_flags_for_each_project(
+    like_store: dict[str, Any],
+) -> None:
+    liked_id = _project_row(1)["id"]
+    other_id = _project_row(2)["id"]
+    like_store["likes"].add((liked_id, "user-a"))
+    like_store["likes"].add((other_id, "user-b"))
+    client = TestClient(main.app)
+    _login_as("user-a")
+
+    response = client.get(
+        "/api/me/likes", params={"project_ids": [liked_id, other_id, liked_id]}
+    )
+    invalid = client.get("/api/me/likes", params={"project_ids": ["not-a-uuid"]})
+
+    assert response.status_code == 200
+    assert response.json() == {"liked": {liked_id: True, other_id: False}}
+    assert invalid.status_code == 400
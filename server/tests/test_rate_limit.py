@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import main
+from rate_limit import InMemoryRateLimiter, RateLimitPolicy, SharedRateLimiter
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bucket_allows_burst_then_refills() -> None:
+    clock = _Clock()
+    limiter = InMemoryRateLimiter(shards=2, clock=clock)
+    policy = RateLimitPolicy(capacity=2, refill_per_second=0.5)
+
+    assert limiter.acquire("login:ip:1", policy) == 0
+    assert limiter.acquire("login:ip:1", policy) == 0
+    assert limiter.acquire("login:ip:1", policy) == pytest.approx(2.0)
+    # 다른 키는 영향을 받지 않는다
+    assert limiter.acquire("login:ip:2", policy) == 0
+
+    clock.now += 2.0
+    assert limiter.acquire("login:ip:1", policy) == 0
+    assert limiter.stats()["limited_total"] == 1
+
+
+def test_idle_buckets_are_evicted() -> None:
+    clock = _Clock()
+    limiter = InMemoryRateLimiter(shards=1, clock=clock)
+    policy = RateLimitPolicy(capacity=2, refill_per_second=1.0)
+
+    _ = limiter.acquire("a", policy)
+    _ = limiter.acquire("b", policy)
+    clock.now += 5.0
+    _ = limiter.acquire("c", policy)
+
+    stats = limiter.stats()
+    assert stats["buckets"] == 1
+    assert stats["evicted_total"] == 2
+
+
+def test_shard_size_is_bounded() -> None:
+    limiter = InMemoryRateLimiter(shards=1, max_buckets_per_shard=3)
+    policy = RateLimitPolicy(capacity=5, refill_per_second=0.01)
+
+    for index in range(10):
+        _ = limiter.acquire(f"key-{index}", policy)
+
+    assert limiter.stats()["buckets"] == 3
+
+
+def test_shared_limiter_uses_backend_and_falls_back_on_error() -> None:
+    calls: list[tuple[str, int, float]] = []
+
+    def _consume(key: str, capacity: int, rate: float) -> tuple[bool, float]:
+        calls.append((key, capacity, rate))
+        if len(calls) > 1:
+            raise RuntimeError("db down")
+        return False, 0.25
+
+    limiter = SharedRateLimiter(_consume)
+    policy = RateLimitPolicy(capacity=3, refill_per_second=0.5)
+
+    assert limiter.acquire("k", policy) == pytest.approx(1.5)
+    assert limiter.acquire("k", policy) == 0
+    assert calls[0] == ("k", 3, 0.5)
+    assert limiter.stats()["fallback_total"] == 1
+
+
+def test_shared_limiter_logs_backend_errors_at_most_once_per_interval(
+    capsys: Any,
+) -> None:
+    now = [0.0]
+
+    def _consume(key: str, capacity: int, rate: float) -> tuple[bool, float]:
+        raise RuntimeError("db down")
+
+    limiter = SharedRateLimiter(
+        _consume, log_interval_seconds=60.0, clock=lambda: now[0]
+    )
+    policy = RateLimitPolicy(capacity=100, refill_per_second=1.0)
+
+    for _ in range(5):
+        _ = limiter.acquire("k", policy)
+    now[0] = 61.0
+    _ = limiter.acquire("k", policy)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 2
+    assert "(4 more since last log)" in lines[1]
+    assert limiter.stats()["fallback_total"] == 6
+
+
+def test_login_is_limited_with_retry_after(monkeypatch: Any) -> None:
+    monkeypatch.setitem(
+        main.RATE_LIMIT_POLICIES,
+        "auth_login",
+        RateLimitPolicy(capacity=2, refill_per_second=0.1),
+    )
+    monkeypatch.setattr(main, "_rate_limiter", InMemoryRateLimiter())
+    monkeypatch.setattr(main, "get_user_by_email", lambda email: None)
+    client = TestClient(main.app)
+    payload = {"email": "user@example.com", "password": "wrong-password"}
+
+    statuses = [
+        client.post("/api/auth/login", json=payload).status_code for _ in range(2)
+    ]
+    limited = client.post("/api/auth/login", json=payload)
+
+    assert statuses == [401, 401]
+    assert limited.status_code == 429
+    assert limited.headers["retry-after"] == "10"
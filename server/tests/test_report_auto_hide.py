@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import main
+
+PROJECT_ID = "00000000-0000-0000-0000-000000000001"
+COMMENT_ID = "00000000-0000-0000-0000-000000000002"
+MISSING_COMMENT_ID = "00000000-0000-0000-0000-000000000003"
+
+
+def _user(user_id: str) -> main.UserContext:
+    return {
+        "id": user_id,
+        "email": f"{user_id}@example.com",
+        "nickname": user_id,
+        "role": "user",
+        "status": "active",
+        "avatar_url": None,
+        "bio": None,
+    }
+
+
+@pytest.fixture
+def report_store(monkeypatch: Any) -> dict[str, Any]:
+    store: dict[str, Any] = {
+        "reporters": {},
+        "status": {
+            ("project", PROJECT_ID): "published",
+            ("comment", COMMENT_ID): "visible",
+        },
+        "thresholds": [],
+        "logs": [],
+        "cache_changes": [],
+    }
+
+    def _create_report(
+        target_type: str,
+        target_id: str,
+        reason: str,
+        reporter_id: str,
+        memo: str | None = None,
+        auto_hide_threshold: int | None = None,
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None] | None:
+        key = (target_type, target_id)
+        if key not in store["status"]:
+            return None
+        reporters = store["reporters"].setdefault(key, set())
+        if reporter_id in reporters:
+            return None, None
+        reporters.add(reporter_id)
+        store["thresholds"].append(auto_hide_threshold)
+        hidden = None
+        if (
+            auto_hide_threshold
+            and len(reporters) >= auto_hide_threshold
+            and store["status"][key] in {"published", "visible"}
+        ):
+            store["status"][key] = "hidden"
+            hidden = {"id": target_id, "status": "hidden"}
+        report = {
+            "id": f"report-{len(reporters)}",
+            "target_type": target_type,
+            "target_id": target_id,
+            "reporter_id": reporter_id,
+            "reason": reason,
+            "memo": memo,
+            "status": "open",
+        }
+        return report, hidden
+
+    monkeypatch.setattr(main, "create_report", _create_report)
+    monkeypatch.setattr(
+        main,
+        "get_effective_moderation_settings",
+        lambda: {"auto_hide_report_threshold": 2, "admin_log_mask_reasons": False},
+    )
+    monkeypatch.setattr(
+        main,
+        "write_admin_action_log",
+        lambda **kwargs: store["logs"].append(kwargs),
+    )
+    monkeypatch.setattr(
+        main,
+        "_apply_project_cache_change",
+        lambda row: store["cache_changes"].append(row),
+    )
+    main._rate_limiter.reset()
+    yield store
+    main.app.dependency_overrides.clear()
+
+
+def _report_as(client: TestClient, user_id: str, comment_id: str = COMMENT_ID):
+    main.app.dependency_overrides[main.get_current_user] = lambda: _user(user_id)
+    return client.post(
+        f"/api/comments/{comment_id}/report",
+        json={"target_type": "comment", "target_id": comment_id, "reason": "스팸"},
+    )
+
+
+def test_comment_is_hidden_once_distinct_reporters_reach_threshold(
+    report_store: dict[str, Any],
+) -> None:
+    client = TestClient(main.app)
+
+    first = _report_as(client, "user-1")
+    repeated = _report_as(client, "user-1")
+    second = _report_as(client, "user-2")
+    third = _report_as(client, "user-3")
+
+    assert first.json()["target_auto_hidden"] is False
+    assert repeated.status_code == 409
+    assert second.json()["target_auto_hidden"] is True
+    assert third.json()["target_auto_hidden"] is False
+    assert report_store["thresholds"] == [2, 2, 2]
+    assert [log["action_type"] for log in report_store["logs"]] == [
+        "comment_auto_hidden"
+    ]
+    assert report_store["logs"][0]["admin_id"] == main.SYSTEM_ADMIN_USER_ID
+    assert report_store["cache_changes"] == []
+
+
+def test_report_requires_login(report_store: dict[str, Any]) -> None:
+    response = TestClient(main.app).post(
+        f"/api/comments/{COMMENT_ID}/report",
+        json={"target_type": "comment", "target_id": COMMENT_ID, "reason": "스팸"},
+    )
+
+    assert response.status_code == 401
+    assert report_store["thresholds"] == []
+
+
+@pytest.mark.parametrize("comment_id", [MISSING_COMMENT_ID, "not-a-uuid"])
+def test_report_for_missing_comment_returns_404(
+    report_store: dict[str, Any], comment_id: str
+) -> None:
+    response = _report_as(TestClient(main.app), "user-1", comment_id)
+
+    assert response.status_code == 404
+    assert report_store["thresholds"] == []
+
+
+def _report_project_as(client: TestClient, user_id: str):
+    main.app.dependency_overrides[main.get_current_user] = lambda: _user(user_id)
+    return client.post(
+        f"/api/projects/{PROJECT_ID}/report",
+        json={"target_type": "project", "target_id": PROJECT_ID, "reason": "스팸"},
+    )
+
+
+def test_hidden_project_is_removed_from_project_cache(
+    report_store: dict[str, Any],
+) -> None:
+    client = TestClient(main.app)
+
+    _ = _report_project_as(client, "user-1")
+    created = _report_project_as(client, "user-2").json()
+
+    assert created["target_type"] == "project"
+    assert created["target_auto_hidden"] is True
+    assert report_store["status"][("project", PROJECT_ID)] == "hidden"
+    assert report_store["cache_changes"] == [{"id": PROJECT_ID, "status": "hidden"}]
+    assert report_store["logs"][0]["target_id"] == PROJECT_ID
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import db
+import migrations
+from conftest import TEST_DATABASE_URL
+
+pytestmark = [
+    pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set"),
+    pytest.mark.usefixtures("pg_database"),
+]
+
+USER_A = "00000000-0000-0000-0000-00000000000a"
+USER_B = "00000000-0000-0000-0000-00000000000b"
+
+
+def _fetch(query: str, params: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+    with db.get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(query, params)
+            rows = cur.fetchall() if cur.description else []
+        conn.commit()
+    return rows
+
+
+def _seed_comment() -> str:
+    rows = _fetch(
+        """
+        WITH users_added AS (
+            INSERT INTO users (id, nickname)
+            VALUES (%s, 'reporter-a'), (%s, 'reporter-b')
+        ),
+        project AS (
+            INSERT INTO projects (title, summary, author_id)
+            VALUES ('p', 's', %s)
+            RETURNING id
+        )
+        INSERT INTO comments (project_id, author_id, content)
+        SELECT id, %s, 'c' FROM project
+        RETURNING id
+        """,
+        (USER_A, USER_B, USER_A, USER_A),
+    )
+    return str(rows[0][0])
+
+
+def test_existing_duplicate_reports_are_kept_and_counted_once() -> None:
+    _ = migrations.run_migrations(migrations.MIGRATIONS[:5])
+    comment_id = _seed_comment()
+    # 유일성이 없던 시절의 중복 신고와 익명 신고
+    for reporter_id in (USER_A, USER_A, db.LEGACY_ANONYMOUS_REPORTER_ID):
+        _ = _fetch(
+            """
+            INSERT INTO reports (target_type, target_id, reporter_id, reason)
+            VALUES ('comment', %s, %s, 'spam')
+            """,
+            (comment_id, reporter_id),
+        )
+
+    assert migrations.run_migrations() == [6, 7, 8, 9]
+
+    assert _fetch(
+        "SELECT reporter_id::text FROM reports ORDER BY created_at, reporter_id"
+    ) == [(USER_A,), (USER_A,), (db.LEGACY_ANONYMOUS_REPORTER_ID,)]
+    assert _fetch("SELECT open_count FROM report_counters") == [(1,)]
+
+    assert db.create_report("comment", comment_id, "spam", USER_A) == (None, None)
+    created = db.create_report(
+        "comment", comment_id, "spam", USER_B, auto_hide_threshold=2
+    )
+    assert created is not None
+    report, hidden = created
+    assert report is not None and hidden is not None
+    assert _fetch("SELECT open_count FROM report_counters") == [(2,)]
+    assert db.create_report("comment", comment_id, "spam", USER_B) == (None, None)
+
+    # 예전 중복 신고 하나를 처리해도 같은 신고자의 다른 신고가 남아 있으면 수는 그대로다
+    duplicate_id = _fetch(
+        "SELECT id FROM reports WHERE reporter_id = %s LIMIT 1", (USER_A,)
+    )[0][0]
+    _ = db.update_report(str(duplicate_id), "resolved")
+    assert _fetch("SELECT open_count FROM report_counters") == [(2,)]
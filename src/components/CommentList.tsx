@@ -1,37 +1,89 @@
 import { Card, CardContent } from "@/components/ui/card"
-import type { Comment } from "@/lib/api"
+import type { Comment, CommentThread } from "@/lib/api"
 
 type CommentListProps = {
-  comments: Comment[]
+  comments: CommentThread[]
   onReport?: (commentId: string) => void
+  onLoadMoreReplies?: (commentId: string) => void
+  onLoadMore?: () => void
+  hasMore?: boolean
+  isLoadingMore?: boolean
   formatDate: (dateStr: string) => string
 }
 
-export function CommentList({ comments, onReport, formatDate }: CommentListProps) {
+type CommentBodyProps = {
+  comment: Comment
+  onReport?: (commentId: string) => void
+  formatDate: (dateStr: string) => string
+}
+
+function CommentBody({ comment, onReport, formatDate }: CommentBodyProps) {
+  return (
+    <>
+      <div className="flex items-start justify-between mb-2">
+        <div>
+          <strong className="text-[#F4F7FF]">{comment.author_nickname}</strong>
+          <span className="text-[#B8C3E6] text-sm ml-2">{formatDate(comment.created_at)}</span>
+        </div>
+        <button
+          className="text-[#B8C3E6] hover:text-[#FF6B6B] text-sm duration-100"
+          onClick={() => onReport?.(comment.id)}
+        >
+          신고
+        </button>
+      </div>
+      <p className="text-[#F4F7FF]">{comment.content}</p>
+      <button className="text-[#B8C3E6] text-sm mt-2 hover:text-[#23D5AB] duration-100">
+        ❤️ {comment.like_count}
+      </button>
+    </>
+  )
+}
+
+export function CommentList({
+  comments,
+  onReport,
+  onLoadMoreReplies,
+  onLoadMore,
+  hasMore = false,
+  isLoadingMore = false,
+  formatDate,
+}: CommentListProps) {
   return (
     <div className="space-y-4">
       {comments.map((comment) => (
         <Card key={comment.id} className="bg-[#161F42] border-0">
           <CardContent className="p-4">
-            <div className="flex items-start justify-between mb-2">
-              <div>
-                <strong className="text-[#F4F7FF]">{comment.author_nickname}</strong>
-                <span className="text-[#B8C3E6] text-sm ml-2">{formatDate(comment.created_at)}</span>
+            <CommentBody comment={comment} onReport={onReport} formatDate={formatDate} />
+            {(comment.replies ?? []).length > 0 && (
+              <div className="mt-3 space-y-3 border-l border-[#111936] pl-4">
+                {comment.replies.map((reply) => (
+                  <div key={reply.id}>
+                    <CommentBody comment={reply} onReport={onReport} formatDate={formatDate} />
+                  </div>
+                ))}
               </div>
+            )}
+            {comment.has_more_replies && (
               <button
-                className="text-[#B8C3E6] hover:text-[#FF6B6B] text-sm duration-100"
-                onClick={() => onReport?.(comment.id)}
+                className="text-[#B8C3E6] text-sm mt-3 hover:text-[#23D5AB] duration-100"
+                onClick={() => onLoadMoreReplies?.(comment.id)}
               >
-                신고
+                답글 {comment.reply_count - (comment.replies ?? []).length}개 더 보기
               </button>
-            </div>
-            <p className="text-[#F4F7FF]">{comment.content}</p>
-            <button className="text-[#B8C3E6] text-sm mt-2 hover:text-[#23D5AB] duration-100">
-              ❤️ {comment.like_count}
-            </button>
+            )}
           </CardContent>
         </Card>
       ))}
+      {hasMore && (
+        <button
+          className="w-full py-2 text-[#B8C3E6] text-sm hover:text-[#23D5AB] duration-100 disabled:opacity-50"
+          onClick={() => onLoadMore?.()}
+          disabled={isLoadingMore}
+        >
+          {isLoadingMore ? "불러오는 중..." : "댓글 더 보기"}
+        </button>
+      )}
     </div>
   )
 }
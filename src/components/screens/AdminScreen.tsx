@@ -368,7 +368,7 @@ export function AdminScreen({ onNavigate }: ScreenProps) {
       setLoadingReports(true)
     }
 
-    const applyReports = (data: { items: Array<{ id: string; target_type: string; target_id: string; reason: string; status: string; reporter_id?: string; created_at: string }>; total?: number }) => {
+    const applyReports = (data: { items: Array<{ id: string; target_type: string; target_id: string; reason: string; status: string; reporter_id?: string | null; created_at: string }>; total?: number }) => {
       const items = Array.isArray(data.items) ? data.items : []
       const mapped: AdminReportRow[] = items.map((item) => ({
         id: item.id,
@@ -9,7 +9,7 @@ import { CommentComposer } from "@/components/CommentComposer"
 import { CommentList } from "@/components/CommentList"
 import { ReportModal } from "@/components/ReportModal"
 import { Toast } from "@/components/Toast"
-import { api, type Project, type Comment } from "@/lib/api"
+import { api, type Project, type Comment, type CommentThread } from "@/lib/api"
 import { useAuth } from "@/lib/use-auth"
 type Screen = 'home' | 'detail' | 'submit' | 'profile' | 'admin' | 'login' | 'register' | 'explore' | 'challenges' | 'about'
 
@@ -51,9 +51,19 @@ const sampleProject: Project = {
   updated_at: "2026-02-25T10:00:00Z",
 }
 
+const toThread = (comment: Comment): CommentThread => ({
+  ...comment,
+  reply_count: 0,
+  replies: [],
+  has_more_replies: false,
+  replies_next_cursor: null,
+})
+
 export function ProjectDetailScreen({ onNavigate, projectId, onEditProject }: ScreenProps) {
   const [project, setProject] = useState<Project | null>(null)
-  const [comments, setComments] = useState<Comment[]>([])
+  const [comments, setComments] = useState<CommentThread[]>([])
+  const [commentsCursor, setCommentsCursor] = useState<string | null>(null)
+  const [isLoadingMoreComments, setIsLoadingMoreComments] = useState(false)
   const [loading, setLoading] = useState(true)
   const [liked, setLiked] = useState(false)
   const [likeCount, setLikeCount] = useState(0)
@@ -80,8 +90,9 @@ export function ProjectDetailScreen({ onNavigate, projectId, onEditProject }: Sc
         setLikeCount(projectData.like_count)
       }
 
-      const applyComments = (commentsData: { items: Comment[] }) => {
+      const applyComments = (commentsData: { items: CommentThread[]; next_cursor: string | null }) => {
         setComments(commentsData.items || [])
+        setCommentsCursor(commentsData.next_cursor ?? null)
       }
 
       try {
@@ -96,11 +107,12 @@ export function ProjectDetailScreen({ onNavigate, projectId, onEditProject }: Sc
         console.error("API failed, using sample data:", error)
         setProject(sampleProject)
         setLikeCount(sampleProject.like_count)
+        setCommentsCursor(null)
         setComments([
           { id: "1", project_id: targetProjectId, author_id: "5", author_nickname: "coder01", content: "정말 amazing해요! 어떻게 만드셨나요?", like_count: 12, status: "visible", created_at: "2026-02-21T10:00:00Z" },
           { id: "2", project_id: targetProjectId, author_id: "6", author_nickname: "musicfan", content: "음악 생성이 이렇게 쉽게 될 줄이야...", like_count: 8, status: "visible", created_at: "2026-02-21T11:00:00Z" },
           { id: "3", project_id: targetProjectId, author_id: "7", author_nickname: "aidev", content: "코드 공개해주실 수 있나요?", like_count: 5, status: "visible", created_at: "2026-02-21T12:00:00Z" },
-        ])
+        ].map(toThread))
       } finally {
         setLoading(false)
       }
@@ -141,7 +153,7 @@ export function ProjectDetailScreen({ onNavigate, projectId, onEditProject }: Sc
       return
     }
 
-    const optimisticComment: Comment = {
+    const optimisticComment: CommentThread = toThread({
       id: `temp-${Date.now()}`,
       project_id: targetProjectId,
       author_id: user.id,
@@ -150,7 +162,7 @@ export function ProjectDetailScreen({ onNavigate, projectId, onEditProject }: Sc
       like_count: 0,
       status: "visible",
       created_at: new Date().toISOString(),
-    }
+    })
 
     setComments((prev) => [optimisticComment, ...prev])
     setCommentText("")
@@ -160,6 +172,7 @@ export function ProjectDetailScreen({ onNavigate, projectId, onEditProject }: Sc
       await api.createComment(targetProjectId, content)
       const commentsData = await api.getComments(targetProjectId, "latest", { force: true })
       setComments(commentsData.items || [])
+      setCommentsCursor(commentsData.next_cursor ?? null)
     } catch (error) {
       console.error("Comment failed:", error)
       setComments((prev) => prev.filter((comment) => comment.id !== optimisticComment.id))
@@ -171,14 +184,64 @@ export function ProjectDetailScreen({ onNavigate, projectId, onEditProject }: Sc
     }
   }
 
+  const handleLoadMoreComments = async () => {
+    if (!commentsCursor || isLoadingMoreComments) return
+    setIsLoadingMoreComments(true)
+    try {
+      const commentsData = await api.getComments(targetProjectId, "latest", undefined, commentsCursor)
+      setComments((prev) => {
+        const seen = new Set(prev.map((comment) => comment.id))
+        return [...prev, ...(commentsData.items || []).filter((comment) => !seen.has(comment.id))]
+      })
+      setCommentsCursor(commentsData.next_cursor ?? null)
+    } catch (error) {
+      console.error("Load comments failed:", error)
+      setToastTone("error")
+      setToastMessage("댓글을 더 불러오지 못했습니다.")
+    } finally {
+      setIsLoadingMoreComments(false)
+    }
+  }
+
+  const handleLoadMoreReplies = async (commentId: string) => {
+    const thread = comments.find((comment) => comment.id === commentId)
+    if (!thread) return
+    try {
+      const repliesData = await api.getCommentReplies(commentId, thread.replies_next_cursor)
+      setComments((prev) =>
+        prev.map((comment) => {
+          if (comment.id !== commentId) return comment
+          // 커서 없이 처음부터 받은 경우에는 이미 보이는 답글을 건너뛴다
+          const seen = new Set(comment.replies.map((reply) => reply.id))
+          const replies = [...comment.replies, ...(repliesData.items || []).filter((reply) => !seen.has(reply.id))]
+          return {
+            ...comment,
+            replies,
+            has_more_replies: repliesData.next_cursor !== null,
+            replies_next_cursor: repliesData.next_cursor,
+          }
+        }),
+      )
+    } catch (error) {
+      console.error("Load replies failed:", error)
+      setToastTone("error")
+      setToastMessage("답글을 더 불러오지 못했습니다.")
+    }
+  }
+
   const handleReportComment = async (commentId: string, reason: string) => {
-    await api.reportComment(commentId, {
-      target_type: "comment",
-      target_id: commentId,
-      reason,
-    })
-    setToastTone("success")
-    setToastMessage("신고가 접수되었습니다.")
+    try {
+      await api.reportComment(commentId, {
+        target_type: "comment",
+        target_id: commentId,
+        reason,
+      })
+      setToastTone("success")
+      setToastMessage("신고가 접수되었습니다.")
+    } catch (error) {
+      setToastTone("error")
+      setToastMessage(error instanceof Error ? error.message : "신고 접수에 실패했습니다.")
+    }
   }
 
   useEffect(() => {
@@ -329,7 +392,7 @@ export function ProjectDetailScreen({ onNavigate, projectId, onEditProject }: Sc
                 ❤️ {likeCount}
               </Button>
               <Button variant="outline" className="border-[#111936] text-[#B8C3E6] hover:bg-[#161F42] hover:text-[#F4F7FF]">
-                💬 {comments.length}
+                💬 {project?.comment_count ?? comments.length}
               </Button>
               <div className="relative">
                 <Button
@@ -477,7 +540,7 @@ export function ProjectDetailScreen({ onNavigate, projectId, onEditProject }: Sc
         {/* Comment Section */}
         <section>
           <h3 className="font-display text-xl font-semibold text-[#F4F7FF] mb-4">
-            댓글 {comments.length}
+            댓글 {project?.comment_count ?? comments.length}
           </h3>
           
           <CommentComposer
@@ -490,7 +553,18 @@ export function ProjectDetailScreen({ onNavigate, projectId, onEditProject }: Sc
 
           <CommentList
             comments={comments}
-            onReport={(commentId) => setReportCommentId(commentId)}
+            onReport={(commentId) => {
+              if (!user) {
+                alert("신고는 로그인 후 이용할 수 있습니다.")
+                onNavigate?.("login")
+                return
+              }
+              setReportCommentId(commentId)
+            }}
+            onLoadMoreReplies={(commentId) => void handleLoadMoreReplies(commentId)}
+            onLoadMore={() => void handleLoadMoreComments()}
+            hasMore={!!commentsCursor}
+            isLoadingMore={isLoadingMoreComments}
             formatDate={formatDate}
           />
         </section>
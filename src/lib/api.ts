@@ -36,6 +36,15 @@ export interface Comment {
   like_count: number
   status: string
   created_at: string
+  parent_id?: string | null
+  depth?: number
+}
+
+export interface CommentThread extends Comment {
+  reply_count: number
+  replies: Comment[]
+  has_more_replies: boolean
+  replies_next_cursor: string | null
 }
 
 export interface Report {
@@ -43,7 +52,7 @@ export interface Report {
   target_type: string
   target_id: string
   reason: string
-  reporter_id: string
+  reporter_id: string | null
   status: string
   created_at: string
   resolved_at?: string
@@ -167,7 +176,8 @@ export interface AdminOAuthHealth extends AdminOAuthSettings {
 type AdminReportsResponse = { items: Report[]; total: number }
 type AdminListResponse<T> = { items: T[] }
 type ProjectsResponse = { items: Project[] }
-type CommentsResponse = { items: Comment[] }
+type CommentsResponse = { items: CommentThread[]; next_cursor: string | null }
+type CommentRepliesResponse = { items: Comment[]; next_cursor: string | null }
 
 async function authFetch(url: string, options: RequestInit = {}) {
   const token = getToken()
@@ -627,13 +637,16 @@ export const api = {
     projectId: string,
     sort: string = "latest",
     options?: SWRFetchOptions<CommentsResponse>,
+    cursor?: string,
   ) => {
-    const key = createPublicCacheKey("comments", { projectId, sort })
+    const key = createPublicCacheKey("comments", { projectId, sort, cursor })
     return fetchWithPublicSWR(
       key,
       PUBLIC_TTL_MS.comments,
       async (signal) => {
-        const res = await fetch(`${API_BASE}/api/projects/${projectId}/comments?sort=${sort}`, { signal })
+        const params = new URLSearchParams({ sort })
+        if (cursor) params.set("cursor", cursor)
+        const res = await fetch(`${API_BASE}/api/projects/${projectId}/comments?${params}`, { signal })
         if (!res.ok) throw new Error("Failed to fetch comments")
         return res.json() as Promise<CommentsResponse>
       },
@@ -641,6 +654,14 @@ export const api = {
     )
   },
 
+  getCommentReplies: async (commentId: string, cursor?: string | null) => {
+    const params = new URLSearchParams()
+    if (cursor) params.set("cursor", cursor)
+    const res = await fetch(`${API_BASE}/api/comments/${commentId}/replies?${params}`)
+    if (!res.ok) throw new Error("Failed to fetch replies")
+    return res.json() as Promise<CommentRepliesResponse>
+  },
+
   createComment: async (projectId: string, content: string) => {
     const res = await authFetch(`${API_BASE}/api/projects/${projectId}/comments`, {
       method: "POST",
@@ -681,6 +702,15 @@ export const api = {
     return res.json() as Promise<Report>
   },
 
+  reportProject: async (projectId: string, data: { target_type: string; target_id: string; reason: string }) => {
+    const res = await authFetch(`${API_BASE}/api/projects/${projectId}/report`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify(data),
+    })
+    return res.json() as Promise<Report>
+  },
+
   // Admin
   getReports: async (
     status?: string,